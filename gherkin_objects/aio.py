@@ -0,0 +1,193 @@
+"""
+An asyncio interface for loading GherkinProjects without blocking the event loop.
+
+File I/O runs in a thread executor.  Parsing runs in the same thread executor by default, or in a process executor
+when one is given, which keeps the parse from competing with the event loop for the GIL.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterator, Deque, List, Optional, Union
+
+from gherkin_objects.cache import ParseCache
+from gherkin_objects.objects import (
+    Feature,
+    FeatureFile,
+    GherkinProject,
+    GherkinProjectConfig,
+    InvalidGherkinError,
+)
+
+
+def _parse_text(text: str, cache: Optional[ParseCache] = None) -> Feature:
+    """Executor entry point: parse a feature without any parent, so that it can be sent back from another process"""
+    if cache is not None:
+        return cache.feature_from_text(text)
+    return Feature.from_text(text)
+
+
+class AsyncGherkinProject:
+    """
+    Wraps a GherkinProject, reading and parsing its files in executors
+    """
+
+    DEFAULT_CONCURRENCY = 32
+
+    def __init__(
+        self,
+        project: GherkinProject,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        thread_executor: Optional[Executor] = None,
+        process_executor: Optional[Executor] = None,
+    ):
+        """
+        :param concurrency: The maximum number of files being read, parsed, or written at once
+        :param thread_executor: Runs file I/O, and parsing if there is no process_executor.
+            Defaults to the event loop's default executor.
+        :param process_executor: Runs parsing
+        """
+        if concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1: {concurrency}')
+        self.project = project
+        self.concurrency = concurrency
+        self.thread_executor = thread_executor
+        self.process_executor = process_executor
+        # Created on first use, so that it belongs to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    async def load(
+        cls,
+        config: Union[GherkinProjectConfig, List[str]],
+        lazy: bool = False,
+        cache: Optional[ParseCache] = None,
+        **kwargs,
+    ) -> AsyncGherkinProject:
+        """
+        Create a project from a config or a list of paths, and unless lazy, read and parse all of its files.
+        Files which are not valid Gherkin are collected in `project.errors`, as in a parallel load.
+        """
+        thread_executor = kwargs.get('thread_executor')
+        loop = asyncio.get_running_loop()
+        if isinstance(config, GherkinProjectConfig):
+            paths = await loop.run_in_executor(thread_executor, lambda: config.paths)
+        else:
+            paths = list(config)
+
+        project = GherkinProject(paths=paths, lazy=True, cache=cache)
+        if isinstance(config, GherkinProjectConfig):
+            project.config = config
+        async_project = cls(project, **kwargs)
+        if not lazy:
+            await async_project.load_all()
+        project.lazy = lazy
+        return async_project
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def run_in_thread(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.thread_executor, partial(function, *args))
+
+    async def parse(self, feature_file: FeatureFile, text: str, intern: bool = True) -> Feature:
+        """
+        Parse text into a new feature belonging to the file, in the process executor if there is one
+        :param intern: See FeatureFile.adopt
+        """
+        executor = self.process_executor or self.thread_executor
+        feature = await asyncio.get_running_loop().run_in_executor(
+            executor, partial(_parse_text, text, cache=feature_file.cache))
+        return feature_file.adopt(feature, intern=intern)
+
+    async def load_feature_file(self, feature_file: FeatureFile) -> Feature:
+        """Read and parse a file, keeping the result on the FeatureFile"""
+        async with self.semaphore:
+            text, signature = await self.run_in_thread(feature_file.read_with_signature)
+            feature = await self.parse(feature_file, text)
+        feature_file.assign(text, feature, signature=signature)
+        return feature
+
+    async def load_all(self):
+        """Load every file which is not loaded yet.  Files which are not valid Gherkin are moved to `errors`."""
+        feature_files = [f for f in self.project.feature_files if not f.is_loaded]
+        results = await asyncio.gather(
+            *[self.load_feature_file(f) for f in feature_files],
+            return_exceptions=True)
+
+        invalid = set()
+        for feature_file, result in zip(feature_files, results):
+            if isinstance(result, InvalidGherkinError):
+                self.project.record_error(feature_file.path, result)
+                invalid.add(id(feature_file))
+            elif isinstance(result, BaseException):
+                raise result
+        if invalid:
+            self.project.feature_files = [
+                f for f in self.project.feature_files if id(f) not in invalid
+            ]
+
+    async def aiter_features(self) -> AsyncIterator[Feature]:
+        """
+        Yield the feature of each file in order, reading and parsing up to `concurrency` files ahead.
+        Like GherkinProject.iter_features, features which were not already loaded are not kept.
+        """
+        feature_files = iter(self.project.feature_files)
+        pending: Deque[asyncio.Future] = deque()
+
+        def schedule():
+            while len(pending) < self.concurrency:
+                feature_file = next(feature_files, None)
+                if feature_file is None:
+                    return
+                pending.append(asyncio.ensure_future(self._transient_feature(feature_file)))
+
+        try:
+            schedule()
+            while pending:
+                feature = await pending.popleft()
+                schedule()
+                yield feature
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _transient_feature(self, feature_file: FeatureFile) -> Feature:
+        if feature_file.is_loaded:
+            return feature_file.feature
+        text = await self.run_in_thread(feature_file.read)
+        return await self.parse(feature_file, text, intern=False)
+
+    async def overwrite(self, feature_file: FeatureFile, text: str):
+        """FeatureFile.overwrite, without blocking the event loop"""
+        async with self.semaphore:
+            await self.run_in_thread(self._write, feature_file.path, text)
+            text, signature = await self.run_in_thread(feature_file.read_with_signature)
+            feature = await self.parse(feature_file, text)
+        feature_file.assign(text, feature, signature=signature)
+
+    @staticmethod
+    def _write(path: str, text: str):
+        with open(path, 'w') as file:
+            file.write(text)
@@ -0,0 +1,297 @@
+"""
+On-disk caches which let repeated runs skip work whose inputs have not changed.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+
+from functools import lru_cache
+from importlib import metadata
+from typing import Dict, List, Optional, Tuple
+
+from gherkin_objects.objects import Feature, FeatureFile, GherkinProjectConfig
+from gherkin_objects.paths import GlobPattern, PathResolver
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__package__)
+
+CACHE_DIR_ENV_VAR = 'GHERKIN_OBJECTS_CACHE_DIR'
+
+
+def default_cache_dir() -> str:
+    """$GHERKIN_OBJECTS_CACHE_DIR if set, otherwise gherkin-objects/ in the user's cache directory"""
+    if os.environ.get(CACHE_DIR_ENV_VAR):
+        return os.environ[CACHE_DIR_ENV_VAR]
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'gherkin-objects')
+
+
+@lru_cache(maxsize=None)
+def _package_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def _write_atomically(path: str, data: bytes):
+    """Write to a temporary file and rename it into place, so readers never see a partial file"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ParseCache:
+    """
+    A content-addressed cache of parsed Features, which can be shared by several processes
+
+    Each entry is a pickled Feature in its own file, named by a hash of the text it was parsed from and the versions
+    of gherkin-objects and gherkin-official.  Entries are written to a temporary file and renamed into place, so
+    readers never see a partial entry.  Reading an entry touches its mtime, and the least recently used entries are
+    evicted once the cache grows past `max_bytes`.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    # Evict down to this fraction of max_bytes, so eviction does not run again on the very next write
+    EVICTION_TARGET = 0.9
+
+    def __init__(self,
+                 directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = os.path.join(directory or default_cache_dir(), 'features')
+        self.max_bytes = max_bytes
+        self._salt = '\n'.join([
+            _package_version('gherkin-objects'),
+            _package_version('gherkin-official'),
+            '',
+        ]).encode('utf-8')
+        # Running estimate of the size of the cache, so writes do not need to scan the directory
+        self._size: Optional[int] = None
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(self._salt + text.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f'{key}.pickle')
+
+    def get(self, text: str) -> Optional[Feature]:
+        """Return a new copy of the Feature parsed from text, or None if it is not cached"""
+        path = self._entry_path(self.key(text))
+        try:
+            with open(path, 'rb') as file:
+                feature = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            logger.warning(f'Discarding unreadable cache entry {path}: {e}')
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted by another process since it was read
+            pass
+        return feature
+
+    def put(self, text: str, feature: Feature):
+        path = self._entry_path(self.key(text))
+
+        # Never pickle the FeatureFile and project above the feature
+        parent, feature.parent = feature.parent, None
+        try:
+            data = pickle.dumps(feature, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            feature.parent = parent
+
+        try:
+            _write_atomically(path, data)
+        except OSError as e:
+            # The cache is only an optimization, so a full or read-only disk must not stop the parse
+            logger.warning(f'Failed to write parse cache entry {path}: {e}')
+            return
+
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def feature_from_text(self, text: str, parent: Optional[FeatureFile] = None) -> Feature:
+        """Feature.from_text, skipping the parse when the text has been parsed before"""
+        feature = self.get(text)
+        if feature is None:
+            feature = Feature.from_text(text)
+            self.put(text, feature)
+        feature.parent = parent
+        return feature
+
+    def evict(self):
+        """Remove the least recently used entries until the cache is back under max_bytes"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, '.lock'), 'w') as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    # Another process is already evicting
+                    return
+
+            entries = sorted(self._entries())
+            size = sum(entry_size for _, _, entry_size in entries)
+            target = self.max_bytes * self.EVICTION_TARGET
+            for _, path, entry_size in entries:
+                if size <= target:
+                    break
+                self._remove(path)
+                size -= entry_size
+            self._size = size
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._size = 0
+
+    def _entries(self) -> List[Tuple[int, str, int]]:
+        """(mtime, path, size) of every entry in the cache"""
+        entries = []
+        try:
+            shards = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            try:
+                shard_entries = list(os.scandir(shard.path))
+            except FileNotFoundError:
+                continue
+            for entry in shard_entries:
+                if not entry.name.endswith('.pickle'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+        return entries
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class PathCache:
+    """
+    A cache of the paths a GherkinProjectConfig resolves to
+
+    Entries are keyed by the config's patterns and the working directory they are relative to.  Each entry records
+    the mtime of every directory the resolution listed, along with the pattern paths and glob roots it started from.
+    Adding, removing, or renaming a file changes the mtime of its directory, so the entry is used as long as none of
+    those have changed, and the patterns are resolved again otherwise.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.join(directory or default_cache_dir(), 'paths')
+
+    @staticmethod
+    def key(include: List[str], exclude: List[str]) -> str:
+        data = json.dumps([_package_version('gherkin-objects'), os.getcwd(), include, exclude])
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    @staticmethod
+    def _signature(path: str) -> Optional[List[int]]:
+        try:
+            stat = os.stat(path or os.curdir)
+        except (OSError, ValueError):
+            return None
+        return [stat.st_mode, stat.st_mtime_ns, stat.st_ino]
+
+    @classmethod
+    def _fingerprint(cls, include: List[str], exclude: List[str], directories: List[str]) -> Dict[str, list]:
+        """The signature of every path whose change could change the resolved paths"""
+        paths = set(include) | set(exclude) | set(directories)
+        paths.update(GlobPattern(pattern).root for pattern in include + exclude)
+        return {path: cls._signature(path) for path in sorted(paths)}
+
+    def paths(self, config: GherkinProjectConfig) -> List[str]:
+        """config.paths, reusing the previous result if it is still valid"""
+        include, exclude = config.resolved_patterns()
+        entry_path = self._entry_path(self.key(include, exclude))
+        entry = self._read(entry_path)
+        if entry is not None:
+            fingerprint = entry['fingerprint']
+            if all(self._signature(path) == signature for path, signature in fingerprint.items()):
+                return list(entry['paths'])
+
+        resolver = PathResolver(include, exclude)
+        paths = resolver.resolve()
+        entry = {
+            'fingerprint': self._fingerprint(include, exclude, resolver.visited_directories),
+            'paths': paths,
+        }
+        try:
+            _write_atomically(entry_path, json.dumps(entry).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f'Failed to write path cache entry {entry_path}: {e}')
+        return paths
+
+    @staticmethod
+    def _read(path: str) -> Optional[dict]:
+        try:
+            with open(path, 'rb') as file:
+                entry = json.loads(file.read().decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Discarding unreadable cache entry {path}: {e}')
+            return None
+        if not isinstance(entry, dict) or 'fingerprint' not in entry or 'paths' not in entry:
+            return None
+        return entry
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,561 @@
+"""
+A catalog of the distinct steps in a GherkinProject, and where each one is used.
+
+Steps are keyed by their canonical text: the real keyword (Given, When or Then, never And or But) followed by the
+step text, so "And I log in" after a Given is the same step as "Given I log in".
+
+The StepCompletionIndex answers prefix queries over the same steps, for editors which suggest existing steps as
+they are typed.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from gherkin_objects.objects import Feature, FeatureFile, GherkinProject, Scenario, Step, StepType
+
+
+class StepOccurrence(NamedTuple):
+    """One use of a step"""
+    step: Step
+    scenario: Scenario
+    feature: Feature
+
+    @property
+    def path(self) -> Optional[str]:
+        """The path of the file the step is in, if the feature belongs to one"""
+        return self.feature.parent.path if self.feature.parent is not None else None
+
+
+class StepCatalogEntry:
+    """A canonical step text, and every occurrence of it"""
+
+    __slots__ = ('text', 'step_type', '_occurrences')
+
+    def __init__(self, text: str, step_type: StepType):
+        self.text = text
+        self.step_type = step_type
+        self._occurrences: Dict[int, StepOccurrence] = {}
+
+    def __repr__(self):
+        return f'StepCatalogEntry({self.text!r}, count={self.count})'
+
+    @property
+    def occurrences(self) -> List[StepOccurrence]:
+        return list(self._occurrences.values())
+
+    @property
+    def count(self) -> int:
+        return len(self._occurrences)
+
+    @property
+    def features(self) -> List[Feature]:
+        """The features which use the step, each listed once"""
+        return list({id(occurrence.feature): occurrence.feature for occurrence in self._occurrences.values()}.values())
+
+
+class StepCatalog:
+    """
+    The distinct steps of a project, by canonical text, with their occurrences.
+
+    Like the ProjectIndex, the catalog is built in one pass over every feature on the first lookup.  After that, it
+    is updated when a file is refreshed, and when a feature or scenario is changed through add_scenario or
+    add_step.  Changes made by editing the lists of scenarios or steps directly need a call to update_feature.
+
+    A decomposed catalog holds the steps of the decomposed scenarios instead, with the example values substituted
+    and the background steps repeated in each scenario.
+    """
+
+    def __init__(self, project: GherkinProject, decomposed: bool = False):
+        self._project = project
+        self.decomposed = decomposed
+        self._built = False
+        self._entries: Dict[str, StepCatalogEntry] = {}
+        # The keys each cataloged feature added, so it can be removed again: id(feature) -> (feature, keys)
+        self._features: Dict[int, Tuple[Feature, List[Tuple[str, int]]]] = {}
+
+    def _build(self):
+        self._built = True
+        for feature_file in self._project.feature_files:
+            self.add_feature(feature_file.feature)
+
+    def _ensure_built(self):
+        if not self._built:
+            self._build()
+
+    def invalidate(self):
+        """Forget everything, so the catalog is built again on the next lookup"""
+        self._built = False
+        self._entries = {}
+        self._features = {}
+
+    def __len__(self) -> int:
+        self._ensure_built()
+        return len(self._entries)
+
+    def __contains__(self, text: str) -> bool:
+        self._ensure_built()
+        return text in self._entries
+
+    def __iter__(self) -> Iterator[StepCatalogEntry]:
+        self._ensure_built()
+        return iter(list(self._entries.values()))
+
+    def __getitem__(self, text: str) -> StepCatalogEntry:
+        self._ensure_built()
+        return self._entries[text]
+
+    def get(self, text: str) -> Optional[StepCatalogEntry]:
+        self._ensure_built()
+        return self._entries.get(text)
+
+    @property
+    def texts(self) -> List[str]:
+        """Every canonical step text, in the order the steps were cataloged"""
+        self._ensure_built()
+        return list(self._entries)
+
+    def occurrences(self, text: str) -> List[StepOccurrence]:
+        entry = self.get(text)
+        return entry.occurrences if entry is not None else []
+
+    def count(self, text: str) -> int:
+        entry = self.get(text)
+        return entry.count if entry is not None else 0
+
+    def with_step_type(self, step_type: StepType) -> List[StepCatalogEntry]:
+        self._ensure_built()
+        return [entry for entry in self._entries.values() if entry.step_type == step_type]
+
+    def most_common(self, n: Optional[int] = None) -> List[StepCatalogEntry]:
+        """The n most used steps, or all of them, most used first"""
+        self._ensure_built()
+        entries = sorted(self._entries.values(), key=lambda entry: entry.count, reverse=True)
+        return entries if n is None else entries[:n]
+
+    def _scenarios_of(self, feature: Feature) -> Iterable[Scenario]:
+        return feature.iter_decomposed_scenarios() if self.decomposed else feature.scenarios
+
+    def add_feature(self, feature: Optional[Feature]):
+        if not self._built or feature is None:
+            return
+        if id(feature) in self._features:
+            self.remove_feature(feature)
+        keys: List[Tuple[str, int]] = []
+        for scenario in self._scenarios_of(feature):
+            for step in scenario.steps:
+                text = step.real_text
+                entry = self._entries.get(text)
+                if entry is None:
+                    entry = self._entries[text] = StepCatalogEntry(text, step.step_type)
+                entry._occurrences[id(step)] = StepOccurrence(step, scenario, feature)
+                keys.append((text, id(step)))
+        self._features[id(feature)] = (feature, keys)
+
+    def add_feature_file(self, feature_file: FeatureFile):
+        if self._built:
+            self.add_feature(feature_file.feature)
+
+    def remove_feature(self, feature: Optional[Feature]):
+        if feature is None:
+            return
+        entry = self._features.pop(id(feature), None)
+        if entry is None:
+            return
+        for text, step_id in entry[1]:
+            catalog_entry = self._entries.get(text)
+            if catalog_entry is None:
+                continue
+            catalog_entry._occurrences.pop(step_id, None)
+            if not catalog_entry._occurrences:
+                del self._entries[text]
+
+    def update_feature(self, feature: Optional[Feature]):
+        """Catalog a feature again, after its scenarios or steps changed"""
+        if feature is not None and id(feature) in self._features:
+            self.add_feature(feature)
+
+    def replace_feature(self, old: Optional[Feature], new: Optional[Feature]):
+        if old is not new:
+            self.remove_feature(old)
+        self.add_feature(new)
+
+
+class StepCompletion(NamedTuple):
+    """A suggested step, and how many times the project uses it"""
+    text: str
+    step_type: StepType
+    count: int
+
+    @property
+    def real_text(self) -> str:
+        return f'{self.step_type.keyword} {self.text}'
+
+
+def _prefix_end(prefix: str) -> Optional[str]:
+    """The smallest string greater than every string that starts with prefix, or None if there is none"""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+class _CompletionBlock:
+    """Consecutive texts of a _CompletionTable, sorted by text and by usage"""
+
+    __slots__ = ('texts', 'by_count')
+
+    def __init__(self, texts: List[str], counts: Dict[str, int]):
+        self.texts = texts
+        # (-count, text), so the most used texts come first, and ties are in text order
+        self.by_count = sorted((-counts[text], text) for text in texts)
+
+
+# Greater than the (-count, text), block index of any block in a _CompletionTable's tree
+_NO_HEAD = ((1, ''), -1)
+
+# The kinds of entries in the heap of a query: a run of whole blocks, a position in the usage list of one block,
+# and a position in the ranked texts of the blocks which are only partly covered by the prefix
+_RUN, _BLOCK, _PARTIAL = range(3)
+
+
+class _CompletionTable:
+    """
+    The step texts of one step type, sorted by text and split into blocks of consecutive texts.  Each block also
+    keeps its texts sorted by usage, and a tree over the blocks finds the block with the most used text in any run
+    of blocks.
+
+    A query finds the blocks its prefix covers by bisection.  The texts of the blocks at either end, which the prefix
+    may only partly cover, are ranked directly.  The blocks in between are merged by usage, taking each next block
+    from the tree, so only as many of them are looked at as there are results.
+    """
+
+    __slots__ = ('block_size', 'counts', 'blocks', 'firsts', '_leaves', '_tree')
+
+    def __init__(self, block_size: int):
+        # Smaller blocks would be emptied by a split or merge
+        if block_size < 4:
+            raise ValueError(f'Completion block size must be at least 4: {block_size}')
+        self.block_size = block_size
+        self.counts: Dict[str, int] = {}
+        self.blocks: List[_CompletionBlock] = []
+        # The first text of each block
+        self.firsts: List[str] = []
+        self._leaves = 1
+        self._tree: List[Tuple[Tuple[int, str], int]] = [_NO_HEAD, _NO_HEAD]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def load(self, counts: Dict[str, int]):
+        """Replace the contents, sorting once rather than inserting each text"""
+        self.counts = {text: count for text, count in counts.items() if count > 0}
+        texts = sorted(self.counts)
+        self.blocks = [
+            _CompletionBlock(texts[start:start + self.block_size], self.counts)
+            for start in range(0, len(texts), self.block_size)
+        ]
+        self._rebuild()
+
+    def _rebuild(self):
+        """Index the blocks again, after blocks were added or removed"""
+        self.firsts = [block.texts[0] for block in self.blocks]
+        leaves = 1
+        while leaves < len(self.blocks):
+            leaves *= 2
+        tree = [_NO_HEAD] * (2 * leaves)
+        for index, block in enumerate(self.blocks):
+            tree[leaves + index] = (block.by_count[0], index)
+        for node in range(leaves - 1, 0, -1):
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+        self._leaves, self._tree = leaves, tree
+
+    def _update(self, index: int):
+        """Index a block again, after its texts or their counts changed"""
+        block = self.blocks[index]
+        self.firsts[index] = block.texts[0]
+        tree = self._tree
+        node = self._leaves + index
+        tree[node] = (block.by_count[0], index)
+        while node > 1:
+            node //= 2
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+
+    def _best(self, start: int, end: int) -> Tuple[Tuple[int, str], int]:
+        """The most used text in the blocks from start to end, and the index of its block"""
+        tree = self._tree
+        best = _NO_HEAD
+        start += self._leaves
+        end += self._leaves
+        while start < end:
+            if start & 1:
+                best = min(best, tree[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                best = min(best, tree[end])
+            start //= 2
+            end //= 2
+        return best
+
+    def _block_index(self, text: str) -> int:
+        """The index of the block which holds text, or would"""
+        return max(bisect_right(self.firsts, text) - 1, 0)
+
+    def add(self, text: str, count: int):
+        old_count = self.counts.get(text, 0)
+        new_count = old_count + count
+        if not old_count and new_count <= 0:
+            return
+        if not self.blocks:
+            self.counts[text] = new_count
+            self.blocks = [_CompletionBlock([text], self.counts)]
+            self._rebuild()
+            return
+
+        index = self._block_index(text)
+        block = self.blocks[index]
+        if old_count:
+            del block.by_count[bisect_left(block.by_count, (-old_count, text))]
+        if new_count > 0:
+            self.counts[text] = new_count
+            insort(block.by_count, (-new_count, text))
+            if not old_count:
+                insort(block.texts, text)
+                if len(block.texts) > 2 * self.block_size:
+                    self._split(index)
+                    return
+        else:
+            del self.counts[text]
+            del block.texts[bisect_left(block.texts, text)]
+            if len(block.texts) < self.block_size // 4:
+                self._merge(index)
+                return
+        self._update(index)
+
+    def _split(self, index: int):
+        texts = self.blocks[index].texts
+        half = len(texts) // 2
+        self.blocks[index:index + 1] = [
+            _CompletionBlock(texts[:half], self.counts),
+            _CompletionBlock(texts[half:], self.counts),
+        ]
+        self._rebuild()
+
+    def _merge(self, index: int):
+        """Merge a block which became small into a neighbour, or remove it if it is empty and has none"""
+        if len(self.blocks) == 1:
+            if not self.blocks[0].texts:
+                self.blocks = []
+                self._rebuild()
+            else:
+                self._update(0)
+            return
+        start = index if index + 1 < len(self.blocks) else index - 1
+        texts = self.blocks[start].texts + self.blocks[start + 1].texts
+        self.blocks[start:start + 2] = [_CompletionBlock(texts, self.counts)]
+        if len(texts) > 2 * self.block_size:
+            self._split(start)
+        else:
+            self._rebuild()
+
+    def complete(self, prefix: str, limit: int) -> List[Tuple[int, str]]:
+        if not self.blocks:
+            return []
+        end_text = _prefix_end(prefix)
+        start = self._block_index(prefix)
+        end = len(self.blocks) if end_text is None else bisect_left(self.firsts, end_text)
+
+        # The blocks at either end may hold texts without the prefix
+        partial_blocks = []
+        if start < end and self.blocks[start].texts[0] < prefix:
+            partial_blocks.append(self.blocks[start])
+            start += 1
+        if start < end and end_text is not None and self.blocks[end - 1].texts[-1] >= end_text:
+            partial_blocks.append(self.blocks[end - 1])
+            end -= 1
+        counts = self.counts
+        partial = heapq.nsmallest(limit, (
+            (-counts[text], text)
+            for block in partial_blocks
+            for text in block.texts[bisect_left(block.texts, prefix):
+                                    len(block.texts) if end_text is None else bisect_left(block.texts, end_text)]
+        ))
+
+        heap = []
+        if partial:
+            heap.append((partial[0], _PARTIAL, 0, 0, 0))
+        if start < end:
+            key, index = self._best(start, end)
+            heap.append((key, _RUN, start, end, index))
+        heapq.heapify(heap)
+
+        results = []
+        while heap and len(results) < limit:
+            key, kind, first, second, index = heapq.heappop(heap)
+            results.append(key)
+            if kind == _PARTIAL:
+                if first + 1 < len(partial):
+                    heapq.heappush(heap, (partial[first + 1], _PARTIAL, first + 1, 0, 0))
+                continue
+            if kind == _RUN:
+                # The most used text of the run is the first of its best block, which now joins the merge
+                for run_start, run_end in ((first, index), (index + 1, second)):
+                    if run_start < run_end:
+                        run_key, run_index = self._best(run_start, run_end)
+                        heapq.heappush(heap, (run_key, _RUN, run_start, run_end, run_index))
+                first, second = index, 0
+            by_count = self.blocks[first].by_count
+            if second + 1 < len(by_count):
+                heapq.heappush(heap, (by_count[second + 1], _BLOCK, first, second + 1, 0))
+        return results
+
+
+class StepCompletionIndex:
+    """
+    Prefix queries over a project's step texts, for each step type, with the most used steps first.
+
+    The texts of each step type are kept sorted by text, in blocks which are also sorted by usage.  A query finds
+    the texts with a prefix by bisection, and merges the blocks they are in by usage until it has enough, so it
+    takes about as long however many texts match.  Texts are added and removed within one block, so the index is
+    cheap to keep up to date.
+
+    Like the StepCatalog, the index is built in one pass on the first query, and updated as files are refreshed
+    and features are changed through add_scenario or add_step.  Steps are indexed by their text without keyword,
+    as written, so outline steps are suggested with their <parameters>.
+    """
+
+    # The number of texts in each block, give or take a factor of two.  At least 4.
+    BLOCK_SIZE = 256
+
+    def __init__(self, project: Optional[GherkinProject] = None):
+        self._project = project
+        self._built = project is None
+        self._tables: Dict[StepType, _CompletionTable] = self._new_tables()
+        # The texts each indexed feature added, so they can be removed again: id(feature) -> (feature, counts)
+        self._features: Dict[int, Tuple[Feature, Counter]] = {}
+
+    def _build(self):
+        self._built = True
+        totals: Dict[StepType, Counter] = {step_type: Counter() for step_type in StepType}
+        for feature_file in self._project.feature_files:
+            feature = feature_file.feature
+            if feature is None:
+                continue
+            counts = self._count_steps(feature)
+            for (step_type, text), count in counts.items():
+                totals[step_type][text] += count
+            self._features[id(feature)] = (feature, counts)
+        for step_type, counts in totals.items():
+            self._tables[step_type].load(counts)
+
+    def _ensure_built(self):
+        if not self._built:
+            self._build()
+
+    def invalidate(self):
+        """Forget everything, so the index is built again on the next query"""
+        self._built = self._project is None
+        self._tables = self._new_tables()
+        self._features = {}
+
+    def _new_tables(self) -> Dict[StepType, _CompletionTable]:
+        return {step_type: _CompletionTable(self.BLOCK_SIZE) for step_type in StepType}
+
+    def __len__(self) -> int:
+        self._ensure_built()
+        return sum(len(table) for table in self._tables.values())
+
+    def insert(self, step_type: StepType, text: str, count: int = 1):
+        """Count count more uses of a step"""
+        self._ensure_built()
+        self._tables[step_type].add(text, count)
+
+    def delete(self, step_type: StepType, text: str, count: int = 1):
+        """Count count fewer uses of a step.  The step is no longer suggested once it has no uses left."""
+        self._ensure_built()
+        self._tables[step_type].add(text, -count)
+
+    def count(self, step_type: StepType, text: str) -> int:
+        self._ensure_built()
+        return self._tables[step_type].counts.get(text, 0)
+
+    def complete(self, prefix: str, step_type: Optional[StepType] = None, limit: int = 10) -> List[StepCompletion]:
+        """
+        The most used steps whose text starts with prefix
+        :param step_type: Only suggest steps of this type.  By default, steps of every type are suggested.
+        :param limit: The number of steps to suggest
+        """
+        self._ensure_built()
+        if limit <= 0:
+            return []
+        step_types = list(StepType) if step_type is None else [step_type]
+        results = [
+            (negative_count, text, current_type)
+            for current_type in step_types
+            for negative_count, text in self._tables[current_type].complete(prefix, limit)
+        ]
+        if len(step_types) > 1:
+            results = heapq.nsmallest(limit, results, key=lambda result: result[:2])
+        return [StepCompletion(text, current_type, -negative_count) for negative_count, text, current_type in results]
+
+    @staticmethod
+    def _count_steps(feature: Feature) -> Counter:
+        return Counter(
+            (step.step_type, step.text_without_keyword)
+            for scenario in feature.scenarios
+            for step in scenario.steps
+        )
+
+    def add_feature(self, feature: Optional[Feature]):
+        if not self._built or feature is None:
+            return
+        if id(feature) in self._features:
+            self.remove_feature(feature)
+        counts = self._count_steps(feature)
+        for (step_type, text), count in counts.items():
+            self.insert(step_type, text, count)
+        self._features[id(feature)] = (feature, counts)
+
+    def add_feature_file(self, feature_file: FeatureFile):
+        if self._built:
+            self.add_feature(feature_file.feature)
+
+    def remove_feature(self, feature: Optional[Feature]):
+        if feature is None:
+            return
+        entry = self._features.pop(id(feature), None)
+        if entry is None:
+            return
+        for (step_type, text), count in entry[1].items():
+            self.delete(step_type, text, count)
+
+    def update_feature(self, feature: Optional[Feature]):
+        """Index a feature again, after its scenarios or steps changed"""
+        if feature is not None and id(feature) in self._features:
+            self.add_feature(feature)
+
+    def replace_feature(self, old: Optional[Feature], new: Optional[Feature]):
+        if old is not new:
+            self.remove_feature(old)
+        self.add_feature(new)
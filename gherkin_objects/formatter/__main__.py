@@ -19,9 +19,10 @@ import difflib
 import logging
 import sys
 
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional
 
-from gherkin_objects.objects import GherkinProjectConfig, GherkinProject, Feature
+from gherkin_objects.cache import ParseCache, PathCache
+from gherkin_objects.objects import FeatureFile, GherkinProjectConfig, GherkinProject
 from gherkin_objects.formatter import Formatter, FormatterConfig
 
 logger = logging.getLogger(__package__)
@@ -42,14 +43,15 @@ def green(string):
 def apply(
         project: GherkinProject,
         formatter: Formatter,
+        feature_files: Optional[Iterable[FeatureFile]] = None,
 ):
-    for feature_file in project.feature_files:
+    for feature_file in project.feature_files if feature_files is None else feature_files:
         if not feature_file.text_is_valid_gherkin:
             logger.error(red(f'Invalid Gherkin: {feature_file.path}'))
             continue
 
         original_text = feature_file.text
-        formatted_text = '\n'.join(formatter.format_feature(Feature.from_text(original_text)))
+        formatted_text = '\n'.join(formatter.format_feature(feature_file.parse(original_text)))
         if original_text == formatted_text:
             logger.info(f'Already formatted: {feature_file.path}')
         else:
@@ -60,14 +62,15 @@ def apply(
 def diff(
         project: GherkinProject,
         formatter: Formatter,
+        feature_files: Optional[Iterable[FeatureFile]] = None,
 ):
-    for feature_file in project.feature_files:
+    for feature_file in project.feature_files if feature_files is None else feature_files:
         if not feature_file.text_is_valid_gherkin:
             logger.error(red(f'Invalid Gherkin: {feature_file.path}'))
             continue
 
         original_text = feature_file.text
-        formatted_text = '\n'.join(formatter.format_feature(Feature.from_text(original_text)))
+        formatted_text = '\n'.join(formatter.format_feature(feature_file.parse(original_text)))
         if original_text == formatted_text:
             logger.info(green(f'No diff: {feature_file.path}'))
             continue
@@ -104,16 +107,18 @@ def diff(
 def check(
         project: GherkinProject,
         formatter: Formatter,
+        feature_files: Optional[Iterable[FeatureFile]] = None,
+        exit_on_failure: bool = True,
 ):
     unformatted_files = []
 
-    for feature_file in project.feature_files:
+    for feature_file in project.feature_files if feature_files is None else feature_files:
         if not feature_file.text_is_valid_gherkin:
             logger.error(red(f'Invalid Gherkin: {feature_file.path}'))
             continue
 
         original_text = feature_file.text
-        formatted_text = '\n'.join(formatter.format_feature(Feature.from_text(original_text)))
+        formatted_text = '\n'.join(formatter.format_feature(feature_file.parse(original_text)))
 
         if formatted_text != original_text:
             unformatted_files.append(feature_file)
@@ -121,8 +126,9 @@ def check(
     if unformatted_files:
         for file in unformatted_files:
             logger.error(red(f'Not formatted: {file.path}'))
-        # Allow pipelines to fail with non-zero exit code
-        sys.exit(1)
+        if exit_on_failure:
+            # Allow pipelines to fail with non-zero exit code
+            sys.exit(1)
 
 
 # Parser -------------------------------------------------------------------------------
@@ -165,14 +171,48 @@ def parse_args(arg_strings: List[str] = None) -> argparse.Namespace:
             'If so, then the check fails, and exits with a non-zero code.'
         )
     )
+
+    parser.add_argument(
+        '--watch', action='store_true',
+        help=(
+            'After the first run, keep watching the project, and run the mode again on each file as it is saved. '
+            'With --apply, this formats files on save.'
+        )
+    )
+
+    cache_group = parser.add_argument_group(
+        'Cache',
+        'Parsed features and resolved paths are cached on disk, so unchanged files are not parsed again, '
+        'and unchanged directories are not searched again, by the next run'
+    )
+    cache_group.add_argument(
+        '--no-cache', action='store_false', dest='use_cache',
+        help='Do not read from or write to the cache.'
+    )
+    cache_group.add_argument(
+        '--clear-cache', action='store_true',
+        help='Remove every entry from the cache before running.'
+    )
+    cache_group.add_argument(
+        '--cache-dir', type=str, default=None,
+        help='The directory of the cache.  Defaults to $GHERKIN_OBJECTS_CACHE_DIR or ~/.cache/gherkin-objects'
+    )
     return parser.parse_args(arg_strings)
 
 
 def main_from_args(arg_strings: List[str] = None) -> None:
     args = parse_args(arg_strings)
 
+    cache = ParseCache(directory=args.cache_dir)
+    path_cache = PathCache(directory=args.cache_dir)
+    if args.clear_cache:
+        cache.clear()
+        path_cache.clear()
+
     project_config = GherkinProjectConfig.load(args.project_config)
-    project = GherkinProject(paths=project_config.paths)
+    project = GherkinProject.from_config(project_config,
+                                         path_cache=path_cache if args.use_cache else None,
+                                         cache=cache if args.use_cache else None)
 
     format_config = FormatterConfig.load(args.format_config)
     formatter = Formatter(format_config)
@@ -180,20 +220,49 @@ def main_from_args(arg_strings: List[str] = None) -> None:
     # In the future, this can be altered via command-line flags (e.g. --info vs. --debug)
     logger.setLevel(logging.INFO)
 
-    main(project=project, formatter=formatter, mode=args.apply_mode)
+    if args.watch:
+        watch(project=project, formatter=formatter, mode=args.apply_mode)
+    else:
+        main(project=project, formatter=formatter, mode=args.apply_mode)
 
 
-def main(project: GherkinProject, formatter: Formatter, mode: str):
+def main(
+        project: GherkinProject,
+        formatter: Formatter,
+        mode: str,
+        feature_files: Optional[Iterable[FeatureFile]] = None,
+        exit_on_failure: bool = True,
+):
     if mode == 'apply':
-        apply(project=project, formatter=formatter)
+        apply(project=project, formatter=formatter, feature_files=feature_files)
     elif mode == 'diff':
-        diff(project=project, formatter=formatter)
+        diff(project=project, formatter=formatter, feature_files=feature_files)
     elif mode == 'check':
-        check(project=project, formatter=formatter)
+        check(project=project, formatter=formatter, feature_files=feature_files, exit_on_failure=exit_on_failure)
     else:
         raise ValueError(f'Unrecognized apply_mode: {mode}')
 
 
+def watch(project: GherkinProject, formatter: Formatter, mode: str, **kwargs):
+    """
+    Run the mode on the whole project, then on each file which is added or modified, until interrupted.
+    Keyword arguments are passed to GherkinProject.watch.
+    """
+    main(project=project, formatter=formatter, mode=mode, exit_on_failure=False)
+    with project.watch(**kwargs) as watcher:
+        logger.info(f'Watching {len(project.feature_files)} files for changes')
+        try:
+            for changes in watcher:
+                changed_paths = set(changes.added) | set(changes.modified)
+                feature_files = [f for f in project.feature_files if f.path in changed_paths]
+                for path in changes.removed:
+                    logger.info(f'Removed: {path}')
+                main(project=project, formatter=formatter, mode=mode, feature_files=feature_files,
+                     exit_on_failure=False)
+        except KeyboardInterrupt:
+            pass
+
+
 # End parser ------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
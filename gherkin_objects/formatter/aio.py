@@ -0,0 +1,93 @@
+"""
+asyncio counterparts of the formatter's check and apply modes.
+
+Unlike the command line versions, these return their results rather than exiting, so that other coroutines can
+await them.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from typing import List, Optional, Tuple
+
+from gherkin_objects.aio import AsyncGherkinProject
+from gherkin_objects.objects import FeatureFile, InvalidGherkinError
+
+from .formatter import Formatter
+
+logger = logging.getLogger(__package__)
+
+
+def _format_text(formatter: Formatter, feature_file: FeatureFile, text: str) -> str:
+    return '\n'.join(formatter.format_feature(feature_file.parse(text)))
+
+
+async def _format_file(
+    project: AsyncGherkinProject,
+    formatter: Formatter,
+    feature_file: FeatureFile,
+) -> Optional[Tuple[str, str]]:
+    """(original text, formatted text) of a file, or None if it is not valid Gherkin"""
+    if not feature_file.is_loaded:
+        try:
+            await project.load_feature_file(feature_file)
+        except InvalidGherkinError:
+            logger.error(f'Invalid Gherkin: {feature_file.path}')
+            return None
+    if not feature_file.text_is_valid_gherkin:
+        logger.error(f'Invalid Gherkin: {feature_file.path}')
+        return None
+
+    original_text = feature_file.text
+    async with project.semaphore:
+        formatted_text = await project.run_in_thread(_format_text, formatter, feature_file, original_text)
+    return original_text, formatted_text
+
+
+async def check(project: AsyncGherkinProject, formatter: Formatter) -> List[FeatureFile]:
+    """Return the files which would change if the formatting was applied"""
+    feature_files = project.project.feature_files
+    results = await asyncio.gather(*[_format_file(project, formatter, f) for f in feature_files])
+
+    unformatted_files = []
+    for feature_file, result in zip(feature_files, results):
+        if result is not None and result[0] != result[1]:
+            logger.error(f'Not formatted: {feature_file.path}')
+            unformatted_files.append(feature_file)
+    return unformatted_files
+
+
+async def apply(project: AsyncGherkinProject, formatter: Formatter) -> List[FeatureFile]:
+    """Apply the formatting to each file in place, and return the files which changed"""
+
+    async def apply_file(feature_file: FeatureFile) -> bool:
+        result = await _format_file(project, formatter, feature_file)
+        if result is None:
+            return False
+        original_text, formatted_text = result
+        if original_text == formatted_text:
+            logger.info(f'Already formatted: {feature_file.path}')
+            return False
+        await project.overwrite(feature_file, formatted_text)
+        logger.info(f'Applied formatting: {feature_file.path}')
+        return True
+
+    feature_files = list(project.project.feature_files)
+    changed = await asyncio.gather(*[apply_file(f) for f in feature_files])
+    return [f for f, was_changed in zip(feature_files, changed) if was_changed]
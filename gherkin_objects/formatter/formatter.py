@@ -29,7 +29,6 @@ from typing import List, Dict, Optional, Tuple, FrozenSet
 from gherkin_objects.objects import (
     DataTable,
     ExampleTable,
-    ExampleTableRow,
     Feature,
     Scenario,
     Step
@@ -523,15 +522,16 @@ class Formatter:
         lines += _blank_lines(self.config.example_table.blank_lines_before)
         lines += self.format_example_table_tags(table)
         lines += self.format_example_table_keyword()
-        for row in table.rows:
+        column_names = table.column_names
+        for values in table.values:
             line = _indent(self.config.example_table.indent_row)
-            for i, cell in enumerate(row.cells):
-                column_name = table.column_names[i]
+            for i, value in enumerate(values):
+                column_name = column_names[i]
                 width = column_width[column_name]
                 line += '|'
                 line += ' ' * self.config.example_table.cell_left_padding
-                line += cell.value
-                line += ' ' * abs(width - len(cell.value))
+                line += value
+                line += ' ' * abs(width - len(value))
                 line += ' ' * self.config.example_table.cell_right_padding
             line += '|'
             lines.append(line)
@@ -568,22 +568,8 @@ class Formatter:
             for name in names
         }
 
-        old_header_row = table.header_row
-        new_header_row = ExampleTableRow(cells=[
-            old_header_row.cells[old_name_index[parameter]]
-            for parameter in parameters
-        ])
-
-        old_data_rows = table.data_rows
-        new_data_rows = [
-            ExampleTableRow(cells=[
-                old_data_row.cells[old_name_index[parameter]]
-                for old_data_row in old_data_rows for parameter in parameters
-            ])
-        ]
-
-        table.header_row = new_header_row
-        table.data_rows = new_data_rows
+        table.header_row = parameters
+        table.columns[:] = [table.columns[old_name_index[parameter]] for parameter in parameters]
 
     @staticmethod
     def split_tables_into_one_row_per_table(
@@ -610,14 +596,14 @@ class Formatter:
                 result.append(table)
                 table_by_tags[tags] = table
             else:
-                table_by_tags[tags].data_rows.extend(table.data_rows)
+                table_by_tags[tags].extend_rows(table.data_rows)
         return result
 
     @staticmethod
     def column_widths(tables: List[ExampleTable]) -> Dict[str, List[int]]:
         column_widths = defaultdict(list)
         for table in tables:
-            for i, name in enumerate(table.column_names):
-                column_widths[name].extend(
-                    [len(row.cells[i].value) for row in table.rows])
+            for name, column in zip(table.column_names, table.columns):
+                column_widths[name].append(len(name))
+                column_widths[name].extend(len(value) for value in column)
         return dict(column_widths)
@@ -19,20 +19,31 @@ limitations under the License.
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
 import re
 import sys
 
-from glob import glob
+from abc import ABC, abstractmethod
+from collections.abc import MutableSequence, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from enum import Enum
-from typing import List, Dict, Optional, Union, Tuple
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Dict, NamedTuple, Optional, Set, Union, Tuple
 
 from gherkin.token_scanner import TokenScanner
 from gherkin.parser import Parser
 from gherkin.errors import CompositeParserException
 
+from gherkin_objects.paths import PathResolver
+from gherkin_objects.tag_filter import GherkinTagFilter
+
+if TYPE_CHECKING:
+    from gherkin_objects.cache import ParseCache, PathCache
+    from gherkin_objects.catalog import StepCatalog, StepCompletionIndex
+    from gherkin_objects.watch import ProjectWatcher
 
 logger = logging.getLogger(__package__)
 
@@ -76,65 +87,220 @@ class GherkinProjectConfig:
             path = path.replace('.', os.path.dirname(self.path), 1)
         return path
 
-    @property
-    def paths(self) -> List[str]:
+    def resolved_patterns(self) -> Tuple[List[str], List[str]]:
+        """The include and exclude patterns, with relative paths resolved"""
         include = [
             self.resolve_relative_path(pattern) for pattern in self.include
         ]
         exclude = [
             self.resolve_relative_path(pattern) for pattern in self.exclude
         ]
-        include_specific_files = set()
-        include_found_files = set()
-        for pattern in include:
-            # If the pattern is a file, make sure it is included unless specifically excluded.
-            if os.path.exists(pattern) and os.path.isfile(pattern):
-                file_path = pattern
-                include_specific_files.add(file_path)
-            # If the pattern is a directory, create a glob to get all feature files in that directory.
-            elif os.path.exists(pattern) and os.path.isdir(pattern):
-                dir_path = pattern
-                paths_found = glob(os.path.join(dir_path, '**', '*.feature'),
-                                   recursive=True)
-                if not paths_found:
-                    logger.warning(f'No features found in dir: {dir_path}')
-                else:
-                    for path in paths_found:
-                        include_found_files.add(path)
-            # Interpret as a raw glob pattern.
-            else:
-                paths_found = glob(pattern, recursive=True)
-                if not paths_found:
-                    logger.warning(f'Failed to find features: {pattern}')
-                else:
-                    for path in glob(pattern, recursive=True):
-                        include_found_files.add(path)
-
-        exclude_specific_files = set()
-        exclude_found_files = set()
-        for pattern in exclude:
-            # If the pattern is a file, make sure it is excluded from both specified and found files.
-            if os.path.exists(pattern) and os.path.isfile(pattern):
-                file_path = pattern
-                exclude_specific_files.add(file_path)
-                exclude_found_files.add(file_path)
+        return include, exclude
+
+    @property
+    def paths(self) -> List[str]:
+        """The sorted paths of the files matched by the include patterns and not by the exclude patterns"""
+        return self.resolve_paths()
+
+    def resolve_paths(self, cache: Optional[PathCache] = None) -> List[str]:
+        """
+        :param cache: Reuse the paths resolved by a previous run, if no directory they came from has changed since
+        """
+        if cache is not None:
+            return cache.paths(self)
+        include, exclude = self.resolved_patterns()
+        return PathResolver(include, exclude).resolve()
+
+
+class SymbolTable:
+    """
+    The strings which repeat throughout a project: tag texts and step texts.
+
+    Each distinct string is stored once and shared by every node that uses it.  Each distinct tag also gets a small
+    integer id, in the order the tags were first seen.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._tag_ids: Dict[str, int] = {}
+        self.tag_texts: List[str] = []
+
+    def __len__(self):
+        return len(self._strings)
+
+    def intern(self, string: str) -> str:
+        """Return the shared copy of a string"""
+        return self._strings.setdefault(string, string)
+
+    def tag_id(self, text: str) -> int:
+        tag_id = self._tag_ids.get(text)
+        if tag_id is None:
+            text = self.intern(text)
+            tag_id = len(self.tag_texts)
+            self._tag_ids[text] = tag_id
+            self.tag_texts.append(text)
+        return tag_id
+
+    def intern_tag(self, tag: Tag) -> Tag:
+        tag.tag_id = self.tag_id(tag.text)
+        tag.text = self.tag_texts[tag.tag_id]
+        return tag
+
+    def intern_step(self, step: Step) -> Step:
+        step._text = self.intern(step._text)
+        return step
+
+    def intern_feature(self, feature: Feature) -> Feature:
+        for tag in feature.tags:
+            self.intern_tag(tag)
+        for scenario in feature.scenarios:
+            for tag in scenario.tags:
+                self.intern_tag(tag)
+            for step in scenario.steps:
+                self.intern_step(step)
+            for table in scenario.tables:
+                for tag in table.tags:
+                    self.intern_tag(tag)
+        return feature
+
+
+class ProjectIndex:
+    """
+    Lookups of a project's scenarios by tag and by uuid, and of its features by feature uuid.
+
+    The index is built from every feature in the project on the first lookup.  After that, it is updated when a
+    file is refreshed, and when a feature or scenario is changed through add_tag, add_scenario, or add_table.
+    Changes made by editing the lists of tags or scenarios directly need a call to update_feature.
+    """
+
+    UUID_PREFIX = '@uuid:'
+    FEATURE_UUID_PREFIX = '@feature_uuid:'
+
+    def __init__(self, project: GherkinProject):
+        self._project = project
+        self._built = False
+        self._scenarios_by_tag: Dict[str, Dict[int, Scenario]] = {}
+        self._scenarios_by_uuid: Dict[str, Dict[int, Scenario]] = {}
+        self._features_by_uuid: Dict[str, Dict[int, Feature]] = {}
+        # The keys each indexed feature added, so it can be removed again: id(feature) -> (feature, keys)
+        self._features: Dict[int, Tuple[Feature, List[Tuple[Dict, str, int]]]] = {}
+
+    def _build(self):
+        self._built = True
+        for feature_file in self._project.feature_files:
+            self.add_feature(feature_file.feature)
+
+    def invalidate(self):
+        """Forget everything, so the index is built again on the next lookup"""
+        self._built = False
+        self._scenarios_by_tag = {}
+        self._scenarios_by_uuid = {}
+        self._features_by_uuid = {}
+        self._features = {}
+
+    def scenarios_with_tag(self, tag: str) -> List[Scenario]:
+        """The scenarios with a tag, whether on the scenario, its feature, or one of its example tables"""
+        if not self._built:
+            self._build()
+        tag = tag if tag.startswith('@') else f'@{tag}'
+        return list(self._scenarios_by_tag.get(tag, {}).values())
+
+    def scenario_by_uuid(self, uuid: str) -> Optional[Scenario]:
+        if not self._built:
+            self._build()
+        scenarios = self._scenarios_by_uuid.get(uuid)
+        return next(iter(scenarios.values())) if scenarios else None
+
+    def feature_by_uuid(self, uuid: str) -> Optional[Feature]:
+        if not self._built:
+            self._build()
+        features = self._features_by_uuid.get(uuid)
+        return next(iter(features.values())) if features else None
+
+    @property
+    def tags(self) -> List[str]:
+        """Every tag which at least one scenario has"""
+        if not self._built:
+            self._build()
+        return list(self._scenarios_by_tag)
+
+    def add_feature(self, feature: Optional[Feature]):
+        if not self._built or feature is None:
+            return
+        if id(feature) in self._features:
+            self.remove_feature(feature)
+        keys: List[Tuple[Dict, str, int]] = []
+
+        def add(index: Dict[str, Dict[int, object]], key: str, node):
+            index.setdefault(key, {})[id(node)] = node
+            keys.append((index, key, id(node)))
+
+        feature_tags = [tag.text for tag in feature.tags]
+        for text in feature_tags:
+            if text.startswith(self.FEATURE_UUID_PREFIX):
+                add(self._features_by_uuid, text[len(self.FEATURE_UUID_PREFIX):], feature)
+
+        for scenario in feature.scenarios:
+            if scenario.is_background:
                 continue
-            # If the pattern is a directory, create a glob to get all feature files in that directory.
-            if os.path.exists(pattern) and os.path.isdir(pattern):
-                dir_path = pattern
-                for path in glob(os.path.join(dir_path, '**', '*.feature'),
-                                 recursive=True):
-                    exclude_found_files.add(path)
-            # Interpret as a raw glob pattern.
-            else:
-                for path in glob(pattern, recursive=True):
-                    exclude_found_files.add(path)
+            tags = set(feature_tags)
+            for tag in scenario.tags:
+                tags.add(tag.text)
+                if tag.text.startswith(self.UUID_PREFIX):
+                    add(self._scenarios_by_uuid, tag.text[len(self.UUID_PREFIX):], scenario)
+            for table in scenario.tables:
+                tags.update(tag.text for tag in table.tags)
+            for text in tags:
+                add(self._scenarios_by_tag, text, scenario)
+
+        self._features[id(feature)] = (feature, keys)
+
+    def add_feature_file(self, feature_file: FeatureFile):
+        if self._built:
+            self.add_feature(feature_file.feature)
+
+    def remove_feature(self, feature: Optional[Feature]):
+        if feature is None:
+            return
+        entry = self._features.pop(id(feature), None)
+        if entry is None:
+            return
+        for index, key, node_id in entry[1]:
+            nodes = index.get(key)
+            if nodes is None:
+                continue
+            nodes.pop(node_id, None)
+            if not nodes:
+                del index[key]
+
+    def update_feature(self, feature: Optional[Feature]):
+        """Index a feature again, after its tags or scenarios changed"""
+        if feature is not None and id(feature) in self._features:
+            self.add_feature(feature)
+
+    def replace_feature(self, old: Optional[Feature], new: Optional[Feature]):
+        if old is not new:
+            self.remove_feature(old)
+        self.add_feature(new)
+
+
+def _update_index(feature: Optional[Feature]):
+    """Tell the project a feature belongs to, if any, that the feature changed"""
+    project = None if feature is None else feature.parent_project
+    if project is not None:
+        for index in project.indexes:
+            index.update_feature(feature)
+
+
+class ProjectChanges(NamedTuple):
+    """The paths of the files added, modified, and removed by GherkinProject.refresh"""
+    added: List[str]
+    modified: List[str]
+    removed: List[str]
 
-        specific_files = include_specific_files - exclude_specific_files
-        found_files = include_found_files - exclude_found_files
-        paths = specific_files.union(found_files)
-        paths = list(paths)
-        return paths
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
 
 
 class GherkinProject:
@@ -145,88 +311,425 @@ class GherkinProject:
     def __init__(self,
                  paths: List[str],
                  tag_expresssion: Optional[str] = None,
-                 formatter: Optional[Formatter] = None):
+                 formatter: Optional[Formatter] = None,
+                 workers: Optional[int] = None,
+                 lazy: bool = False,
+                 cache: Optional[ParseCache] = None):
+        """
+        :param paths: Paths of the feature files in the project
+        :param tag_expresssion: Only include the scenarios which match this tag expression in scenarios, steps,
+            and the other views of the project.  Each file is first scanned for tags, and only parsed if any of its
+            scenarios could match.  The other files are excluded from the views, but are still parsed if their
+            features are accessed, e.g. through features or an index.
+        :param workers: If greater than 1, read and parse the files in a pool of this many processes.
+            Files which are not valid Gherkin are then collected in `errors` instead of raising.
+        :param lazy: Do not read or parse any file until its text or feature is first needed
+        :param cache: Reuse features parsed by previous runs from this on-disk cache
+        """
         self.paths = paths
         for path in self.paths:
             if not path.endswith('.feature'):
                 raise ValueError(f'Not a feature file: {path}')
-
-        self.feature_files = [FeatureFile(path, parent=self) for path in paths]
+        if lazy and workers is not None and workers > 1:
+            raise ValueError('A project cannot be both lazy and loaded in parallel')
+
+        self.lazy = lazy
+        self.cache = cache
+        self.tag_filter = GherkinTagFilter(tag_expresssion) if tag_expresssion else None
+        self.symbols = SymbolTable()
+        self.index = ProjectIndex(self)
+        self._step_catalog: Optional[StepCatalog] = None
+        self._decomposed_step_catalog: Optional[StepCatalog] = None
+        self._step_completions: Optional[StepCompletionIndex] = None
+        self.config: Optional[GherkinProjectConfig] = None
+        self.path_cache: Optional[PathCache] = None
+        self.errors: List[Tuple[str, InvalidGherkinError]] = []
+        if workers is not None and workers > 1:
+            self.feature_files = self._load_feature_files_parallel(paths, workers)
+        else:
+            self.feature_files = [
+                FeatureFile(path, parent=self, lazy=lazy, cache=cache, tag_filter=self.tag_filter)
+                for path in paths
+            ]
         for feature_file in self.feature_files:
             feature_file.parent = self
 
-    def refresh(self):
+    @classmethod
+    def from_config(cls,
+                    config: GherkinProjectConfig,
+                    path_cache: Optional[PathCache] = None,
+                    **kwargs) -> GherkinProject:
+        """
+        Create a project from the files matched by a config.  refresh() will then also pick up files that are
+        added or removed under the config's patterns.
+        :param path_cache: Reuse the config's paths resolved by a previous run, if still valid
+        """
+        project = cls(paths=config.resolve_paths(path_cache), **kwargs)
+        project.config = config
+        project.path_cache = path_cache
+        return project
+
+    @property
+    def feature_files(self) -> List[FeatureFile]:
+        return self._feature_files
+
+    @feature_files.setter
+    def feature_files(self, feature_files: List[FeatureFile]):
+        self._feature_files = feature_files
+        # Files left out, e.g. because they are not valid Gherkin, are left out of the paths too
+        self.paths = [feature_file.path for feature_file in feature_files]
+        for index in self.indexes:
+            index.invalidate()
+
+    def record_error(self, path: str, error: InvalidGherkinError):
+        """Record that a file is not valid Gherkin, replacing any earlier error for it.  refresh() tries it again."""
+        logger.warning(f'Invalid Gherkin: {path}: {error}')
+        self.clear_errors(path)
+        self.errors.append((path, error))
+
+    def clear_errors(self, path: str):
+        """Forget the errors recorded for a file, e.g. once it is valid Gherkin again"""
+        self.errors[:] = [(error_path, error) for error_path, error in self.errors if error_path != path]
+
+    @property
+    def indexes(self) -> List[Union[ProjectIndex, StepCatalog, StepCompletionIndex]]:
+        """The indexes which are kept up to date as the project's features change"""
+        optional_indexes = (self._step_catalog, self._decomposed_step_catalog, self._step_completions)
+        return [self.index] + [index for index in optional_indexes if index is not None]
+
+    @property
+    def step_catalog(self) -> StepCatalog:
+        """The distinct steps of the project and where each is used, built on first use"""
+        if self._step_catalog is None:
+            from gherkin_objects.catalog import StepCatalog
+            self._step_catalog = StepCatalog(self)
+        return self._step_catalog
+
+    @property
+    def decomposed_step_catalog(self) -> StepCatalog:
+        """Like step_catalog, for the steps of the decomposed scenarios"""
+        if self._decomposed_step_catalog is None:
+            from gherkin_objects.catalog import StepCatalog
+            self._decomposed_step_catalog = StepCatalog(self, decomposed=True)
+        return self._decomposed_step_catalog
+
+    @property
+    def step_completions(self) -> StepCompletionIndex:
+        """Prefix queries over the project's step texts, for autocomplete, built on first use"""
+        if self._step_completions is None:
+            from gherkin_objects.catalog import StepCompletionIndex
+            self._step_completions = StepCompletionIndex(self)
+        return self._step_completions
+
+    def scenarios_with_tag(self, tag: str) -> List[Scenario]:
+        """See ProjectIndex.scenarios_with_tag"""
+        return self.index.scenarios_with_tag(tag)
+
+    def scenario_by_uuid(self, uuid: str) -> Optional[Scenario]:
+        return self.index.scenario_by_uuid(uuid)
+
+    def feature_by_uuid(self, uuid: str) -> Optional[Feature]:
+        return self.index.feature_by_uuid(uuid)
+
+    @property
+    def paths(self) -> List[str]:
+        return self._paths
+
+    @paths.setter
+    def paths(self, paths: List[str]):
+        self._paths = paths
+        self._common_root_path: Optional[str] = None
+
+    @classmethod
+    def load_parallel(cls, paths: List[str], workers: Optional[int] = None, **kwargs) -> GherkinProject:
+        """
+        Create a project, reading and parsing its files in a process pool
+        :param workers: The number of processes to use, defaults to the number of CPUs
+        """
+        return cls(paths, workers=workers or os.cpu_count() or 1, **kwargs)
+
+    def _load_feature_files_parallel(self, paths: List[str], workers: int) -> List[FeatureFile]:
+        feature_files = []
+        # Large chunks keep the per-task IPC overhead low, while leaving a few chunks per worker for load balancing
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(partial(_read_and_parse_feature_file, cache=self.cache, tag_filter=self.tag_filter),
+                                   paths,
+                                   chunksize=chunksize)
+            for path, (text, feature, error, signature) in zip(paths, results):
+                if error is not None:
+                    self.record_error(path, error)
+                    continue
+                feature_file = FeatureFile(path, parent=self, lazy=True, cache=self.cache)
+                if feature is None:
+                    feature_file.exclude(signature)
+                else:
+                    feature_file.assign(text, feature, signature=signature)
+                feature_files.append(feature_file)
+        return feature_files
+
+    def refresh(self, force: bool = False, touched: Optional[Iterable[str]] = None) -> ProjectChanges:
+        """
+        Re-parse the files which changed on disk since they were last read, and drop the files which no longer
+        exist.  If the project was created from a config, files added under its patterns are picked up too.
+        Files which are not valid Gherkin are collected in `errors`, as in a parallel load, and tried again by the
+        next refresh.  A modified file which is no longer valid keeps its last valid contents.
+
+        :param force: Re-parse every loaded file, even if it has not changed
+        :param touched: Only check these paths for modification, e.g. the paths reported by a file watcher
+        :return: The paths which were added, modified, and removed
+        """
+        added, modified, removed = [], [], []
+        touched = None if touched is None else set(touched)
+
+        if self.config is not None:
+            paths = self.config.resolve_paths(self.path_cache)
+        else:
+            # Files which were left out because they were not valid Gherkin are tried again
+            candidates = dict.fromkeys(self.paths + [path for path, _ in self.errors])
+            paths = [path for path in candidates if os.path.isfile(path)]
+        current_paths = set(paths)
+        for path in {path for path, _ in self.errors} - current_paths:
+            self.clear_errors(path)
+
+        feature_files = []
         for feature_file in self.feature_files:
-            feature_file.refresh()
+            if feature_file.path not in current_paths:
+                removed.append(feature_file.path)
+                continue
+            feature_files.append(feature_file)
+            if touched is not None and feature_file.path not in touched:
+                continue
+            try:
+                if force and feature_file.is_loaded:
+                    feature_file.refresh()
+                    is_modified = True
+                else:
+                    is_modified = feature_file.refresh_if_modified(tag_filter=self.tag_filter)
+            except InvalidGherkinError as e:
+                # The file keeps its last valid contents, and is tried again by the next refresh
+                self.record_error(feature_file.path, e)
+                continue
+            self.clear_errors(feature_file.path)
+            if is_modified:
+                modified.append(feature_file.path)
+
+        known_paths = set(self.paths)
+        for path in paths:
+            if path in known_paths:
+                continue
+            feature_file = FeatureFile(path, parent=self, lazy=True, cache=self.cache)
+            if not self.lazy:
+                try:
+                    feature_file.refresh(tag_filter=self.tag_filter)
+                except InvalidGherkinError as e:
+                    self.record_error(path, e)
+                    continue
+                self.clear_errors(path)
+            feature_files.append(feature_file)
+            added.append(path)
+
+        if added or removed:
+            # Update the index in place, rather than invalidating it by assigning feature_files
+            removed_paths = set(removed)
+            indexes = self.indexes
+            for feature_file in self._feature_files:
+                if feature_file.path in removed_paths and feature_file.is_loaded:
+                    for index in indexes:
+                        index.remove_feature(feature_file.feature)
+            self._feature_files = feature_files
+            self.paths = [feature_file.path for feature_file in feature_files]
+            for feature_file in feature_files[len(feature_files) - len(added):]:
+                for index in indexes:
+                    index.add_feature_file(feature_file)
+        return ProjectChanges(added=added, modified=modified, removed=removed)
+
+    def save_snapshot(self, path: str):
+        """Save the parsed project to a file, which load_snapshot can load without parsing the files again"""
+        from gherkin_objects.snapshot import save_snapshot
+        save_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, **kwargs) -> GherkinProject:
+        """
+        Create a project from a file written by save_snapshot.  Files which changed since it was saved are parsed
+        again.  Keyword arguments are passed to the project.
+        """
+        from gherkin_objects.snapshot import load_snapshot
+        return load_snapshot(path, project_class=cls, **kwargs)
+
+    def watch(self, **kwargs) -> ProjectWatcher:
+        """
+        Start watching the project's files, refreshing the project as they change.  Iterate over the returned
+        watcher for the changes, and close it to stop watching.  Keyword arguments are passed to ProjectWatcher.
+        """
+        from gherkin_objects.watch import ProjectWatcher
+        return ProjectWatcher(self, **kwargs)
+
+    def _as_sequence(self, iterable: Iterable) -> Sequence:
+        return _LazySequence(iterable) if self.lazy else list(iterable)
 
     @property
-    def features(self) -> List[Feature]:
-        return [feature_file.feature for feature_file in self.feature_files]
+    def features(self) -> Sequence[Feature]:
+        """
+        The feature of each file.  In a lazy project, files are only parsed as this sequence is iterated or indexed.
+        """
+        return self._as_sequence(feature_file.feature for feature_file in self.feature_files)
 
     @property
-    def scenarios(self) -> List[Scenario]:
-        result = []
-        for feature in self.features:
-            for scenario in feature.scenarios:
-                result.append(scenario)
-        return result
+    def scenarios(self) -> Sequence[Scenario]:
+        """
+        The scenarios of every feature, or with a tag_filter, those which match it.  See GherkinTagFilter.iter_scenarios
+        """
+        return self._as_sequence(_scenarios_of(self._candidate_features(), self.tag_filter))
 
     @property
     def common_root_path(self) -> str:
         """
-        Return the longest common path shared between all files in the project
+        Return the longest common path shared between all files in the project.
+        This is computed once, and again only when the project's paths change.
         """
-        if len(self.paths) == 0:
-            raise ValueError('GherkinProject has no file paths to compare')
-        elif len(self.paths) == 1:
-            return os.path.dirname(self.paths[0]) + os.path.sep
-        return os.path.commonpath(self.paths) + os.path.sep
+        if self._common_root_path is None:
+            if len(self.paths) == 0:
+                raise ValueError('GherkinProject has no file paths to compare')
+            elif len(self.paths) == 1:
+                self._common_root_path = os.path.dirname(self.paths[0]) + os.path.sep
+            else:
+                self._common_root_path = os.path.commonpath(self.paths) + os.path.sep
+        return self._common_root_path
 
     @property
-    def decomposed_scenarios(self) -> List[Scenario]:
+    def decomposed_scenarios(self) -> Sequence[Scenario]:
         """
-        A list of scenarios with the values in example tables substituted into the steps
+        A list of scenarios with the values in example tables substituted into the steps.  With a tag_filter, only
+        the rows of the example tables which match are substituted.  See GherkinTagFilter.iter_decomposed_scenarios
         """
-        result = []
-        for scenario in self.scenarios:
-            result.extend(scenario.decompose())
-        return result
+        return self._as_sequence(_decomposed_scenarios_of(self._candidate_features(), self.tag_filter))
 
     @property
-    def steps(self) -> List[Step]:
-        result = []
-        for scenario in self.scenarios:
-            for step in scenario.steps:
-                result.append(step)
-        return result
+    def steps(self) -> Sequence[Step]:
+        return self._as_sequence(_steps_of(self.scenarios))
 
     @property
-    def decomposed_steps(self) -> List[Step]:
-        result = []
-        for scenario in self.decomposed_scenarios:
-            for step in scenario.steps:
-                result.append(step)
-        return result
+    def decomposed_steps(self) -> Sequence[Step]:
+        return self._as_sequence(_steps_of(self.decomposed_scenarios))
+
+    # Generators --------------------------------------------------------------
+    # Unlike the properties above, these never keep a feature that was not already loaded.  Files that a lazy
+    # project has not loaded are parsed for the duration of the iteration only, so iterating a lazy project holds
+    # at most one of their features in memory at a time.
+
+    def iter_features(self) -> Iterator[Feature]:
+        for feature_file in self.feature_files:
+            if feature_file.is_loaded:
+                yield feature_file.feature
+            else:
+                yield feature_file.parse_transient()
+
+    def _candidate_features(self, transient: bool = False) -> Iterator[Feature]:
+        """
+        The features of the files which could have a scenario that matches tag_filter.  Files which were not loaded
+        are scanned for tags, and only parsed if they could.
+        :param transient: Do not keep the features of files which were not loaded, as in iter_features
+        """
+        for feature_file in self.feature_files:
+            if feature_file.excluded:
+                continue
+            if not transient or feature_file.is_loaded:
+                feature = feature_file.load(tag_filter=self.tag_filter)
+            elif self.tag_filter is None:
+                feature = feature_file.parse_transient()
+            else:
+                feature = feature_file.parse_transient_if_matching(self.tag_filter)
+            if feature is not None:
+                yield feature
+
+    def iter_scenarios(self) -> Iterator[Scenario]:
+        return _scenarios_of(self._candidate_features(transient=True), self.tag_filter)
+
+    def iter_steps(self) -> Iterator[Step]:
+        return _steps_of(self.iter_scenarios())
+
+    def iter_decomposed_scenarios(self) -> Iterator[Scenario]:
+        return _decomposed_scenarios_of(self._candidate_features(transient=True), self.tag_filter)
+
+    def iter_decomposed_steps(self) -> Iterator[Step]:
+        return _steps_of(self.iter_decomposed_scenarios())
 
     @property
     def unique_step_texts(self) -> List[str]:
-        seen = set()
-        result = []
-        for step in self.all_steps:
-            if step.real_text not in seen:
-                seen.add(step.real_text)
-                result.append(step.real_text)
-        return result
+        return self.step_catalog.texts
 
     @property
     def unique_decomposed_step_texts(self) -> List[str]:
-        seen = set()
-        result = []
-        for step in self.decomposed_steps:
-            if step.real_text not in seen:
-                seen.add(step.real_text)
-                result.append(step.real_text)
-        return result
+        return self.decomposed_step_catalog.texts
+
+
+def _scenarios_of(features: Iterable[Feature], tag_filter: Optional[GherkinTagFilter] = None) -> Iterator[Scenario]:
+    for feature in features:
+        if tag_filter is None:
+            yield from feature.scenarios
+        else:
+            yield from tag_filter.iter_scenarios(feature)
+
+
+def _steps_of(scenarios: Iterable[Scenario]) -> Iterator[Step]:
+    for scenario in scenarios:
+        yield from scenario.steps
+
+
+def _decomposed_scenarios_of(features: Iterable[Feature],
+                             tag_filter: Optional[GherkinTagFilter] = None) -> Iterator[Scenario]:
+    for feature in features:
+        if tag_filter is None:
+            yield from feature.iter_decomposed_scenarios()
+        else:
+            yield from tag_filter.iter_decomposed_scenarios(feature)
+
+
+class _LazySequence(Sequence):
+    """
+    A read-only list whose items are pulled from an iterable the first time they are reached
+    """
+
+    def __init__(self, iterable: Iterable):
+        self._iterator = iter(iterable)
+        self._items = []
+
+    def _fill(self, count: Optional[int] = None):
+        while self._iterator is not None and (count is None or len(self._items) < count):
+            try:
+                self._items.append(next(self._iterator))
+            except StopIteration:
+                self._iterator = None
+
+    def __iter__(self):
+        i = 0
+        while True:
+            self._fill(i + 1)
+            if i >= len(self._items):
+                return
+            yield self._items[i]
+            i += 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            self._fill()
+        else:
+            self._fill(index + 1)
+        return self._items[index]
+
+    def __len__(self):
+        self._fill()
+        return len(self._items)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _LazySequence)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
 
 
 class FeatureFile:
@@ -239,15 +742,83 @@ class FeatureFile:
         self,
         path: str,
         parent: 'GherkinProject' = None,
+        text: Optional[str] = None,
+        feature: Optional['Feature'] = None,
+        lazy: bool = False,
+        cache: Optional[ParseCache] = None,
+        tag_filter: Optional[GherkinTagFilter] = None,
     ):
+        """
+        :param text: The contents of the file, if they have already been read elsewhere
+        :param feature: The feature parsed from `text`.  Only used when `text` is given.
+        :param lazy: Wait until `text` or `feature` is first accessed before reading and parsing the file
+        :param cache: Reuse features parsed by previous runs from this on-disk cache
+        :param tag_filter: Only parse the file if it could have a scenario which matches.  See refresh
+        """
         self.path = path
-        self.text = None
-        self.feature = None
-        self.refresh()
+        self.cache = cache
+        self._text = text
+        self._feature = feature
+        self._loaded = text is not None
+        # (mtime, size, inode) of the file when it was last read
+        self._signature: Optional[Tuple[int, int, int]] = None
+        # Loads the contents from somewhere other than the file, e.g. a snapshot, when they are first accessed
+        self._loader: Optional[Callable[[], Tuple[str, Feature]]] = None
+        # Whether the file was left unparsed because no scenario in it could match a tag filter
+        self.excluded = False
         self.parent = parent
+        if self._feature:
+            self.adopt(self._feature)
+        elif not self._loaded and not lazy:
+            self.refresh(tag_filter=tag_filter)
+
+    @property
+    def text(self) -> Optional[str]:
+        if not self._loaded:
+            self._load()
+        return self._text
+
+    @property
+    def feature(self) -> Optional['Feature']:
+        if not self._loaded:
+            self._load()
+        return self._feature
+
+    def _load(self, tag_filter: Optional[GherkinTagFilter] = None):
+        if self._loader is None:
+            self.refresh(tag_filter=tag_filter)
+            return
+        text, feature = self._loader()
+        self.assign(text, feature, signature=self._signature)
+
+    def load(self, tag_filter: Optional[GherkinTagFilter] = None) -> Optional[Feature]:
+        """
+        The file's feature, reading and parsing the file first if it was not loaded
+        :param tag_filter: Only parse a file which was not loaded if it could have a scenario which matches, and
+            otherwise return None.  See refresh
+        """
+        if not self._loaded:
+            self._load(tag_filter)
+        return self._feature
 
-        if self.feature:
-            self.feature.parent = self
+    def defer(self, loader: Callable[[], Tuple[str, Feature]], signature: Optional[Tuple[int, int, int]] = None):
+        """
+        Load the file's contents with `loader` instead of reading and parsing the file, when they are first accessed
+        :param signature: The (mtime, size, inode) of the file which the loader's contents were read from
+        """
+        self._loader = loader
+        self._signature = signature
+        self.excluded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the file has been read and parsed"""
+        return self._loaded
+
+    @property
+    def signature(self) -> Optional[Tuple[int, int, int]]:
+        """The (mtime, size, inode) of the file when it was last read"""
+        return self._signature
 
     def overwrite(self, text: str):
         with open(self.path, 'w') as file:
@@ -258,9 +829,113 @@ class FeatureFile:
         with open(self.path, 'r') as file:
             return file.read()
 
-    def refresh(self):
-        self.text = self.read()
-        self.feature = Feature.from_text(self.text)
+    def read_with_signature(self) -> Tuple[str, Optional[Tuple[int, int, int]]]:
+        """Read the file, along with its (mtime, size, inode) from just before it was read"""
+        # Stat first, so a write that races with the read is seen as a modification next time
+        signature = _file_signature(self.path)
+        return self.read(), signature
+
+    def refresh(self, tag_filter: Optional[GherkinTagFilter] = None):
+        """
+        Read and parse the file
+        :param tag_filter: If the file was not loaded yet, first scan its text for tags, and leave it unparsed and
+            excluded if none of its scenarios could match.  Its feature is still parsed if it is accessed.
+        """
+        text, signature = self.read_with_signature()
+        if tag_filter is not None and self._feature is None and not tag_filter.could_match_text(text):
+            self.exclude(signature)
+            return
+        # Parse before keeping anything, so a file which is not valid Gherkin is still seen as modified next time
+        feature = self.parse(text)
+        self._text, self._signature = text, signature
+        self._set_feature(self.adopt(feature))
+        self._loader = None
+        self._loaded = True
+        self.excluded = False
+
+    def exclude(self, signature: Optional[Tuple[int, int, int]] = None):
+        """
+        Leave the file unparsed, because none of its scenarios could match a tag filter
+        :param signature: The (mtime, size, inode) of the file when it was scanned, so a change to it is noticed
+        """
+        self._text = None
+        self._signature = signature
+        self._loader = None
+        self._loaded = False
+        self.excluded = True
+
+    def _set_feature(self, feature: Feature):
+        old_feature, self._feature = self._feature, feature
+        if self.parent is not None:
+            for index in self.parent.indexes:
+                index.replace_feature(old_feature, feature)
+
+    def assign(self,
+               text: str,
+               feature: Feature,
+               signature: Optional[Tuple[int, int, int]] = None):
+        """
+        Use contents which were read and parsed elsewhere, e.g. in another process
+        :param signature: The (mtime, size, inode) of the file when it was read.  If not given, the next
+            refresh_if_modified will treat the file as modified.
+        """
+        self._text = text
+        self._set_feature(self.adopt(feature))
+        self._signature = signature
+        self._loader = None
+        self._loaded = True
+        self.excluded = False
+
+    def parse_transient(self) -> Feature:
+        """
+        Read and parse the file into a new feature, without keeping it.  The feature still links back to this file,
+        but its strings are not added to the project's SymbolTable, which would otherwise keep them.
+        """
+        if self._loader is not None:
+            return self.adopt(self._loader()[1], intern=False)
+        return self.adopt(self.parse(self.read()), intern=False)
+
+    def parse_transient_if_matching(self, tag_filter: GherkinTagFilter) -> Optional[Feature]:
+        """Like parse_transient, but return None without parsing if none of the file's scenarios could match"""
+        if self._loader is not None:
+            return self.parse_transient()
+        text = self.read()
+        if not tag_filter.could_match_text(text):
+            return None
+        return self.adopt(self.parse(text), intern=False)
+
+    def adopt(self, feature: Feature, intern: bool = True) -> Feature:
+        """
+        Make this file the parent of a feature, and share the project's strings with it
+        :param intern: Add the feature's strings to the project's SymbolTable.  Not for features which are not kept.
+        """
+        feature.parent = self
+        if intern and self.parent is not None:
+            self.parent.symbols.intern_feature(feature)
+        return feature
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether the file changed on disk since it was last read.  Files that were never read are not modified."""
+        if not self._loaded and self._loader is None and not self.excluded:
+            return False
+        return self._signature is None or self._signature != _file_signature(self.path)
+
+    def refresh_if_modified(self, tag_filter: Optional[GherkinTagFilter] = None) -> bool:
+        """
+        Re-read and re-parse the file only if it changed on disk, returning whether it did
+        :param tag_filter: See refresh
+        """
+        if not self.is_modified:
+            return False
+        self.refresh(tag_filter=tag_filter)
+        return True
+
+    def parse(self, text: str, parent: Optional[FeatureFile] = None) -> Feature:
+        """Parse text into a new Feature, using the cache if there is one"""
+        if self.cache is not None:
+            return self.cache.feature_from_text(text, parent=parent)
+        return Feature.from_text(text, parent=parent)
 
     @property
     def text_is_valid_gherkin(self):
@@ -284,6 +959,9 @@ class Feature:
     A group of Gherkin scenarios
     """
 
+    __slots__ = ('name', 'description', 'tags', 'scenarios', 'comments', 'trailing_comments', 'parent',
+                 '_steps_version', '_background_step_ids')
+
     def __init__(
         self,
         name: str,
@@ -301,6 +979,9 @@ class Feature:
         self.comments = comments or []
         self.trailing_comments = trailing_comments or []
         self.parent = parent
+        # Bumped when scenarios or steps are added, so each scenario knows to resolve its all_steps again
+        self._steps_version = 0
+        self._background_step_ids: Optional[Tuple[Tuple, Set[int]]] = None
 
         for scenario in self.scenarios:
             scenario.parent = self
@@ -367,15 +1048,18 @@ class Feature:
 
     @property
     def decomposed_scenarios(self) -> List['Scenario']:
-        scenarios = []
+        return list(self.iter_decomposed_scenarios())
+
+    def iter_decomposed_scenarios(self) -> Iterator['Scenario']:
+        """The decomposed scenarios of each scenario in turn, building each one only as it is reached"""
         for scenario in self.scenarios:
-            scenarios.extend(scenario.decompose())
-        return scenarios
+            yield from scenario.iter_decompose()
 
     def add_tag(self, tag: 'Tag', position: Optional[int] = None):
         tag.parent = self
         self.tags.append(tag) if position is None else self.tags.insert(
             position, tag)
+        _update_index(self)
 
     def add_scenario(self,
                      scenario: 'Scenario',
@@ -384,6 +1068,21 @@ class Feature:
         self.scenarios.append(
             scenario) if position is None else self.scenarios.insert(
                 position, scenario)
+        self.invalidate_steps()
+        _update_index(self)
+
+    def invalidate_steps(self):
+        """Resolve every scenario's all_steps again, after the background or a scenario's steps were changed"""
+        self._steps_version += 1
+
+    def _background_ids(self, background: 'Scenario') -> Set[int]:
+        """The identities of the background's steps, collected once for all the feature's scenarios"""
+        key = (self._steps_version, id(background), id(background.steps), len(background.steps))
+        cached = self._background_step_ids
+        if cached is None or cached[0] != key:
+            cached = (key, {id(step) for step in background.steps})
+            self._background_step_ids = cached
+        return cached[1]
 
     def add_comment(self, comment: 'Comment', position: Optional[int] = None):
         comment.parent = self
@@ -410,6 +1109,9 @@ class Feature:
 
 class Scenario:
 
+    __slots__ = ('scenario_type', 'name', 'description', 'steps', 'tags', 'tables', 'comments', 'parent',
+                 'includes_background', '_all_steps')
+
     def __init__(
         self,
         scenario_type: 'ScenarioType',
@@ -420,7 +1122,12 @@ class Scenario:
         tables: List['ExampleTable'] = None,
         comments: List['Comment'] = None,
         parent: 'Feature' = None,
+        includes_background: bool = False,
     ):
+        """
+        :param includes_background: Whether steps already starts with the feature's background steps, as in a
+        decomposed scenario
+        """
         self.scenario_type = scenario_type
         self.name = name
         self.description = description
@@ -429,6 +1136,8 @@ class Scenario:
         self.tables = tables or []
         self.comments = comments or []
         self.parent = parent
+        self.includes_background = includes_background
+        self._all_steps: Optional[Tuple[Tuple, List[Step]]] = None
 
         for step in self.steps:
             step.parent = self
@@ -499,17 +1208,30 @@ class Scenario:
             return self.tags
 
     @property
-    def all_steps(self):
-        """Scenario steps + background steps"""
-        if self.parent is not None and self.parent.background is not None:
-            # Remove the background steps first so we don't have duplicates. We don't know
-            # if self.steps contains background steps or not.
-            steps_without_background = [
-                x for x in self.steps if x not in self.parent.background.steps
-            ]
-            return self.parent.background.steps + steps_without_background
-
-        return self.steps
+    def all_steps(self) -> List['Step']:
+        """
+        Background steps + scenario steps.  The list is resolved once, and again only after the feature's
+        steps change, so it must not be modified.
+        """
+        feature = self.parent
+        if feature is None or self.includes_background:
+            return self.steps
+        background = feature.background
+        if background is None or background is self:
+            return self.steps
+
+        # Lengths and list identities catch steps appended or assigned without add_step
+        key = (feature._steps_version, id(background), id(background.steps), len(background.steps),
+               id(self.steps), len(self.steps))
+        cached = self._all_steps
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Steps are compared by identity, so the cost does not grow with the size of the background
+        background_ids = feature._background_ids(background)
+        all_steps = background.steps + [step for step in self.steps if id(step) not in background_ids]
+        self._all_steps = (key, all_steps)
+        return all_steps
 
     def decomposed_scenario_name(
         self,
@@ -531,13 +1253,30 @@ class Scenario:
         Decompose a scenario outline into multiple scenarios
         :return: List of Scenarios
         """
+        return list(self.iter_decompose())
+
+    def iter_decompose(self, tables: Optional[Iterable['ExampleTable']] = None) -> Iterator['Scenario']:
+        """
+        Decompose a scenario outline into multiple scenarios, building each one only as it is reached.
+        A scenario which is not an outline yields itself.
+        :param tables: Only expand the rows of these example tables.  The scenarios are numbered as if every
+            table had been expanded.
+        """
         if not self.is_scenario_outline:
-            return [self]
+            yield self
+            return
 
+        outline_steps = self.all_steps
+        selected_tables = None if tables is None else {id(table) for table in tables}
         scenario_count = 0
-        scenarios = []
         for table in self.tables:
-            for row_params in table.table_row_params:
+            if selected_tables is not None and id(table) not in selected_tables:
+                scenario_count += table._row_count()
+                continue
+            header = table.header_values
+            templates = _StepTemplate.compile(outline_steps, header)
+            for row in zip(*table.columns):
+                row_params = list(zip(header, row))
                 scenario_count += 1
 
                 name = self.decomposed_scenario_name(
@@ -547,43 +1286,44 @@ class Scenario:
 
                 description = self.description
 
-                scenario_tags = [Tag.from_text(tag.text) for tag in self.tags]
-                table_tags = [Tag.from_text(tag.text) for tag in table.tags]
-                tags = scenario_tags + table_tags
-
-                steps = [
-                    Step.from_text(step.raw_text, step_type=step.step_type)
-                    for step in self.all_steps
+                # Share the existing tag texts rather than parsing a new copy of each one
+                tags = [
+                    Tag(tag.text, tag_id=tag.tag_id)
+                    for tag in itertools.chain(self.tags, table.tags)
                 ]
-                for step in steps:
-                    for param_name, param_value in row_params:
-                        step._text = step._text.replace(
-                            f'<{param_name}>', param_value)
-
-                scenario = Scenario(scenario_type=ScenarioType.SCENARIO,
-                                    name=name,
-                                    description=description,
-                                    tags=tags,
-                                    steps=steps,
-                                    tables=[],
-                                    parent=self.parent)
-                scenarios.append(scenario)
-        return scenarios
+
+                # Texts without parameters are shared with the outline's steps.  Texts substituted from each row
+                # are not interned, so decomposing many rows does not grow the project's SymbolTable.
+                steps = [template.expand(row) for template in templates]
+
+                yield Scenario(scenario_type=ScenarioType.SCENARIO,
+                               name=name,
+                               description=description,
+                               tags=tags,
+                               steps=steps,
+                               tables=[],
+                               parent=self.parent,
+                               includes_background=True)
 
     def add_tag(self, tag: 'Tag', position: Optional[int] = None):
         tag.parent = self
         self.tags.append(tag) if position is None else self.tags.insert(
             position, tag)
+        _update_index(self.parent)
 
     def add_step(self, step: 'Step', position: Optional[int] = None):
         step.parent = self
         self.steps.append(step) if position is None else self.steps.insert(
             position, step)
+        if self.parent is not None:
+            self.parent.invalidate_steps()
+        _update_index(self.parent)
 
     def add_table(self, table: 'ExampleTable', position: Optional[int] = None):
         table.parent = self
         self.tables.append(table) if position is None else self.tables.insert(
             position, table)
+        _update_index(self.parent)
 
     def add_comment(self, comment: 'Comment', position: Optional[int] = None):
         comment.parent = self
@@ -617,6 +1357,9 @@ class Step:
     [Given, When, Then, And, But, *]
     """
 
+    __slots__ = ('keyword', '_text', 'step_type', 'comments', 'data_table', 'parent', '_parameters',
+                 '_parameters_text')
+
     def __init__(
         self,
         keyword: 'StepKeyword',
@@ -647,6 +1390,9 @@ class Step:
         self.comments = comments or []
         self.data_table = data_table
         self.parent = parent
+        # The parameters found in _parameters_text, so they are only searched for again when the text changes
+        self._parameters: List[str] = []
+        self._parameters_text: Optional[str] = None
 
         if self.data_table:
             self.data_table.parent = self
@@ -751,7 +1497,11 @@ class Step:
 
     @property
     def parameters(self) -> List[str]:
-        return re.findall(r'<(.*?)>', self.text_without_keyword)
+        text = self.text_without_keyword
+        if self._parameters_text is not text:
+            self._parameters = re.findall(r'<(.*?)>', text)
+            self._parameters_text = text
+        return list(self._parameters)
 
     @property
     def text_without_keyword(self):
@@ -801,12 +1551,226 @@ class Step:
         return self.parent
 
 
-class DataTable:
+class _TextTemplate:
+    """
+    Text containing <parameter> placeholders, split once into literal segments and the example table columns
+    to substitute between them
+    """
+
+    __slots__ = ('_segments', '_slots')
+
+    def __init__(self, text: str, pattern: Optional[re.Pattern], column_index: Dict[str, int]):
+        parts = pattern.split(text) if pattern is not None else [text]
+        # re.split puts the literal segments at even positions and the captured parameter names at odd positions
+        self._segments = parts
+        self._slots = [(position, column_index[parts[position]]) for position in range(1, len(parts), 2)]
+
+    def expand(self, row: Sequence[str]) -> str:
+        if not self._slots:
+            return self._segments[0]
+        parts = self._segments[:]
+        for position, column in self._slots:
+            parts[position] = row[column]
+        return ''.join(parts)
+
+
+class _StepTemplate:
+    """A step of a scenario outline, compiled once per example table so each row only joins strings"""
+
+    __slots__ = ('_step', '_text', '_data_table')
+
+    def __init__(self, step: Step, pattern: Optional[re.Pattern], column_index: Dict[str, int]):
+        self._step = step
+        # Decomposed steps have always had their whitespace normalized
+        text = ' '.join(step.text_without_keyword.split())
+        if text == step.text_without_keyword:
+            text = step.text_without_keyword
+        self._text = _TextTemplate(text, pattern, column_index)
+        self._data_table: Optional[List[List[Union[str, _TextTemplate]]]] = None
+        if step.data_table is not None:
+            self._data_table = [
+                [_TextTemplate(value, pattern, column_index) if '<' in value else value for value in column]
+                for column in step.data_table.columns
+            ]
+
+    def expand(self, row: Sequence[str]) -> Step:
+        data_table = None
+        if self._data_table is not None:
+            data_table = DataTable.from_columns([
+                [value if isinstance(value, str) else value.expand(row) for value in column]
+                for column in self._data_table
+            ])
+        return Step(keyword=self._step.keyword,
+                    text=self._text.expand(row),
+                    step_type=self._step.step_type,
+                    data_table=data_table)
+
+    @staticmethod
+    def compile(steps: List[Step], header: List[str]) -> List[_StepTemplate]:
+        column_index = {}
+        for index, name in enumerate(header):
+            # Like str.replace applied column by column, the first column with a name wins
+            column_index.setdefault(name, index)
+        pattern = None
+        if column_index:
+            names = '|'.join(re.escape(name) for name in column_index)
+            pattern = re.compile(f'<({names})>')
+        return [_StepTemplate(step, pattern, column_index) for step in steps]
+
+
+def _row_values(row: Union['ExampleTableRow', Iterable[str]]) -> List[str]:
+    return row.values if isinstance(row, ExampleTableRow) else list(row)
+
+
+class _ColumnarTable(ABC):
+    """
+    A table whose cells are stored as one list of strings per column.
+    Row objects are only views, created as rows are accessed.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _width(self) -> int:
+        """The number of columns"""
+
+    @abstractmethod
+    def _row_view(self, index: int):
+        """A view of the row at index"""
+
+    def _row_count(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def _check_width(self, values: List[str]):
+        if len(values) != self._width():
+            raise InvalidGherkinError(
+                f'Row has {len(values)} cells, but the table has {self._width()} columns: {values}')
+
+    def _columns_from_rows(self, rows: Iterable[Union['ExampleTableRow', Iterable[str]]]) -> List[List[str]]:
+        rows = [_row_values(row) for row in rows]
+        for values in rows:
+            self._check_width(values)
+        if not rows:
+            return [[] for _ in range(self._width())]
+        return [list(column) for column in zip(*rows)]
+
+    def _insert_row(self, index: int, values: List[str]):
+        self._check_width(values)
+        for column, value in zip(self._columns, values):
+            column.insert(index, value)
+
+
+class _ColumnarRows(MutableSequence):
+    """The rows of a _ColumnarTable, as a list which reads from and writes to its columns"""
+
+    __slots__ = ('_table', )
+
+    def __init__(self, table: _ColumnarTable):
+        self._table = table
+
+    def __len__(self):
+        return self._table._row_count()
+
+    def _index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('Table row index out of range')
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._table._row_view(i) for i in range(*index.indices(len(self)))]
+        return self._table._row_view(self._index(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._table._row_view(index)
+
+    def __setitem__(self, index, row):
+        if isinstance(index, slice):
+            raise TypeError('Table rows do not support slice assignment')
+        index = self._index(index)
+        values = _row_values(row)
+        self._table._check_width(values)
+        for column, value in zip(self._table._columns, values):
+            column[index] = value
+
+    def __delitem__(self, index):
+        if not isinstance(index, slice):
+            index = self._index(index)
+        for column in self._table._columns:
+            del column[index]
+
+    def insert(self, index: int, row):
+        self._table._insert_row(index, _row_values(row))
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _DataTableRow(MutableSequence):
+    """One row of a DataTable, as a list of strings which reads from and writes to the table's columns"""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: DataTable, index: int):
+        self._table = table
+        self._index = index
+
+    def __len__(self):
+        return len(self._table._columns)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [column[self._index] for column in self._table._columns[index]]
+        return self._table._columns[index][self._index]
+
+    def __iter__(self):
+        index = self._index
+        return (column[index] for column in self._table._columns)
+
+    def __setitem__(self, index, value: str):
+        if isinstance(index, slice):
+            raise TypeError('Table rows do not support slice assignment')
+        self._table._columns[index][self._index] = value
+
+    def __delitem__(self, index):
+        raise TypeError('Cannot remove a cell from a row of a table, remove the column instead')
+
+    def insert(self, index, value):
+        raise TypeError('Cannot add a cell to a row of a table, add a column instead')
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class DataTable(_ColumnarTable):
+
+    __slots__ = ('_columns', 'parent')
 
     def __init__(self, rows: List[List[str]], parent: Optional[Step] = None):
         self.rows = rows
         self.parent = parent
 
+    @classmethod
+    def from_columns(cls, columns: List[List[str]], parent: Optional[Step] = None) -> DataTable:
+        """Create a table from the values of each column, which it keeps rather than copies"""
+        table = cls(rows=[], parent=parent)
+        table._columns = columns
+        return table
+
     @classmethod
     def from_text(cls, text: str, parent: Optional[Step] = None) -> DataTable:
         dummy_feature = f'''
@@ -817,11 +1781,7 @@ class DataTable:
         '''
         feature = Feature.from_text(dummy_feature)
         data_table = feature.scenarios[0].steps[0].data_table
-        result = DataTable(
-            rows=data_table.rows,
-            parent=parent,
-        )
-        return result
+        return cls.from_columns(data_table._columns, parent=parent)
 
     @classmethod
     def from_data(cls, data: dict, parent: Optional[Step] = None) -> DataTable:
@@ -834,6 +1794,36 @@ class DataTable:
             rows.append(row)
         return cls(rows=rows, parent=parent)
 
+    @property
+    def rows(self) -> MutableSequence[MutableSequence[str]]:
+        """The rows of the table.  Each row is a view of the table's columns, so changing a row changes the table."""
+        return _ColumnarRows(self)
+
+    @rows.setter
+    def rows(self, rows: Iterable[Iterable[str]]):
+        rows = [list(row) for row in rows]
+        self._columns = [[] for _ in rows[0]] if rows else []
+        self._columns = self._columns_from_rows(rows)
+
+    @property
+    def columns(self) -> List[List[str]]:
+        """The values of each column.  These are the table's own lists, so changing them changes the table."""
+        return self._columns
+
+    def column(self, index: int) -> List[str]:
+        return self._columns[index]
+
+    def _width(self) -> int:
+        return len(self._columns)
+
+    def _row_view(self, index: int) -> _DataTableRow:
+        return _DataTableRow(self, index)
+
+    def _insert_row(self, index: int, values: List[str]):
+        if not self._columns:
+            self._columns = [[] for _ in values]
+        super()._insert_row(index, values)
+
     @property
     def parent_project(self) -> Optional[GherkinProject]:
         return None if self.parent is None else self.parent.parent_project
@@ -855,12 +1845,18 @@ class DataTable:
         return self.parent
 
 
-class ExampleTable:
+class ExampleTable(_ColumnarTable):
+    """
+    The examples of a scenario outline.  The header and the values of each column are stored as lists of strings;
+    `header_row`, `data_rows`, and their cells are views of them, created as they are accessed.
+    """
+
+    __slots__ = ('_header', '_columns', 'tags', 'parent')
 
     def __init__(
         self,
-        header_row: 'ExampleTableRow',
-        data_rows: List['ExampleTableRow'],
+        header_row: Union['ExampleTableRow', List[str]],
+        data_rows: Iterable[Union['ExampleTableRow', List[str]]],
         tags: List['Tag'] = None,
         parent: Optional['Scenario'] = None,
     ):
@@ -870,7 +1866,23 @@ class ExampleTable:
         self.parent = parent
 
     def __len__(self):
-        return len(self.values)
+        return self._row_count() + 1
+
+    @classmethod
+    def from_columns(
+        cls,
+        header: List[str],
+        columns: List[List[str]],
+        tags: List['Tag'] = None,
+        parent: Optional['Scenario'] = None,
+    ) -> 'ExampleTable':
+        """Create a table from its header and the values of each column, which it keeps rather than copies"""
+        if len(columns) != len(header) or len({len(column) for column in columns}) > 1:
+            raise InvalidGherkinError(
+                f'Different column lengths detected, non-square example tables not supported:\n{header}')
+        table = cls(header_row=header, data_rows=[], tags=tags, parent=parent)
+        table._columns = columns
+        return table
 
     @classmethod
     def from_2d_array(
@@ -886,20 +1898,11 @@ class ExampleTable:
                 f'Different row lengths detected, non-square example tables not supported:\n{array}'
             )
 
-        header_array = array[0]
-        header_row = ExampleTableRow.from_array(header_array)
-
-        data_arrays = array[1:]
-        data_rows = [
-            ExampleTableRow.from_array(data_array)
-            for data_array in data_arrays
-        ]
-
         tags = tags or []
         tags = [Tag.from_text(tag_text) for tag_text in tags]
 
-        return cls(header_row=header_row,
-                   data_rows=data_rows,
+        return cls(header_row=array[0],
+                   data_rows=array[1:],
                    tags=tags,
                    parent=parent)
 
@@ -929,40 +1932,93 @@ class ExampleTable:
         header_row_data = data.get('tableHeader', {})
         header_row_data = header_row_data.get('cells', [])
         header_row_values = [cell.get('value', '') for cell in header_row_data]
-        header_row = ExampleTableRow.from_array(header_row_values)
 
         body_rows_data = data.get('tableBody', [])
         body_rows_data = [row.get('cells', []) for row in body_rows_data]
         body_rows_values = []
         for row in body_rows_data:
             body_rows_values.append([cell.get('value', '') for cell in row])
-        body_rows = [
-            ExampleTableRow.from_array(row_values)
-            for row_values in body_rows_values
-        ]
 
         tags = [Tag.from_data(tag_data) for tag_data in data.get('tags', [])]
 
-        return cls(header_row=header_row,
-                   data_rows=body_rows,
+        return cls(header_row=header_row_values,
+                   data_rows=body_rows_values,
                    tags=tags,
                    parent=parent)
 
+    @property
+    def header_row(self) -> 'ExampleTableRow':
+        return ExampleTableRow._view(self, None)
+
+    @header_row.setter
+    def header_row(self, header_row: Union['ExampleTableRow', List[str]]):
+        self._header = _row_values(header_row)
+
+    @property
+    def data_rows(self) -> MutableSequence['ExampleTableRow']:
+        """The data rows of the table.  Adding, removing, or changing rows changes the table."""
+        return _ColumnarRows(self)
+
+    @data_rows.setter
+    def data_rows(self, data_rows: Iterable[Union['ExampleTableRow', List[str]]]):
+        self._columns = self._columns_from_rows(data_rows)
+
+    def _width(self) -> int:
+        return len(self._header)
+
+    def _row_view(self, index: int) -> 'ExampleTableRow':
+        return ExampleTableRow._view(self, index)
+
+    def add_row(self, values: Union['ExampleTableRow', List[str]], position: int = None):
+        values = _row_values(values)
+        self._insert_row(self._row_count() if position is None else position, values)
+
+    def extend_rows(self, rows: Iterable[Union['ExampleTableRow', List[str]]]):
+        if isinstance(rows, _ColumnarRows) and isinstance(rows._table, ExampleTable):
+            if rows._table._width() != self._width():
+                raise InvalidGherkinError(
+                    f'Cannot add rows with {rows._table._width()} cells to a table with {self._width()} columns')
+            for column, other_column in zip(self._columns, rows._table._columns):
+                column.extend(other_column)
+            return
+        rows = [_row_values(row) for row in rows]
+        for values in rows:
+            self._check_width(values)
+        for column, values in zip(self._columns, zip(*rows)):
+            column.extend(values)
+
+    def column(self, name: Union[str, int]) -> List[str]:
+        """
+        The values of a column, by name or position, without the header.
+        This is the table's own list, so changing it changes the table.
+        """
+        if isinstance(name, int):
+            return self._columns[name]
+        try:
+            return self._columns[self._header.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    @property
+    def columns(self) -> List[List[str]]:
+        """The values of each column, without the header"""
+        return self._columns
+
     @property
     def rows(self) -> List['ExampleTableRow']:
-        return [self.header_row] + self.data_rows
+        return [self.header_row] + list(self.data_rows)
 
     @property
     def values(self) -> List[List[str]]:
-        return [row.values for row in self.rows]
+        return [self.header_values] + self.data_values
 
     @property
     def header_values(self) -> List[str]:
-        return self.header_row.values
+        return list(self._header)
 
     @property
     def data_values(self) -> List[List[str]]:
-        return [row.values for row in self.data_rows]
+        return [list(row) for row in zip(*self._columns)]
 
     @property
     def table_row_params(self) -> List[List[Tuple[str, str]]]:
@@ -972,8 +2028,8 @@ class ExampleTable:
         Each cell in this 2D list represents a param
         Each param is a Tuple of the form (param_name, param_value)
         """
-        param_names = self.header_row.values
-        return [row.row_params(param_names) for row in self.data_rows]
+        header = self._header
+        return [list(zip(header, row)) for row in zip(*self._columns)]
 
     @property
     def column_names(self) -> List[str]:
@@ -981,15 +2037,7 @@ class ExampleTable:
 
     @property
     def column_values(self) -> List[Dict[str, List[str]]]:
-        column_names = self.header_row.values
-        columns = [{column_name: []} for column_name in column_names]
-        for row in self.data_rows:
-            for column_index, cell in enumerate(row.cells):
-                column_name = column_names[column_index]
-                column_values = columns[column_index][column_name]
-                column_values.append(cell.value)
-                columns[column_index][column_name] = column_values
-        return columns
+        return [{name: list(column)} for name, column in zip(self._header, self._columns)]
 
     @property
     def parent_project(self) -> Optional['GherkinProject']:
@@ -1017,17 +2065,37 @@ class ExampleTable:
 
 
 class ExampleTableRow:
+    """
+    A row of cells.  A row which belongs to an ExampleTable is a view of the table's columns: its cells read from and
+    write to the table, and it is only valid until rows are added to or removed from the table before it.
+    """
+
+    __slots__ = ('_cells', '_table', '_index', 'parent')
 
     def __init__(
         self,
         cells: List['ExampleTableCell'],
         parent: 'ExampleTable' = None,
     ):
-        self.cells = cells
+        self._cells = cells
+        self._table: Optional[ExampleTable] = None
+        self._index: Optional[int] = None
         self.parent = parent
 
+    @classmethod
+    def _view(cls, table: ExampleTable, index: Optional[int]) -> 'ExampleTableRow':
+        """A view of a data row of a table, or of its header row if index is None"""
+        row = cls.__new__(cls)
+        row._cells = None
+        row._table = table
+        row._index = index
+        row.parent = table
+        return row
+
     def __len__(self):
-        return len(self.cells)
+        if self._table is not None:
+            return self._table._width()
+        return len(self._cells)
 
     @classmethod
     def from_array(cls,
@@ -1043,9 +2111,26 @@ class ExampleTableRow:
         return cls.from_array([cell_data['value'] for cell_data in data],
                               parent=parent)
 
+    @property
+    def cells(self) -> List['ExampleTableCell']:
+        if self._table is not None:
+            return [ExampleTableCell._view(self, column) for column in range(self._table._width())]
+        return self._cells
+
+    @cells.setter
+    def cells(self, cells: List['ExampleTableCell']):
+        if self._table is not None:
+            raise TypeError('Cannot replace the cells of a row of a table, set the row in the table instead')
+        self._cells = cells
+
     @property
     def values(self) -> List[str]:
-        return [cell.value for cell in self.cells]
+        if self._table is None:
+            return [cell.value for cell in self._cells]
+        if self._index is None:
+            return list(self._table._header)
+        index = self._index
+        return [column[index] for column in self._table._columns]
 
     def row_params(self, param_names: List[str]) -> List[Tuple[str, str]]:
         """
@@ -1059,22 +2144,56 @@ class ExampleTableRow:
         return list(zip(param_names, self.values))
 
     def add_cell(self, value: str = '', position: int = None):
+        if self._table is not None:
+            raise TypeError('Cannot add a cell to a row of a table, add a column instead')
         if position is None:
-            self.cells.append(ExampleTableCell(value))
+            self._cells.append(ExampleTableCell(value))
         else:
-            self.cells.insert(position, ExampleTableCell(value))
+            self._cells.insert(position, ExampleTableCell(value))
 
 
 class ExampleTableCell:
+    """A cell of a row.  A cell of a row of an ExampleTable reads from and writes to the table."""
+
+    __slots__ = ('_value', '_column', 'parent')
 
     def __init__(
         self,
         value: str,
         parent: 'ExampleTableRow' = None,
     ):
-        self.value = value
+        self._value = value
+        self._column: Optional[int] = None
         self.parent = parent
 
+    @classmethod
+    def _view(cls, row: ExampleTableRow, column: int) -> 'ExampleTableCell':
+        cell = cls.__new__(cls)
+        cell._value = None
+        cell._column = column
+        cell.parent = row
+        return cell
+
+    @property
+    def value(self) -> str:
+        if self._column is None:
+            return self._value
+        row = self.parent
+        if row._index is None:
+            return row._table._header[self._column]
+        return row._table._columns[self._column][row._index]
+
+    @value.setter
+    def value(self, value: str):
+        if self._column is None:
+            self._value = value
+            return
+        row = self.parent
+        if row._index is None:
+            row._table._header[self._column] = value
+        else:
+            row._table._columns[self._column][row._index] = value
+
 
 class Tag:
     """
@@ -1082,19 +2201,27 @@ class Tag:
     Can occur before a Feature, Background, Scenario, ScenarioOutline, or ExampleTable
     """
 
+    __slots__ = ('text', 'tag_id', 'parent')
+
     def __init__(
         self,
         text: str,
         parent: Union['Feature', 'Scenario', 'ExampleTable'] = None,
+        tag_id: Optional[int] = None,
     ):
+        """
+        :param tag_id: The id of the text in the project's SymbolTable, if it has been interned
+        """
         self.text = text if text.strip().startswith('@') else f'@{text}'
+        self.tag_id = tag_id
         self.parent = parent
 
     def __eq__(self, other):
+        # Interned texts are the same object, so this is a pointer comparison for tags in a project
         return self.text == other.text
 
     def __hash__(self):
-        return hash(''.join([self.text, str(id(self.parent))]))
+        return hash((self.text, id(self.parent)))
 
     @classmethod
     def from_text(
@@ -1127,6 +2254,8 @@ class Comment:
     Inline comments are not allowed in Gherkin
     """
 
+    __slots__ = ('text', 'parent')
+
     def __init__(
         self,
         text: str,
@@ -1149,6 +2278,37 @@ class Comment:
         raise NotImplementedError
 
 
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(mtime, size, inode) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _read_and_parse_feature_file(
+    path: str,
+    cache: Optional[ParseCache] = None,
+    tag_filter: Optional[GherkinTagFilter] = None,
+) -> Tuple[Optional[str], Optional[Feature], Optional[InvalidGherkinError], Optional[Tuple[int, int, int]]]:
+    """
+    Process pool entry point: read and parse a single file, returning any Gherkin error instead of raising it.
+    With a tag_filter, a file none of whose scenarios could match is not parsed, and neither text nor feature is
+    returned.
+    """
+    signature = _file_signature(path)
+    with open(path, 'r') as file:
+        text = file.read()
+    if tag_filter is not None and not tag_filter.could_match_text(text):
+        return None, None, None, signature
+    try:
+        feature = cache.feature_from_text(text) if cache is not None else Feature.from_text(text)
+        return text, feature, None, signature
+    except InvalidGherkinError as e:
+        return text, None, e, signature
+
+
 # Errors ----------------------------------------------------------------------
 
 
@@ -0,0 +1,317 @@
+"""
+Resolve the include and exclude patterns of a GherkinProjectConfig into feature file paths.
+
+Every pattern is compiled into a matcher over path segments.  All the patterns are then resolved by a single
+os.scandir walk of each distinct root directory, which skips directories that no include pattern can match and
+prunes directories that an exclude pattern removes entirely.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import re
+import stat
+
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__package__)
+
+_MAGIC = re.compile(r'[*?[]')
+
+# The remaining segments of an exclude pattern which remove every feature file below the current directory
+_EXCLUDES_EVERYTHING = (('**', ), ('**', '*'), ('**', '*.feature'))
+
+
+def _has_magic(segment: str) -> bool:
+    return _MAGIC.search(segment) is not None
+
+
+def _is_hidden(name: str) -> bool:
+    return name.startswith('.')
+
+
+class _Segment:
+    """One component of a glob pattern, between path separators"""
+
+    __slots__ = ('text', 'is_recursive', 'is_hidden', '_regex')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.is_recursive = text == '**'
+        self.is_hidden = _is_hidden(text)
+        self._regex = re.compile(fnmatch.translate(text)) if _has_magic(text) else None
+
+    def matches(self, name: str) -> bool:
+        if self._regex is None:
+            return name == self.text
+        # Like glob, wildcards do not match hidden names unless the pattern itself is hidden
+        if _is_hidden(name) and not self.is_hidden:
+            return False
+        return self._regex.match(name) is not None
+
+
+class GlobPattern:
+    """
+    A glob pattern, split into the literal directory it starts from and a matcher for the paths below it.
+    Matching behaves like glob.glob(pattern, recursive=True), restricted to files.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        parts = pattern.split(os.sep)
+        root_parts = []
+        while len(parts) > 1 and not _has_magic(parts[0]):
+            root_parts.append(parts.pop(0))
+        root = os.sep.join(root_parts)
+        if root_parts and not root:
+            # An absolute pattern rooted at the filesystem root
+            root = os.sep
+        self.root = root if root == os.sep else root.rstrip(os.sep)
+        self.segments = [_Segment(part) for part in parts if part]
+
+    def __repr__(self):
+        return f'GlobPattern({self.pattern!r})'
+
+    def initial_states(self) -> FrozenSet[int]:
+        return self._closure({0})
+
+    def _closure(self, states) -> FrozenSet[int]:
+        """Add the states reachable by letting a ** match zero directories"""
+        result = set(states)
+        pending = list(states)
+        while pending:
+            state = pending.pop()
+            if state < len(self.segments) and self.segments[state].is_recursive and state + 1 not in result:
+                result.add(state + 1)
+                pending.append(state + 1)
+        return frozenset(result)
+
+    def step(self, states: FrozenSet[int], name: str) -> FrozenSet[int]:
+        """The states after matching one more path component"""
+        result = set()
+        for state in states:
+            if state >= len(self.segments):
+                continue
+            segment = self.segments[state]
+            if segment.is_recursive:
+                if not _is_hidden(name):
+                    result.add(state)
+            elif segment.matches(name):
+                result.add(state + 1)
+        return self._closure(result) if result else frozenset()
+
+    def matches_file(self, states: FrozenSet[int], name: str) -> bool:
+        return len(self.segments) in self.step(states, name)
+
+    def remaining(self, state: int) -> Tuple[str, ...]:
+        return tuple(segment.text for segment in self.segments[state:])
+
+
+class PathResolver:
+    """
+    Resolve include and exclude patterns into a sorted list of files
+
+    Each pattern may be a file, a directory (meaning every feature file below it), or a glob pattern.
+    Files named directly by an include pattern are kept unless an exclude pattern names the same file.
+    """
+
+    def __init__(self, include: List[str], exclude: List[str]):
+        self.include = include
+        self.exclude = exclude
+        # Every directory listed by the last call to resolve, for callers that fingerprint the result
+        self.visited_directories: List[str] = []
+
+    @staticmethod
+    def _classify(patterns: List[str]) -> Tuple[List[str], List[Tuple[str, GlobPattern]]]:
+        """Split patterns into existing files, and globs (directories become a glob of their feature files)"""
+        files, globs = [], []
+        for pattern in patterns:
+            try:
+                mode = os.stat(pattern).st_mode
+            except (OSError, ValueError):
+                mode = None
+            if mode is not None and stat.S_ISREG(mode):
+                files.append(pattern)
+            elif mode is not None and stat.S_ISDIR(mode):
+                globs.append((pattern, GlobPattern(os.path.join(pattern, '**', '*.feature'))))
+            else:
+                globs.append((pattern, GlobPattern(pattern)))
+        return files, globs
+
+    def resolve(self) -> List[str]:
+        include_files, include_globs = self._classify(self.include)
+        exclude_files, exclude_globs = self._classify(self.exclude)
+        excluded_files = set(exclude_files)
+
+        includes = [glob for _, glob in include_globs]
+        excludes = [glob for _, glob in exclude_globs]
+        matches: Dict[int, int] = {id(glob): 0 for glob in includes}
+
+        self.visited_directories = []
+        found: Set[str] = set()
+        for root in self._walk_roots(includes):
+            self._walk(root, includes, excludes, found, matches)
+
+        for pattern, glob in include_globs:
+            if matches[id(glob)] == 0:
+                if os.path.isdir(pattern):
+                    logger.warning(f'No features found in dir: {pattern}')
+                else:
+                    logger.warning(f'Failed to find features: {pattern}')
+
+        paths = {path for path in include_files if path not in excluded_files}
+        paths.update(path for path in found if path not in excluded_files)
+        return sorted(paths)
+
+    @staticmethod
+    def _relative_segments(root: str, path: str) -> Optional[List[str]]:
+        """
+        The directory names leading from root to path, if path is textually below root.
+        Paths that only reach each other through '.', '..', or repeated separators are not considered related.
+        """
+        if root == path:
+            return []
+        if root == '':
+            prefix = ''
+            if os.path.isabs(path):
+                return None
+        else:
+            prefix = root if root.endswith(os.sep) else root + os.sep
+            if not path.startswith(prefix):
+                return None
+        segments = path[len(prefix):].split(os.sep)
+        if any(segment in ('', '.', '..') for segment in segments):
+            return None
+        return segments
+
+    def _walk_roots(self, includes: List[GlobPattern]) -> List[str]:
+        """The include roots which are not below another include root"""
+        roots = sorted({glob.root for glob in includes})
+        return [
+            root for root in roots
+            if not any(other != root and self._relative_segments(other, root) is not None for other in roots)
+        ]
+
+    def _walk(self,
+              walk_root: str,
+              includes: List[GlobPattern],
+              excludes: List[GlobPattern],
+              found: Set[str],
+              matches: Dict[int, int]):
+        # Patterns which start at or above the walk root are active from the start.  Patterns which start below it
+        # are activated when the walk reaches their root.
+        include_ids = {id(glob) for glob in includes}
+        initial: List[Tuple[GlobPattern, FrozenSet[int]]] = []
+        pending: Dict[str, List[GlobPattern]] = {}
+        for glob in includes + excludes:
+            segments = self._relative_segments(glob.root, walk_root)
+            if segments is not None:
+                states = glob.initial_states()
+                for segment in segments:
+                    states = glob.step(states, segment)
+                if states:
+                    initial.append((glob, states))
+                continue
+            if self._relative_segments(walk_root, glob.root) is not None:
+                pending.setdefault(glob.root, []).append(glob)
+        pending_include_roots = {glob.root for glob in includes if glob.root in pending}
+
+        visited_inodes = set()
+        stack = [(walk_root, initial)]
+        while stack:
+            directory, active = stack.pop()
+            active = active + [(glob, glob.initial_states()) for glob in pending.get(directory, [])]
+            if not any(id(glob) in include_ids for glob, _ in active):
+                continue
+
+            try:
+                directory_stat = os.stat(directory or os.curdir)
+            except OSError:
+                continue
+            if (directory_stat.st_dev, directory_stat.st_ino) in visited_inodes:
+                # A symlink loop
+                continue
+            visited_inodes.add((directory_stat.st_dev, directory_stat.st_ino))
+
+            try:
+                with os.scandir(directory or os.curdir) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            self.visited_directories.append(directory)
+
+            for entry in entries:
+                path = os.path.join(directory, entry.name) if directory else entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    child_active = []
+                    for glob, states in active:
+                        child_states = glob.step(states, entry.name)
+                        if child_states:
+                            child_active.append((glob, child_states))
+                    if self._is_excluded_directory(child_active, include_ids):
+                        continue
+                    has_include = any(id(glob) in include_ids for glob, _ in child_active)
+                    if has_include or self._has_root_below(path, pending_include_roots):
+                        stack.append((path, child_active))
+                    continue
+
+                included = [glob for glob, states in active
+                            if id(glob) in include_ids and glob.matches_file(states, entry.name)]
+                if not included:
+                    continue
+                if any(glob.matches_file(states, entry.name)
+                       for glob, states in active if id(glob) not in include_ids):
+                    continue
+                found.add(path)
+                for glob in included:
+                    matches[id(glob)] += 1
+
+    def _has_root_below(self, directory: str, roots: Set[str]) -> bool:
+        return any(self._relative_segments(directory, root) is not None for root in roots)
+
+    @staticmethod
+    def _is_excluded_directory(active: List[Tuple[GlobPattern, FrozenSet[int]]], include_ids: Set[int]) -> bool:
+        """Whether an exclude pattern removes every file that the active include patterns could find below here"""
+        excludes_everything = None
+        for glob, states in active:
+            if id(glob) in include_ids:
+                continue
+            for state in states:
+                if glob.remaining(state) in _EXCLUDES_EVERYTHING:
+                    if excludes_everything is None or glob.remaining(state) != ('**', '*.feature'):
+                        excludes_everything = glob.remaining(state)
+        if excludes_everything is None:
+            return False
+
+        for glob, states in active:
+            if id(glob) not in include_ids:
+                continue
+            for state in states:
+                remaining = glob.remaining(state)
+                # Wildcards never match hidden names, but a literal hidden name in the include pattern could
+                if any(_is_hidden(segment) for segment in remaining):
+                    return False
+                if excludes_everything[-1] == '*.feature' and not (remaining and remaining[-1].endswith('.feature')):
+                    return False
+        return True
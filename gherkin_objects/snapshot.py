@@ -0,0 +1,194 @@
+"""
+Save a parsed GherkinProject to a single file, so that short-lived tools can load it without parsing every file again.
+
+A snapshot is laid out as:
+
+    header   magic, format version, and the offset and length of the index
+    blobs    one pickled (text, feature) pair per file
+    index    a pickled list of (path, content hash, file signature, blob offset, blob length), in project order
+
+Loading a snapshot reads only the header and the index.  Each file's blob is unpickled when its text or feature is
+first accessed.  A file whose stat no longer matches the snapshot is read and hashed, and if its contents changed
+too, it is parsed from disk instead.  Like any pickle, only load a snapshot from a trusted source.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+from typing import List, Optional, Tuple, Type
+
+from gherkin_objects.cache import _package_version
+from gherkin_objects.objects import (
+    Feature,
+    FeatureFile,
+    GherkinProject,
+    InvalidGherkinError,
+    _file_signature,
+)
+
+logger = logging.getLogger(__package__)
+
+MAGIC = b'GHKNSNAP'
+FORMAT_VERSION = 1
+
+# magic, format version, index offset, index length
+_HEADER = struct.Struct('>8sHQQ')
+
+# path, sha256 of the text, (mtime, size, inode) of the file, blob offset, blob length
+_IndexEntry = Tuple[str, bytes, Optional[Tuple[int, int, int]], int, int]
+
+
+class InvalidSnapshotError(Exception):
+    pass
+
+
+def _versions() -> Tuple[str, str]:
+    """Pickled features are only readable by the versions that wrote them"""
+    return _package_version('gherkin-objects'), _package_version('gherkin-official')
+
+
+def _content_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode('utf-8')).digest()
+
+
+def save_snapshot(project: GherkinProject, path: str):
+    """
+    Write every file of a project to a snapshot.  Files which the project has not loaded are read and parsed, but
+    not kept.  The snapshot is written to a temporary file and renamed into place.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0))
+            index: List[_IndexEntry] = []
+            for feature_file in project.feature_files:
+                if feature_file.is_loaded:
+                    text, feature, signature = feature_file.text, feature_file.feature, feature_file.signature
+                else:
+                    text, signature = feature_file.read_with_signature()
+                    feature = feature_file.parse(text)
+
+                # Never pickle the FeatureFile and project above the feature
+                parent, feature.parent = feature.parent, None
+                try:
+                    blob = pickle.dumps((text, feature), protocol=pickle.HIGHEST_PROTOCOL)
+                finally:
+                    feature.parent = parent
+
+                index.append((feature_file.path, _content_hash(text), signature, file.tell(), len(blob)))
+                file.write(blob)
+
+            index_offset = file.tell()
+            index_data = pickle.dumps({'versions': _versions(), 'entries': index}, protocol=pickle.HIGHEST_PROTOCOL)
+            file.write(index_data)
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, index_offset, len(index_data)))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _BlobLoader:
+    """Unpickles one file's contents from a snapshot, each time it is called"""
+
+    __slots__ = ('_data', '_offset', '_length')
+
+    def __init__(self, data: mmap.mmap, offset: int, length: int):
+        self._data = data
+        self._offset = offset
+        self._length = length
+
+    def __call__(self) -> Tuple[str, Feature]:
+        return pickle.loads(self._data[self._offset:self._offset + self._length])
+
+
+def _read_index(data: mmap.mmap, path: str) -> Tuple[Tuple[str, str], List[_IndexEntry]]:
+    if len(data) < _HEADER.size:
+        raise InvalidSnapshotError(f'Not a snapshot: {path}')
+    magic, version, index_offset, index_length = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise InvalidSnapshotError(f'Not a snapshot: {path}')
+    if version != FORMAT_VERSION:
+        raise InvalidSnapshotError(f'Unsupported snapshot format version {version}: {path}')
+    if index_offset < _HEADER.size or index_offset + index_length > len(data):
+        raise InvalidSnapshotError(f'Truncated snapshot: {path}')
+    try:
+        index = pickle.loads(data[index_offset:index_offset + index_length])
+    except (EOFError, pickle.UnpicklingError) as e:
+        raise InvalidSnapshotError(f'Corrupt snapshot index: {path}: {e}')
+    return tuple(index['versions']), index['entries']
+
+
+def load_snapshot(path: str, project_class: Type[GherkinProject] = GherkinProject, **kwargs) -> GherkinProject:
+    """
+    Create a project from a snapshot.  Keyword arguments are passed to the project.
+
+    Files which no longer exist are left out.  Files which changed since the snapshot was saved are parsed again,
+    or in a lazy project, when they are first accessed.  Files which are no longer valid Gherkin are collected in
+    the project's `errors`.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise InvalidSnapshotError(f'Not a snapshot: {path}')
+        # The mapping stays valid after the file is closed, or replaced by a newer snapshot
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    versions, entries = _read_index(data, path)
+    versions_match = versions == _versions()
+    if not versions_match:
+        logger.warning(f'Snapshot was saved by other versions of gherkin-objects and gherkin-official, '
+                       f'parsing every file again: {path}')
+
+    project = project_class(paths=[], **kwargs)
+    feature_files = []
+    for file_path, content_hash, signature, offset, length in entries:
+        current_signature = _file_signature(file_path)
+        if current_signature is None:
+            logger.info(f'Removed since the snapshot was saved: {file_path}')
+            continue
+
+        feature_file = FeatureFile(file_path, parent=project, lazy=True, cache=project.cache)
+        loader = _BlobLoader(data, offset, length) if versions_match else None
+        if loader is not None and current_signature != signature:
+            # The stat changes when a file is touched or copied, even if its contents do not
+            text, current_signature = feature_file.read_with_signature()
+            if _content_hash(text) != content_hash:
+                loader = None
+
+        if loader is not None:
+            feature_file.defer(loader, signature=current_signature)
+        elif not project.lazy:
+            try:
+                feature_file.refresh()
+            except InvalidGherkinError as e:
+                project.record_error(file_path, e)
+                continue
+        feature_files.append(feature_file)
+
+    project.feature_files = feature_files
+    return project
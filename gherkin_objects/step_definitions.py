@@ -0,0 +1,403 @@
+"""
+Match a project's steps against step definitions, to find the steps which are undefined or ambiguous.
+
+A step definition is either a regular expression or a Cucumber expression.  As in Cucumber, a pattern which starts
+with ^ or ends with $, or is written as /pattern/, is a regular expression, and anything else is a Cucumber
+expression.
+
+Rather than trying every definition against every step, the matcher groups the definitions by the first word of
+their literal prefix, so each step is only tried against the definitions which start with its first word, and the
+few which do not start with a literal word.  A definition whose literal prefix the step does not start with is
+skipped without running its regular expression.  The definitions found for each step text are cached, so matching
+again after a few files have changed only matches the new step texts.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import re
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from gherkin_objects.objects import GherkinProject, Step, StepType
+
+# The built in parameter types of Cucumber expressions
+PARAMETER_TYPES: Dict[str, str] = {
+    'int': r'-?\d+',
+    'float': r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?',
+    'word': r'[^\s]+',
+    'string': r'"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\'',
+    '': r'.*',
+    'bigdecimal': r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?',
+    'double': r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?',
+    'biginteger': r'-?\d+',
+    'byte': r'-?\d+',
+    'short': r'-?\d+',
+    'long': r'-?\d+',
+}
+
+# Characters which end the literal prefix of a regular expression
+_REGEX_SPECIAL = set('.^$*+?{}[]|()')
+
+
+class InvalidStepDefinitionError(Exception):
+    pass
+
+
+def is_regex(pattern: str) -> bool:
+    """Whether Cucumber would treat a pattern as a regular expression rather than a Cucumber expression"""
+    return pattern.startswith('^') or pattern.endswith('$') or (
+        len(pattern) > 1 and pattern.startswith('/') and pattern.endswith('/'))
+
+
+def _find_unescaped(text: str, char: str, start: int) -> int:
+    i = start
+    while i < len(text):
+        if text[i] == '\\':
+            i += 2
+            continue
+        if text[i] == char:
+            return i
+        i += 1
+    return -1
+
+
+def _split_unescaped(text: str, char: str) -> List[str]:
+    parts, start = [], 0
+    while True:
+        end = _find_unescaped(text, char, start)
+        if end < 0:
+            parts.append(text[start:])
+            return parts
+        parts.append(text[start:end])
+        start = end + 1
+
+
+def _split_words(expression: str) -> List[str]:
+    """
+    Split a Cucumber expression into words and the whitespace between them.  Optional text and parameters are kept
+    whole, even if they contain whitespace.
+    """
+    parts, start, i = [], 0, 0
+    while i < len(expression):
+        char = expression[i]
+        if char == '\\':
+            i += 2
+        elif char in '({':
+            end = _find_unescaped(expression, ')' if char == '(' else '}', i + 1)
+            # Left to _translate_word to report, if unclosed
+            i = len(expression) if end < 0 else end + 1
+        elif char.isspace():
+            end = i
+            while end < len(expression) and expression[end].isspace():
+                end += 1
+            parts += [expression[start:i], expression[i:end]]
+            start = i = end
+        else:
+            i += 1
+    parts.append(expression[start:])
+    return parts
+
+
+def _translate_word(word: str, parameter_types: Dict[str, str]) -> Tuple[str, str, bool]:
+    """
+    Translate one whitespace delimited word of a Cucumber expression.  Optional text in it may contain whitespace.
+    :return: The regular expression, the literal text it starts with, and whether it is only literal text
+    """
+    regex, literal = [], []
+    is_literal = True
+    i = 0
+    while i < len(word):
+        char = word[i]
+        if char == '\\' and i + 1 < len(word):
+            regex.append(re.escape(word[i + 1]))
+            if is_literal:
+                literal.append(word[i + 1])
+            i += 2
+        elif char == '(':
+            end = _find_unescaped(word, ')', i + 1)
+            if end < 0:
+                raise InvalidStepDefinitionError(f'Unclosed optional text in: {word}')
+            optional, _, _ = _translate_word(word[i + 1:end], parameter_types)
+            regex.append(f'(?:{optional})?')
+            is_literal = False
+            i = end + 1
+        elif char == '{':
+            end = _find_unescaped(word, '}', i + 1)
+            if end < 0:
+                raise InvalidStepDefinitionError(f'Unclosed parameter in: {word}')
+            name = word[i + 1:end]
+            if name not in parameter_types:
+                raise InvalidStepDefinitionError(f'Undefined parameter type: {{{name}}}')
+            regex.append(f'({parameter_types[name]})')
+            is_literal = False
+            i = end + 1
+        else:
+            regex.append(re.escape(char))
+            if is_literal:
+                literal.append(char)
+            i += 1
+    return ''.join(regex), ''.join(literal), is_literal
+
+
+def translate_cucumber_expression(expression: str,
+                                  parameter_types: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+    """
+    Translate a Cucumber expression into an anchored regular expression
+    :param parameter_types: Regular expressions of custom {parameter} types, in addition to the built in ones
+    :return: The regular expression, and the literal text that every match starts with
+    """
+    types = dict(PARAMETER_TYPES, **(parameter_types or {}))
+    regex, literal = [], []
+    is_literal = True
+    for part in _split_words(expression):
+        if not part:
+            continue
+        if part.isspace():
+            regex.append(re.escape(part))
+            if is_literal:
+                literal.append(part)
+            continue
+        alternatives = _split_unescaped(part, '/')
+        if len(alternatives) > 1:
+            regex.append('(?:' + '|'.join(_translate_word(alternative, types)[0] for alternative in alternatives) + ')')
+            is_literal = False
+            continue
+        word_regex, word_literal, word_is_literal = _translate_word(part, types)
+        regex.append(word_regex)
+        if is_literal:
+            literal.append(word_literal)
+            is_literal = word_is_literal
+    return '^' + ''.join(regex) + '$', ''.join(literal)
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth, in_class, i = 0, False, 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def regex_literal_prefix(pattern: str) -> str:
+    """The literal text that every match of an anchored regular expression starts with, possibly empty"""
+    if not pattern.startswith('^') or _has_top_level_alternation(pattern):
+        return ''
+    literal = []
+    i = 1
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                break
+            char, length = pattern[i + 1], 2
+        elif char in _REGEX_SPECIAL:
+            break
+        else:
+            length = 1
+        following = pattern[i + length:i + length + 1]
+        if following and following in '*?{':
+            # The character is optional
+            break
+        literal.append(char)
+        if following == '+':
+            break
+        i += length
+    return ''.join(literal)
+
+
+class StepDefinition:
+    """
+    A pattern that steps are matched against, with whatever identifies the code that implements it
+    :param step_type: Only match steps of this type.  By default, as in Cucumber, steps of any type are matched.
+    """
+
+    def __init__(self,
+                 pattern: Union[str, re.Pattern],
+                 step_type: Optional[StepType] = None,
+                 location: Optional[str] = None,
+                 parameter_types: Optional[Dict[str, str]] = None):
+        self.pattern = pattern
+        self.step_type = step_type
+        self.location = location
+        if isinstance(pattern, re.Pattern):
+            self.regex = pattern
+            flags_change_literals = pattern.flags & (re.IGNORECASE | re.VERBOSE)
+            self.literal_prefix = '' if flags_change_literals else regex_literal_prefix(pattern.pattern)
+        elif is_regex(pattern):
+            source = pattern[1:-1] if pattern.startswith('/') and pattern.endswith('/') else pattern
+            try:
+                self.regex = re.compile(source)
+            except re.error as e:
+                raise InvalidStepDefinitionError(f'Invalid regular expression: {pattern}: {e}')
+            self.literal_prefix = regex_literal_prefix(source)
+        else:
+            source, self.literal_prefix = translate_cucumber_expression(pattern, parameter_types)
+            self.regex = re.compile(source)
+
+    def __repr__(self):
+        return f'StepDefinition({self.pattern!r})'
+
+    @property
+    def first_word(self) -> Optional[str]:
+        """The first word of every step this matches, if its literal prefix spans a whole word"""
+        word, separator, _ = self.literal_prefix.partition(' ')
+        return word if separator and word else None
+
+    def matches(self, text: str, step_type: Optional[StepType] = None) -> bool:
+        """Whether a step's text, without its keyword, matches"""
+        if self.step_type is not None and step_type is not None and step_type != self.step_type:
+            return False
+        return text.startswith(self.literal_prefix) and self.regex.search(text) is not None
+
+
+class StepMatchResult(NamedTuple):
+    """The definitions which a step matches"""
+    text: str
+    step_type: Optional[StepType]
+    definitions: Tuple[StepDefinition, ...]
+
+    @property
+    def is_matched(self) -> bool:
+        return len(self.definitions) == 1
+
+    @property
+    def is_undefined(self) -> bool:
+        return not self.definitions
+
+    @property
+    def is_ambiguous(self) -> bool:
+        return len(self.definitions) > 1
+
+    @property
+    def definition(self) -> Optional[StepDefinition]:
+        """The definition of a matched step"""
+        return self.definitions[0] if self.is_matched else None
+
+
+class StepMatchReport:
+    """The results of matching a set of steps, by canonical step text"""
+
+    def __init__(self, results: Dict[str, StepMatchResult]):
+        self.results = results
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, text: str) -> StepMatchResult:
+        return self.results[text]
+
+    @property
+    def matched(self) -> List[StepMatchResult]:
+        return [result for result in self.results.values() if result.is_matched]
+
+    @property
+    def unmatched(self) -> List[StepMatchResult]:
+        return [result for result in self.results.values() if result.is_undefined]
+
+    @property
+    def ambiguous(self) -> List[StepMatchResult]:
+        return [result for result in self.results.values() if result.is_ambiguous]
+
+
+class StepMatcher:
+    """
+    Matches steps against a set of step definitions, caching the definitions found for each step text
+    """
+
+    def __init__(self, definitions: Iterable[StepDefinition] = ()):
+        self.definitions: List[StepDefinition] = []
+        # id(definition) -> the order it was added in, which matching definitions are reported in
+        self._order: Dict[int, int] = {}
+        self._by_first_word: Dict[str, List[StepDefinition]] = {}
+        # Definitions which do not start with a literal word, which every step is tried against
+        self._unkeyed: List[StepDefinition] = []
+        self._cache: Dict[Tuple[Optional[StepType], str], Tuple[StepDefinition, ...]] = {}
+        for definition in definitions:
+            self.add(definition)
+
+    def add(self, definition: StepDefinition):
+        """Add a definition, matching it against the step texts already cached"""
+        self._order[id(definition)] = len(self.definitions)
+        self.definitions.append(definition)
+        first_word = definition.first_word
+        if first_word is None:
+            self._unkeyed.append(definition)
+        else:
+            self._by_first_word.setdefault(first_word, []).append(definition)
+        for key, definitions in self._cache.items():
+            step_type, text = key
+            if definition.matches(text, step_type):
+                self._cache[key] = definitions + (definition, )
+
+    def clear_cache(self):
+        self._cache = {}
+
+    def _candidates(self, text: str) -> List[StepDefinition]:
+        keyed = self._by_first_word.get(text.split(' ', 1)[0])
+        return keyed + self._unkeyed if keyed else self._unkeyed
+
+    def match_text(self, text: str, step_type: Optional[StepType] = None) -> Tuple[StepDefinition, ...]:
+        """The definitions which a step's text, without its keyword, matches"""
+        key = (step_type, text)
+        definitions = self._cache.get(key)
+        if definitions is None:
+            matches = [definition for definition in self._candidates(text) if definition.matches(text, step_type)]
+            if len(matches) > 1:
+                matches.sort(key=lambda definition: self._order[id(definition)])
+            definitions = self._cache[key] = tuple(matches)
+        return definitions
+
+    def match(self, step: Step) -> StepMatchResult:
+        return StepMatchResult(step.real_text,
+                               step.step_type,
+                               self.match_text(step.text_without_keyword, step.step_type))
+
+    def match_steps(self, steps: Iterable[Step]) -> StepMatchReport:
+        """Match each distinct step in steps"""
+        results: Dict[str, StepMatchResult] = {}
+        for step in steps:
+            if step.real_text not in results:
+                results[step.real_text] = self.match(step)
+        return StepMatchReport(results)
+
+    def match_project(self, project: GherkinProject, decomposed: bool = False) -> StepMatchReport:
+        """
+        Match each distinct step of a project, from its step catalog.  Use the catalog to find where the
+        unmatched and ambiguous steps are used.
+        :param decomposed: Match the steps of the decomposed scenarios, with the example values substituted
+        """
+        catalog = project.decomposed_step_catalog if decomposed else project.step_catalog
+        results = {}
+        for entry in catalog:
+            step = entry.occurrences[0].step
+            results[entry.text] = StepMatchResult(entry.text,
+                                                  entry.step_type,
+                                                  self.match_text(step.text_without_keyword, entry.step_type))
+        return StepMatchReport(results)
@@ -14,15 +14,354 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from __future__ import annotations
+
+import operator
 import re
-from typing import List
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from gherkin_objects.objects import ExampleTable, Feature, GherkinProject, Scenario
+
+
+class TagExpressionNode(ABC):
+    """
+    A node of a parsed tag expression.  Nodes compare equal when they have the same structure, so that shared
+    subexpressions can be found.
+    """
+
+    __slots__ = ()
+
+    @property
+    def children(self) -> Tuple[TagExpressionNode, ...]:
+        return ()
+
+    def _key(self) -> tuple:
+        return (type(self).__name__, ) + tuple(child._key() for child in self.children)
+
+    def __eq__(self, other):
+        return isinstance(other, TagExpressionNode) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    @abstractmethod
+    def evaluate(self, tags: AbstractSet[str]) -> bool:
+        """Whether a set of tags matches the node"""
+
+    @abstractmethod
+    def compile(self) -> Callable[[AbstractSet[str]], bool]:
+        """A function of a set of tags which evaluates the node, with no tree to walk"""
+
+    @abstractmethod
+    def partial_evaluate(self,
+                         tags: AbstractSet[str],
+                         possible_tags: Optional[AbstractSet[str]] = None) -> Optional[bool]:
+        """
+        Evaluate the node knowing only some of the tags, e.g. those of a feature, before its scenarios add theirs.
+        Every set of tags which includes tags, and otherwise only tags from possible_tags, gives the same result.
+        :param tags: Tags which are known to be present
+        :param possible_tags: The only other tags which may be present.  By default, any tag may be.
+        :return: The result, or None if it depends on the unknown tags
+        """
+
+    def tag_names(self) -> FrozenSet[str]:
+        """Every tag the expression mentions"""
+        return frozenset().union(*(child.tag_names() for child in self.children))
+
+
+class TrueNode(TagExpressionNode):
+    """An empty expression, which every set of tags matches"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'TrueNode()'
+
+    def evaluate(self, tags: AbstractSet[str]) -> bool:
+        return True
+
+    def compile(self) -> Callable[[AbstractSet[str]], bool]:
+        return lambda tags: True
+
+    def partial_evaluate(self,
+                         tags: AbstractSet[str],
+                         possible_tags: Optional[AbstractSet[str]] = None) -> Optional[bool]:
+        return True
+
+
+class TagNode(TagExpressionNode):
+
+    __slots__ = ('tag', )
+
+    def __init__(self, tag: str):
+        self.tag = tag
+
+    def __repr__(self):
+        return f'TagNode({self.tag!r})'
+
+    def _key(self) -> tuple:
+        return ('TagNode', self.tag)
+
+    def evaluate(self, tags: AbstractSet[str]) -> bool:
+        return self.tag in tags
+
+    def compile(self) -> Callable[[AbstractSet[str]], bool]:
+        tag = self.tag
+        return lambda tags: tag in tags
+
+    def partial_evaluate(self,
+                         tags: AbstractSet[str],
+                         possible_tags: Optional[AbstractSet[str]] = None) -> Optional[bool]:
+        if self.tag in tags:
+            return True
+        if possible_tags is not None and self.tag not in possible_tags:
+            return False
+        return None
+
+    def tag_names(self) -> FrozenSet[str]:
+        return frozenset((self.tag, ))
+
+
+class NotNode(TagExpressionNode):
+
+    __slots__ = ('operand', )
+
+    def __init__(self, operand: TagExpressionNode):
+        self.operand = operand
+
+    def __repr__(self):
+        return f'NotNode({self.operand!r})'
+
+    @property
+    def children(self) -> Tuple[TagExpressionNode, ...]:
+        return (self.operand, )
+
+    def evaluate(self, tags: AbstractSet[str]) -> bool:
+        return not self.operand.evaluate(tags)
+
+    def compile(self) -> Callable[[AbstractSet[str]], bool]:
+        if isinstance(self.operand, TagNode):
+            tag = self.operand.tag
+            return lambda tags: tag not in tags
+        operand = self.operand.compile()
+        return lambda tags: not operand(tags)
+
+    def partial_evaluate(self,
+                         tags: AbstractSet[str],
+                         possible_tags: Optional[AbstractSet[str]] = None) -> Optional[bool]:
+        result = self.operand.partial_evaluate(tags, possible_tags)
+        return None if result is None else not result
+
+
+class AndNode(TagExpressionNode):
+
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left: TagExpressionNode, right: TagExpressionNode):
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f'AndNode({self.left!r}, {self.right!r})'
+
+    @property
+    def children(self) -> Tuple[TagExpressionNode, ...]:
+        return (self.left, self.right)
+
+    def evaluate(self, tags: AbstractSet[str]) -> bool:
+        return self.left.evaluate(tags) and self.right.evaluate(tags)
+
+    def compile(self) -> Callable[[AbstractSet[str]], bool]:
+        left, right = self.left.compile(), self.right.compile()
+        return lambda tags: left(tags) and right(tags)
+
+    def partial_evaluate(self,
+                         tags: AbstractSet[str],
+                         possible_tags: Optional[AbstractSet[str]] = None) -> Optional[bool]:
+        left = self.left.partial_evaluate(tags, possible_tags)
+        if left is False:
+            return False
+        right = self.right.partial_evaluate(tags, possible_tags)
+        if right is False:
+            return False
+        return True if left and right else None
+
+
+class OrNode(TagExpressionNode):
+
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left: TagExpressionNode, right: TagExpressionNode):
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f'OrNode({self.left!r}, {self.right!r})'
+
+    @property
+    def children(self) -> Tuple[TagExpressionNode, ...]:
+        return (self.left, self.right)
+
+    def evaluate(self, tags: AbstractSet[str]) -> bool:
+        return self.left.evaluate(tags) or self.right.evaluate(tags)
+
+    def compile(self) -> Callable[[AbstractSet[str]], bool]:
+        left, right = self.left.compile(), self.right.compile()
+        return lambda tags: left(tags) or right(tags)
+
+    def partial_evaluate(self,
+                         tags: AbstractSet[str],
+                         possible_tags: Optional[AbstractSet[str]] = None) -> Optional[bool]:
+        left = self.left.partial_evaluate(tags, possible_tags)
+        if left is True:
+            return True
+        right = self.right.partial_evaluate(tags, possible_tags)
+        if right is True:
+            return True
+        return False if left is False and right is False else None
+
+
+class _Parser:
+    """
+    Parses the tokens of a normalized tag expression, with the precedence of the Python operators that the
+    expression used to be evaluated with: not binds tightest, then and, then or.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = expression.split()
+        self.position = 0
+
+    def parse(self) -> TagExpressionNode:
+        if not self.tokens:
+            return TrueNode()
+        node = self._or()
+        if self.position < len(self.tokens):
+            self._fail(f'Unexpected {self.tokens[self.position]!r}')
+        return node
+
+    def _fail(self, message: str):
+        raise ValueError(f'{message} in tag expression: {self.expression}')
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _or(self) -> TagExpressionNode:
+        node = self._and()
+        while self._peek() == 'or':
+            self.position += 1
+            node = OrNode(node, self._and())
+        return node
+
+    def _and(self) -> TagExpressionNode:
+        node = self._not()
+        while self._peek() == 'and':
+            self.position += 1
+            node = AndNode(node, self._not())
+        return node
+
+    def _not(self) -> TagExpressionNode:
+        if self._peek() == 'not':
+            self.position += 1
+            return NotNode(self._not())
+        return self._operand()
+
+    def _operand(self) -> TagExpressionNode:
+        token = self._peek()
+        if token is None:
+            self._fail('Unexpected end')
+        self.position += 1
+        if token == '(':
+            node = self._or()
+            if self._peek() != ')':
+                self._fail('Expected )')
+            self.position += 1
+            return node
+        if token.startswith('@'):
+            return TagNode(token)
+        self._fail(f'Unexpected {token!r}')
+
+
+def parse_tag_expression(string: str) -> TagExpressionNode:
+    """Parse a tag expression, in any of the notations GherkinTagFilter accepts, into a tree of nodes"""
+    return _Parser(GherkinTagFilter.to_expression(string)).parse()
+
+
+# Lines which start with @, and the first line which is not a tag line, a comment, or blank, i.e. the Feature line
+_TAG_LINE = re.compile(r'^[^\S\n]*@.*$', re.MULTILINE)
+_CONTENT_LINE = re.compile(r'^[^\S\n]*[^\s@#]', re.MULTILINE)
+
+
+def _line_tags(line: str) -> Tuple[Set[str], Set[str]]:
+    """
+    The tags a tag line may hold, and those it certainly holds.  The line is split both as gherkin-official<5
+    splits it, at each @, and as later versions do, at whitespace, and only tags found both ways are certain.
+    """
+    split_at_signs = {'@' + item.strip() for item in line.strip().split('@')[1:]}
+    split_at_spaces = {item for item in line.split() if item.startswith('@')}
+    return split_at_signs | split_at_spaces, split_at_signs & split_at_spaces
+
+
+def scan_tags(text: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Find the tags in the text of a feature file by scanning its lines, without parsing it.  This is much faster
+    than parsing, and errs on the side of finding too many tags: lines which merely look like tags, e.g. in a doc
+    string, are included.
+    :return: The tags which the file's feature certainly has, and every tag which anything in the file may have
+    """
+    content = _CONTENT_LINE.search(text)
+    feature_end = len(text) if content is None else content.start()
+    feature_tags, tags = set(), set()
+    for match in _TAG_LINE.finditer(text):
+        possible, certain = _line_tags(match.group())
+        tags |= possible
+        if match.start() < feature_end:
+            feature_tags |= certain
+    return frozenset(feature_tags), frozenset(tags)
 
 
 class GherkinTagFilter:
+    """
+    A tag expression, such as '@smoke and not @wip', which can be evaluated against the tags of a scenario.
+
+    The expression is parsed once, when the filter is created, and compiled into functions which check the tags
+    directly.  Results are remembered for each set of tags, so scenarios which share their tags are only evaluated
+    once.
+    """
+
+    # Forget the remembered results once there are this many
+    MAX_CACHED_RESULTS = 65536
 
     def __init__(self, string: str):
         self.expression = GherkinTagFilter.to_expression(string)
         GherkinTagFilter.validate(self.expression)
+        self.tree = _Parser(self.expression).parse()
+        self._evaluate = self.tree.compile()
+        self._results: Dict[FrozenSet[str], bool] = {}
+
+    def __reduce__(self):
+        # The compiled functions cannot be pickled, e.g. to send the filter to another process, so parse it again
+        return GherkinTagFilter, (self.expression, )
+
+    @property
+    def tag_names(self) -> FrozenSet[str]:
+        """Every tag the expression mentions"""
+        return self.tree.tag_names()
 
     @staticmethod
     def validate(string: str):
@@ -77,16 +416,210 @@ class GherkinTagFilter:
         result = re.sub(r'@\S+', 'False', result)
         return result
 
-    def evaluate(self, tags: List[str]) -> bool:
-        substituted_expression = self.substitute_tags(tags)
+    def evaluate(self, tags: Iterable[str]) -> bool:
+        tags = frozenset(tags)
+        result = self._results.get(tags)
+        if result is None:
+            if len(self._results) >= self.MAX_CACHED_RESULTS:
+                self._results = {}
+            result = self._results[tags] = self._evaluate(tags)
+        return result
 
-        # One final check before performing eval
-        allowed_strings = {'True', 'False', 'and', 'or', 'not', '(', ')'}
-        if not set(substituted_expression.split()).issubset(allowed_strings):
-            raise RuntimeError(
-                f'Unsafe eval: "{substituted_expression}" only these components allowed: {allowed_strings}'
-            )
+    def partial_evaluate(self, tags: Iterable[str], possible_tags: Optional[Iterable[str]] = None) -> Optional[bool]:
+        """See TagExpressionNode.partial_evaluate"""
+        possible_tags = None if possible_tags is None else frozenset(possible_tags)
+        return self.tree.partial_evaluate(frozenset(tags), possible_tags)
 
-        # Evaluate expression as a Python expression.  This will return a boolean
-        result = eval(substituted_expression)
-        return result
+    def could_match_text(self, text: str) -> bool:
+        """
+        Whether any scenario in the text of a feature file could match, judged only from the tags found by
+        scan_tags, so the file need not be parsed when it could not.  Never False for a file with a scenario which
+        matches, but may be True for a file without one.
+        """
+        feature_tags, tags = scan_tags(text)
+        return self.partial_evaluate(feature_tags, possible_tags=tags) is not False
+
+    def _matching_tables(self, outline: Scenario, tags: List[str]) -> List[ExampleTable]:
+        return [table for table in outline.tables if self.evaluate(tags + [tag.text for tag in table.tags])]
+
+    def iter_scenarios(self, feature: Feature) -> Iterator[Scenario]:
+        """
+        The scenarios of a feature which match.  A scenario outline matches if any of its decomposed scenarios
+        would.  The background is kept if any other scenario matches.  If the feature's own tags decide the
+        result, its scenarios are not evaluated at all.
+        """
+        feature_tags = [tag.text for tag in feature.tags]
+        decision = self.partial_evaluate(feature_tags)
+        if decision is not None:
+            if decision:
+                yield from feature.scenarios
+            return
+
+        background, matches = None, []
+        for scenario in feature.scenarios:
+            if scenario.is_background:
+                background = scenario
+                continue
+            tags = feature_tags + [tag.text for tag in scenario.tags]
+            if scenario.is_scenario_outline and scenario.tables:
+                if self._matching_tables(scenario, tags):
+                    matches.append(scenario)
+            elif self.evaluate(tags):
+                matches.append(scenario)
+        if matches and background is not None:
+            yield background
+        yield from matches
+
+    def iter_decomposed_scenarios(self, feature: Feature) -> Iterator[Scenario]:
+        """
+        The decomposed scenarios of a feature which match, as they are reached.  The example tables of each outline
+        are evaluated first, so only the rows of tables which match are expanded.  The background is kept if any
+        other scenario matches.  If the feature's own tags decide the result, its scenarios are not evaluated at
+        all.
+        """
+        feature_tags = [tag.text for tag in feature.tags]
+        decision = self.partial_evaluate(feature_tags)
+        if decision is not None:
+            if decision:
+                yield from feature.iter_decomposed_scenarios()
+            return
+
+        background, matches = None, []
+        for scenario in feature.scenarios:
+            if scenario.is_background:
+                background = scenario
+                continue
+            tags = feature_tags + [tag.text for tag in scenario.tags]
+            if scenario.is_scenario_outline:
+                tables = self._matching_tables(scenario, tags)
+                if tables:
+                    matches.append((scenario, tables))
+            elif self.evaluate(tags):
+                matches.append((scenario, None))
+        if matches and background is not None:
+            yield background
+        for scenario, tables in matches:
+            yield from scenario.iter_decompose(tables=tables)
+
+    def filter_project(self, project: GherkinProject, decomposed: bool = True) -> List[Scenario]:
+        """
+        The scenarios of a project which match, decomposing only the example tables which match.  The tags are
+        evaluated with NumPy if it is installed.  To evaluate several expressions, build one TagMatrix instead.
+        :param decomposed: Match the decomposed scenarios of each outline, rather than the outlines
+        """
+        from gherkin_objects.tag_matrix import TagMatrix, numpy, scenario_groups, select_groups
+        if numpy is not None:
+            return TagMatrix.from_project(project, decomposed=decomposed).select(self)
+        groups = scenario_groups(project.features, decomposed=decomposed)
+        return select_groups(groups, [index for index, group in enumerate(groups) if self.evaluate(group.tags)])
+
+
+# The operations of a TagFilterSet's program
+_TRUE, _TAG, _NOT, _AND, _OR = range(5)
+
+
+class TagFilterSet:
+    """
+    Many tag expressions, evaluated together.
+
+    The expressions are merged into one program, in which each distinct subexpression appears once, however many
+    expressions share it.  Operands of and and or are put in a fixed order, so '@a and @b' and '@b and @a' are
+    the same subexpression.  Evaluating the set runs each subexpression once, and results are remembered for each
+    set of tags, like a GherkinTagFilter's.
+    """
+
+    MAX_CACHED_RESULTS = GherkinTagFilter.MAX_CACHED_RESULTS
+
+    def __init__(self, expressions: Union[Iterable[str], Dict[str, str]]):
+        """
+        :param expressions: The expressions, or a mapping of names, such as CI job names, to expressions.  Results
+            are keyed by name, or by the expression itself.
+        """
+        items = list(expressions.items()) if isinstance(expressions, dict) else [(e, e) for e in expressions]
+        self.filters: Dict[str, GherkinTagFilter] = {name: GherkinTagFilter(expression) for name, expression in items}
+        self._program: List[Tuple[int, object, object]] = []
+        self._instructions: Dict[Tuple[int, object, object], int] = {}
+        self._roots: Dict[str, int] = {name: self._add(tag_filter.tree) for name, tag_filter in self.filters.items()}
+        self._results: Dict[FrozenSet[str], Tuple[bool, ...]] = {}
+
+    def _add(self, node: TagExpressionNode) -> int:
+        """Add a node's subexpressions and the node to the program, unless already there, and return its index"""
+        if isinstance(node, TagNode):
+            instruction = (_TAG, node.tag, None)
+        elif isinstance(node, NotNode):
+            instruction = (_NOT, self._add(node.operand), None)
+        elif isinstance(node, (AndNode, OrNode)):
+            left, right = sorted((self._add(node.left), self._add(node.right)))
+            instruction = (_AND if isinstance(node, AndNode) else _OR, left, right)
+        elif isinstance(node, TrueNode):
+            instruction = (_TRUE, None, None)
+        else:
+            raise TypeError(f'Unknown tag expression node: {node!r}')
+        index = self._instructions.get(instruction)
+        if index is None:
+            index = self._instructions[instruction] = len(self._program)
+            self._program.append(instruction)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+    @property
+    def subexpression_count(self) -> int:
+        """The number of distinct subexpressions, each of which is evaluated once per set of tags"""
+        return len(self._program)
+
+    def _run(self, tag_value: Callable, true_value, negate: Callable) -> tuple:
+        """
+        Run the program, with tag_value(tag) as the value of each tag, and return the value of each expression.
+        The values may be bools, or arrays of them.
+        """
+        values = []
+        for operation, first, second in self._program:
+            if operation == _TAG:
+                values.append(tag_value(first))
+            elif operation == _NOT:
+                values.append(negate(values[first]))
+            elif operation == _AND:
+                values.append(values[first] & values[second])
+            elif operation == _OR:
+                values.append(values[first] | values[second])
+            else:
+                values.append(true_value)
+        return tuple(values[index] for index in self._roots.values())
+
+    def _evaluate(self, tags: Iterable[str]) -> Tuple[bool, ...]:
+        tags = frozenset(tags)
+        results = self._results.get(tags)
+        if results is None:
+            if len(self._results) >= self.MAX_CACHED_RESULTS:
+                self._results = {}
+            results = self._results[tags] = self._run(tags.__contains__, True, operator.not_)
+        return results
+
+    def evaluate(self, tags: Iterable[str]) -> Dict[str, bool]:
+        """Whether a set of tags matches each expression"""
+        return dict(zip(self._roots, self._evaluate(tags)))
+
+    def filter_project(self, project: GherkinProject, decomposed: bool = True) -> Dict[str, List[Scenario]]:
+        """
+        The scenarios of a project which match each expression, from one pass over the project.  Example tables
+        are only decomposed if they match at least one expression, and then only once.  The tags are evaluated
+        with NumPy if it is installed.
+        :param decomposed: Match the decomposed scenarios of each outline, rather than the outlines
+        """
+        from gherkin_objects.tag_matrix import TagMatrix, numpy, scenario_groups, select_groups
+        groups = scenario_groups(project.features, decomposed=decomposed)
+        if numpy is not None:
+            matrix = TagMatrix(groups)
+            tag_set_results = self._run(matrix.column, numpy.ones(len(matrix.matrix), dtype=bool), numpy.logical_not)
+            matching_groups = [matrix.matching_group_indexes(tag_set_matches) for tag_set_matches in tag_set_results]
+        else:
+            group_results = [self._evaluate(group.tags) for group in groups]
+            matching_groups = [
+                [index for index, results in enumerate(group_results) if results[position]]
+                for position in range(len(self._roots))
+            ]
+
+        scenarios: Dict[int, List[Scenario]] = {}
+        return {name: select_groups(groups, indexes, scenarios) for name, indexes in zip(self._roots, matching_groups)}
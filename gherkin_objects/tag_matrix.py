@@ -0,0 +1,216 @@
+"""
+Evaluate tag expressions over every scenario of a GherkinProject at once, with NumPy.
+
+The tags of each scenario, including those it inherits from its feature and, once decomposed, from its example
+table, are collected into a boolean matrix once.  Each tag expression is then evaluated with one vectorized &, |,
+or ~ per operator, over whole columns of the matrix, rather than once per scenario in Python.
+
+The rows of one example table all have the same tags, so the matrix holds one row per distinct set of tags, and
+each scenario refers to its row.  Decomposed scenarios are only built for the tables which match.  An outline which
+is not decomposed has a group for each of its example tables, and matches if any of them does.
+
+NumPy is an optional dependency: pip install gherkin-objects[numpy]
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Union
+
+from gherkin_objects.objects import ExampleTable, Feature, GherkinProject, Scenario
+from gherkin_objects.tag_filter import (
+    AndNode,
+    GherkinTagFilter,
+    NotNode,
+    OrNode,
+    TagExpressionNode,
+    TagNode,
+    TrueNode,
+)
+
+try:
+    import numpy
+except ImportError:  # Optional dependency
+    numpy = None
+
+
+class ScenarioGroup(NamedTuple):
+    """
+    Scenarios which share their tags: a scenario, or the decomposed scenarios of one of an outline's example tables.
+    If decompose is False, the group is instead one of the example tables for which the whole outline matches.
+    """
+    scenario: Scenario
+    table: Optional[ExampleTable]
+    count: int
+    tags: FrozenSet[str]
+    decompose: bool = True
+
+    def scenarios(self) -> List[Scenario]:
+        if self.table is None or not self.decompose:
+            return [self.scenario]
+        return list(self.scenario.iter_decompose(tables=[self.table]))
+
+
+def select_groups(groups: List[ScenarioGroup],
+                  indexes: Iterable[int],
+                  scenarios: Optional[Dict[int, List[Scenario]]] = None) -> List[Scenario]:
+    """
+    The scenarios of the groups at indexes, in increasing order.  An outline which is not decomposed is included
+    once, however many of its example tables match.
+    :param scenarios: The scenarios of groups by index, which are reused, and to which new ones are added
+    """
+    scenarios = {} if scenarios is None else scenarios
+    selected = []
+    outline = None
+    for index in indexes:
+        group = groups[index]
+        if not group.decompose:
+            if group.scenario is outline:
+                continue
+            outline = group.scenario
+        if index not in scenarios:
+            scenarios[index] = group.scenarios()
+        selected.extend(scenarios[index])
+    return selected
+
+
+def scenario_groups(features: Iterable[Feature], decomposed: bool = True) -> List[ScenarioGroup]:
+    """
+    Group the scenarios of features by their tags, without decomposing any.  Backgrounds are left out.
+    :param decomposed: Group the decomposed scenarios of each outline by example table.  Otherwise, an outline is
+        one scenario, with a group for each example table, which matches if any of its groups does.
+    """
+    groups = []
+    for feature in features:
+        feature_tags = [tag.text for tag in feature.tags]
+        for scenario in feature.scenarios:
+            if scenario.is_background:
+                continue
+            tags = feature_tags + [tag.text for tag in scenario.tags]
+            if not scenario.is_scenario_outline or not (decomposed or scenario.tables):
+                groups.append(ScenarioGroup(scenario, None, 1, frozenset(tags)))
+                continue
+            for table in scenario.tables:
+                table_tags = frozenset(tags + [tag.text for tag in table.tags])
+                if decomposed:
+                    groups.append(ScenarioGroup(scenario, table, table._row_count(), table_tags))
+                else:
+                    groups.append(ScenarioGroup(scenario, table, 1, table_tags, decompose=False))
+    return groups
+
+
+class TagMatrix:
+    """
+    A boolean matrix of the distinct tag sets of a project's scenarios by tags, for evaluating many tag expressions
+    over the same scenarios.  Build it once with from_project, then call evaluate or select for each expression.
+    """
+
+    def __init__(self, groups: List[ScenarioGroup]):
+        if numpy is None:
+            raise ImportError('TagMatrix needs NumPy: pip install gherkin-objects[numpy]')
+        self.groups = groups
+
+        tag_sets: Dict[FrozenSet[str], int] = {}
+        group_rows = [tag_sets.setdefault(group.tags, len(tag_sets)) for group in groups]
+        self.tags: List[str] = sorted(set().union(*tag_sets))
+        self._columns = {tag: index for index, tag in enumerate(self.tags)}
+
+        self.matrix = numpy.zeros((len(tag_sets), len(self.tags)), dtype=bool)
+        for tags, row in tag_sets.items():
+            self.matrix[row, [self._columns[tag] for tag in tags]] = True
+
+        self._group_rows = numpy.array(group_rows, dtype=numpy.intp)
+        self._group_counts = numpy.array([group.count for group in groups], dtype=numpy.intp)
+        # The matrix row of each decomposed scenario, or of each example table of an outline which is not decomposed
+        self._scenario_rows = numpy.repeat(self._group_rows, self._group_counts)
+
+        # Where each scenario starts among those rows, if an outline which is not decomposed spans several
+        starts, offset, outline = [], 0, None
+        for group in groups:
+            if group.decompose:
+                starts.extend(range(offset, offset + group.count))
+            elif group.scenario is not outline:
+                starts.append(offset)
+            outline = None if group.decompose else group.scenario
+            offset += group.count
+        self._scenario_starts = None if len(starts) == offset else numpy.array(starts, dtype=numpy.intp)
+
+    @classmethod
+    def from_project(cls, project: GherkinProject, decomposed: bool = True) -> TagMatrix:
+        """See scenario_groups"""
+        return cls(scenario_groups(project.features, decomposed=decomposed))
+
+    def __len__(self) -> int:
+        """The number of scenarios"""
+        if self._scenario_starts is None:
+            return len(self._scenario_rows)
+        return len(self._scenario_starts)
+
+    def column(self, tag: str) -> numpy.ndarray:
+        """Whether each distinct tag set has a tag"""
+        index = self._columns.get(tag)
+        if index is None:
+            return numpy.zeros(len(self.matrix), dtype=bool)
+        return self.matrix[:, index]
+
+    def _evaluate_node(self, node: TagExpressionNode, results: Dict[TagExpressionNode, numpy.ndarray]):
+        result = results.get(node)
+        if result is not None:
+            return result
+        if isinstance(node, TagNode):
+            result = self.column(node.tag)
+        elif isinstance(node, NotNode):
+            result = ~self._evaluate_node(node.operand, results)
+        elif isinstance(node, AndNode):
+            result = self._evaluate_node(node.left, results) & self._evaluate_node(node.right, results)
+        elif isinstance(node, OrNode):
+            result = self._evaluate_node(node.left, results) | self._evaluate_node(node.right, results)
+        elif isinstance(node, TrueNode):
+            result = numpy.ones(len(self.matrix), dtype=bool)
+        else:
+            raise TypeError(f'Unknown tag expression node: {node!r}')
+        results[node] = result
+        return result
+
+    def evaluate_tag_sets(self,
+                          expression: Union[GherkinTagFilter, TagExpressionNode, str],
+                          results: Optional[Dict[TagExpressionNode, numpy.ndarray]] = None) -> numpy.ndarray:
+        """
+        Whether each distinct tag set matches an expression
+        :param results: Results of subexpressions, which are reused, and to which new results are added
+        """
+        if isinstance(expression, str):
+            expression = GherkinTagFilter(expression)
+        node = expression.tree if isinstance(expression, GherkinTagFilter) else expression
+        return self._evaluate_node(node, {} if results is None else results)
+
+    def evaluate(self, expression: Union[GherkinTagFilter, TagExpressionNode, str]) -> numpy.ndarray:
+        """Whether each scenario matches an expression, in the order of the groups"""
+        matches = self.evaluate_tag_sets(expression)[self._scenario_rows]
+        if self._scenario_starts is None:
+            return matches
+        return numpy.logical_or.reduceat(matches, self._scenario_starts)
+
+    def matching_group_indexes(self, tag_set_matches: numpy.ndarray) -> List[int]:
+        """The indexes of the groups whose tag sets match, given whether each distinct tag set matches"""
+        return numpy.flatnonzero(tag_set_matches[self._group_rows]).tolist()
+
+    def matching_groups(self, tag_set_matches: numpy.ndarray) -> List[ScenarioGroup]:
+        return [self.groups[index] for index in self.matching_group_indexes(tag_set_matches)]
+
+    def select(self, expression: Union[GherkinTagFilter, TagExpressionNode, str]) -> List[Scenario]:
+        """The scenarios which match an expression, decomposing only the example tables which match"""
+        return select_groups(self.groups, self.matching_group_indexes(self.evaluate_tag_sets(expression)))
@@ -0,0 +1,323 @@
+"""
+Keep a GherkinProject up to date as its files change on disk.
+
+On Linux the project's directories are watched with inotify, through ctypes.  Elsewhere, or if inotify is not
+available, the files and directories are polled instead.  Either way, a burst of changes is collected until the
+files have been quiet for a short time, and then only the files which were touched are parsed again.
+
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import time
+
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from gherkin_objects.objects import (
+    FeatureFile,
+    GherkinProject,
+    InvalidGherkinError,
+    ProjectChanges,
+    _file_signature,
+)
+from gherkin_objects.paths import PathResolver
+
+logger = logging.getLogger(__package__)
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# A file counts as changed once it is closed after writing, not on every write, so a save is seen as one change
+_WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+               | IN_ONLYDIR)
+
+# struct inotify_event, without its variable length name
+_EVENT = struct.Struct('iIII')
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    if not all(hasattr(libc, name) for name in ('inotify_init1', 'inotify_add_watch', 'inotify_rm_watch')):
+        return None
+    return libc
+
+
+class _InotifyBackend:
+    """Reports changes in a set of directories, using inotify"""
+
+    def __init__(self, libc: ctypes.CDLL):
+        self._libc = libc
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._directories: Dict[int, str] = {}
+        self._descriptors: Dict[str, int] = {}
+
+    def watch(self, directories: Set[str], files: Set[str]):
+        for directory in list(self._descriptors):
+            if directory not in directories:
+                self._libc.inotify_rm_watch(self._fd, self._descriptors.pop(directory))
+        for directory in directories:
+            if directory in self._descriptors:
+                continue
+            descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory or os.curdir), _WATCH_MASK)
+            if descriptor < 0:
+                logger.warning(f'Failed to watch {directory}: {os.strerror(ctypes.get_errno())}')
+                continue
+            self._descriptors[directory] = descriptor
+            self._directories[descriptor] = directory
+
+    def read(self, timeout: Optional[float]) -> Tuple[Set[str], bool]:
+        """
+        Wait up to timeout seconds for changes
+        :return: The paths which changed, and whether a directory changed, so the project must be resolved again
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set(), False
+
+        paths, rescan = set(), False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            offset = 0
+            while offset < len(data):
+                descriptor, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = os.fsdecode(data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0'))
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped, so anything could have changed
+                    rescan = True
+                    continue
+                directory = self._directories.get(descriptor)
+                if mask & IN_IGNORED:
+                    self._directories.pop(descriptor, None)
+                    if directory is not None and self._descriptors.get(directory) == descriptor:
+                        del self._descriptors[directory]
+                    continue
+                if directory is None:
+                    continue
+                if mask & (IN_ISDIR | IN_DELETE_SELF | IN_MOVE_SELF):
+                    rescan = True
+                    continue
+                paths.add(os.path.join(directory, name) if directory else name)
+        return paths, rescan
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingBackend:
+    """Reports changes in a set of directories and files, by comparing their stats every `interval` seconds"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._directories: Dict[str, Optional[int]] = {}
+        self._files: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+    @staticmethod
+    def _directory_mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory or os.curdir).st_mtime_ns
+        except OSError:
+            return None
+
+    def watch(self, directories: Set[str], files: Set[str]):
+        self._directories = {
+            directory: self._directories[directory] if directory in self._directories
+            else self._directory_mtime(directory)
+            for directory in directories
+        }
+        self._files = {
+            path: self._files[path] if path in self._files else _file_signature(path)
+            for path in files
+        }
+
+    def _changes(self) -> Tuple[Set[str], bool]:
+        paths, rescan = set(), False
+        for path, signature in self._files.items():
+            current = _file_signature(path)
+            if current != signature:
+                self._files[path] = current
+                paths.add(path)
+        for directory, mtime in self._directories.items():
+            current = self._directory_mtime(directory)
+            if current != mtime:
+                self._directories[directory] = current
+                rescan = True
+        return paths, rescan
+
+    def read(self, timeout: Optional[float]) -> Tuple[Set[str], bool]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            paths, rescan = self._changes()
+            if paths or rescan:
+                return paths, rescan
+            remaining = self.interval if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                return set(), False
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class ProjectWatcher:
+    """
+    Watches the files of a GherkinProject, and refreshes the project when they change.
+
+    The watch starts when the watcher is created, so changes made before the first call to poll are not missed.
+    Iterating over the watcher yields the ProjectChanges of each burst of changes, until it is closed.
+    Files which are saved while they are not valid Gherkin are collected in the project's `errors`.
+    """
+
+    DEFAULT_DEBOUNCE = 0.1
+    DEFAULT_POLL_INTERVAL = 1.0
+
+    def __init__(self,
+                 project: GherkinProject,
+                 debounce: float = DEFAULT_DEBOUNCE,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 use_inotify: Optional[bool] = None):
+        """
+        :param debounce: Wait until no file has changed for this many seconds before refreshing the project
+        :param poll_interval: How often to check for changes, when not using inotify
+        :param use_inotify: Whether to use inotify.  By default, it is used if it is available.
+        """
+        self.project = project
+        self.debounce = debounce
+        self._backend = None
+        libc = _load_libc() if use_inotify is not False else None
+        if use_inotify and libc is None:
+            raise OSError('inotify is not available')
+        if libc is not None:
+            try:
+                self._backend = _InotifyBackend(libc)
+            except OSError as e:
+                if use_inotify:
+                    raise
+                logger.warning(f'Failed to start inotify, polling instead: {e}')
+        if self._backend is None:
+            self._backend = _PollingBackend(poll_interval)
+        self._watch_project()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return isinstance(self._backend, _InotifyBackend)
+
+    def __enter__(self) -> ProjectWatcher:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self) -> Iterator[ProjectChanges]:
+        while self._backend is not None:
+            changes = self.poll()
+            if changes is not None and (changes.added or changes.modified or changes.removed):
+                yield changes
+
+    def close(self):
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+    def _watch_project(self):
+        """Watch the directories that hold the project's files, and those where new files could appear"""
+        files = set(self.project.paths)
+        directories = {os.path.dirname(path) for path in files}
+        config = self.project.config
+        if config is not None:
+            resolver = PathResolver(*config.resolved_patterns())
+            resolver.resolve()
+            directories.update(resolver.visited_directories)
+        self._backend.watch(directories, files)
+
+    def poll(self, timeout: Optional[float] = None) -> Optional[ProjectChanges]:
+        """
+        Wait up to timeout seconds (forever if None) for files to change, and refresh the project once they have
+        been quiet for `debounce` seconds.
+        :return: What changed in the project, or None if nothing did before the timeout
+        """
+        paths, rescan = self._backend.read(timeout)
+        if not paths and not rescan:
+            return None
+        while True:
+            more_paths, more_rescan = self._backend.read(self.debounce)
+            if not more_paths and not more_rescan:
+                break
+            paths |= more_paths
+            rescan = rescan or more_rescan
+        return self._refresh(paths, rescan)
+
+    def _refresh(self, paths: Set[str], rescan: bool) -> ProjectChanges:
+        feature_files = {feature_file.path: feature_file for feature_file in self.project.feature_files}
+        # Other files in the same directories, e.g. an editor's swap files, do not concern the project
+        paths = {path for path in paths if path in feature_files or path.endswith('.feature')}
+        modified = [
+            path for path in sorted(paths)
+            if path in feature_files and os.path.isfile(path) and self._refresh_file(feature_files[path])
+        ]
+        if not rescan and all(path in feature_files and os.path.isfile(path) for path in paths):
+            return ProjectChanges(added=[], modified=modified, removed=[])
+
+        # Files were added or removed, so resolve the project's paths again, without checking every file
+        changes = self.project.refresh(touched=())
+        self._watch_project()
+        return ProjectChanges(added=changes.added, modified=modified, removed=changes.removed)
+
+    def _refresh_file(self, feature_file: FeatureFile) -> bool:
+        try:
+            modified = feature_file.refresh_if_modified(tag_filter=self.project.tag_filter)
+        except InvalidGherkinError as e:
+            self.project.record_error(feature_file.path, e)
+            return False
+        self.project.clear_errors(feature_file.path)
+        return modified
+
@@ -42,6 +42,9 @@ setup(
     include_package_data=True,
     version=version,
     install_requires=parse_requirements(get_requirements_files()),
+    extras_require={
+        "numpy": ["numpy"],
+    },
     description="Programmatically read, create, and modify Gherkin",
     python_requires=">=3.8",
     classifiers=[
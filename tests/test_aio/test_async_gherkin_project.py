@@ -0,0 +1,93 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from concurrent.futures import ProcessPoolExecutor
+
+from gherkin_objects.aio import AsyncGherkinProject
+from gherkin_objects.formatter import aio as formatter_aio
+from gherkin_objects.objects import GherkinProjectConfig, InvalidGherkinError
+from tests.resources.configs import test_formatter
+
+
+class AsyncGherkinProjectTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(5):
+            self.paths.append(self.write(f'{i}.feature', f'Feature: feature {i}\nScenario: scenario\nGiven step'))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name, text):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    async def test_load_paths(self):
+        project = await AsyncGherkinProject.load(self.paths, concurrency=2)
+        self.assertTrue(all(f.is_loaded for f in project.project.feature_files))
+        features = project.project.features
+        self.assertEqual([f.name for f in features], [f'feature {i}' for i in range(5)])
+        self.assertIs(features[0].parent.parent, project.project)
+
+    async def test_load_config_with_process_executor(self):
+        config = GherkinProjectConfig(path=os.path.join(self.temp_dir, 'project.json'), include=[self.temp_dir])
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            project = await AsyncGherkinProject.load(config, process_executor=executor)
+        self.assertEqual(sorted(f.name for f in project.project.features), [f'feature {i}' for i in range(5)])
+        self.assertIs(project.project.config, config)
+
+    async def test_load_collects_errors(self):
+        invalid_path = self.write('invalid.feature', 'Scenario: no feature')
+        project = await AsyncGherkinProject.load(self.paths + [invalid_path])
+        self.assertEqual(len(project.project.feature_files), 5)
+        path, error = project.project.errors[0]
+        self.assertEqual(path, invalid_path)
+        self.assertIsInstance(error, InvalidGherkinError)
+        self.assertEqual(project.project.paths, self.paths)
+
+        self.write('invalid.feature', 'Feature: fixed')
+        self.assertEqual(project.project.refresh().added, [invalid_path])
+        self.assertEqual(project.project.errors, [])
+
+    async def test_aiter_features(self):
+        project = await AsyncGherkinProject.load(self.paths, lazy=True, concurrency=2)
+        names = [feature.name async for feature in project.aiter_features()]
+        self.assertEqual(names, [f'feature {i}' for i in range(5)])
+        self.assertFalse(any(f.is_loaded for f in project.project.feature_files))
+
+    async def test_check_and_apply(self):
+        project = await AsyncGherkinProject.load(self.paths, lazy=True)
+        unformatted = await formatter_aio.check(project, test_formatter)
+        self.assertEqual([f.path for f in unformatted], self.paths)
+
+        applied = await formatter_aio.apply(project, test_formatter)
+        self.assertEqual([f.path for f in applied], self.paths)
+        self.assertEqual(await formatter_aio.check(project, test_formatter), [])
+        with open(self.paths[0]) as file:
+            self.assertEqual(file.read(), project.project.feature_files[0].text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects.cache import ParseCache
+from gherkin_objects.objects import Feature, FeatureFile
+
+
+class ParseCacheTests(unittest.TestCase):
+
+    text = 'Feature: feature\nScenario: scenario\nGiven step\n| a | b |'
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ParseCache(directory=self.temp_dir)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_miss_then_hit(self):
+        self.assertIsNone(self.cache.get(self.text))
+        feature = self.cache.feature_from_text(self.text)
+
+        with mock.patch.object(Feature, 'from_text') as from_text:
+            cached = self.cache.feature_from_text(self.text)
+            from_text.assert_not_called()
+
+        self.assertIsNot(cached, feature)
+        self.assertEqual(cached.name, 'feature')
+        step = cached.scenarios[0].steps[0]
+        self.assertIs(step.parent, cached.scenarios[0])
+        self.assertEqual(step.data_table.rows, [['a', 'b']])
+
+    def test_parent_is_not_cached(self):
+        path = os.path.join(self.temp_dir, 'file.feature')
+        with open(path, 'w') as file:
+            file.write(self.text)
+        feature_file = FeatureFile(path, cache=self.cache)
+        self.assertIs(feature_file.feature.parent, feature_file)
+
+        cached = self.cache.get(self.text)
+        self.assertIsNone(cached.parent)
+
+    def test_corrupt_entry_is_a_miss(self):
+        self.cache.feature_from_text(self.text)
+        with open(self.cache._entry_path(self.cache.key(self.text)), 'wb') as file:
+            file.write(b'garbage')
+        self.assertIsNone(self.cache.get(self.text))
+
+    def test_lru_eviction(self):
+        texts = [f'Feature: feature {i}' for i in range(4)]
+        for i, text in enumerate(texts):
+            self.cache.feature_from_text(text)
+            path = self.cache._entry_path(self.cache.key(text))
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        entry_size = os.path.getsize(self.cache._entry_path(self.cache.key(texts[0])))
+
+        self.cache.max_bytes = entry_size * 3
+        self.cache.evict()
+
+        self.assertIsNone(self.cache.get(texts[0]))
+        self.assertIsNone(self.cache.get(texts[1]))
+        self.assertIsNotNone(self.cache.get(texts[2]))
+        self.assertIsNotNone(self.cache.get(texts[3]))
+
+    def test_unwritable_directory(self):
+        # The cache directory is a file, so nothing can be read from or written to it
+        path = os.path.join(self.temp_dir, 'not_a_directory')
+        with open(path, 'w') as file:
+            file.write('')
+        cache = ParseCache(directory=path)
+        with self.assertLogs('gherkin_objects', level='WARNING'):
+            feature = cache.feature_from_text(self.text)
+        self.assertEqual(feature.name, 'feature')
+        self.assertIsNone(cache.get(self.text))
+
+    def test_clear(self):
+        self.cache.feature_from_text(self.text)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects.cache import PathCache
+from gherkin_objects.objects import GherkinProject, GherkinProjectConfig
+from gherkin_objects.paths import PathResolver
+
+
+class PathCacheTests(unittest.TestCase):
+
+    text = 'Feature: feature\nScenario: scenario\nGiven step'
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_dir = os.path.join(self.temp_dir, 'project')
+        os.makedirs(os.path.join(self.project_dir, 'a'))
+        self.write('a/one.feature')
+        self.write('two.feature')
+        self.config = GherkinProjectConfig(
+            path=os.path.join(self.temp_dir, 'config.json'), include=[self.project_dir + '/'])
+        self.cache = PathCache(directory=os.path.join(self.temp_dir, 'cache'))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, relative_path: str):
+        path = os.path.join(self.project_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(self.text)
+
+    def test_unchanged_directories_are_not_walked(self):
+        paths = self.cache.paths(self.config)
+        self.assertEqual(paths, self.config.paths)
+
+        with mock.patch.object(PathResolver, 'resolve') as resolve:
+            self.assertEqual(self.cache.paths(self.config), paths)
+            resolve.assert_not_called()
+
+    def test_added_and_removed_files(self):
+        self.cache.paths(self.config)
+
+        self.write('a/b/three.feature')
+        self.assertEqual(self.cache.paths(self.config), self.config.paths)
+        self.assertIn(os.path.join(self.project_dir, 'a', 'b', 'three.feature'), self.cache.paths(self.config))
+
+        os.remove(os.path.join(self.project_dir, 'a', 'one.feature'))
+        self.assertEqual(self.cache.paths(self.config), self.config.paths)
+        self.assertNotIn(os.path.join(self.project_dir, 'a', 'one.feature'), self.cache.paths(self.config))
+
+    def test_unreadable_entry(self):
+        paths = self.cache.paths(self.config)
+        for name in os.listdir(self.cache.directory):
+            with open(os.path.join(self.cache.directory, name), 'w') as file:
+                file.write('{')
+        self.assertEqual(self.cache.paths(self.config), paths)
+
+    def test_project_from_config(self):
+        project = GherkinProject.from_config(self.config, path_cache=self.cache)
+        self.assertEqual(project.paths, self.config.paths)
+        self.assertEqual(project.common_root_path, self.project_dir + os.path.sep)
+
+        self.write('three.feature')
+        changes = project.refresh()
+        self.assertEqual(changes.added, [os.path.join(self.project_dir, 'three.feature')])
+        self.assertEqual(project.common_root_path, self.project_dir + os.path.sep)
+
+
+if __name__ == '__main__':
+    unittest.main()
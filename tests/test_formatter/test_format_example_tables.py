@@ -141,6 +141,28 @@ class TestFormatSteps(FormatComponentTest):
         ]
         self.assert_scenario_formatted(input_lines, expected_lines)
 
+    def test_enforce_header_order___many_rows(self):
+        self.config.example_table.enforce_header_order = True
+        input_lines = [
+            'Scenario Outline: scenario',
+            'Given <foo> <bar> <baz>',
+            'Examples:',
+            '| baz | bar | foo |',
+            '| 1 | 2 | 3 |',
+            '| 4 | 5 | 6 |',
+            '| 7 | 8 | 9 |',
+        ]
+        expected_lines = [
+            'Scenario Outline: scenario',
+            'Given <foo> <bar> <baz>',
+            'Examples:',
+            '| foo | bar | baz |',
+            '| 3   | 2   | 1   |',
+            '| 6   | 5   | 4   |',
+            '| 9   | 8   | 7   |',
+        ]
+        self.assert_scenario_formatted(input_lines, expected_lines)
+
     def test_combine_tables_with_equivalent_tags___no_tags(self):
         self.config.example_table.combine_tables_with_equivalent_tags = True
         input_lines = [
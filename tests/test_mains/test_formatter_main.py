@@ -14,13 +14,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import os
 import unittest
 import shutil
 import tempfile
+from unittest import mock
 from scripts.format_gherkin import main_from_args
+from gherkin_objects.cache import CACHE_DIR_ENV_VAR
 from tests.resources.configs import test_formatter_config_path
 from gherkin_objects.formatter import Formatter
-from gherkin_objects.objects import GherkinProjectConfig, FeatureFile, Feature
+from gherkin_objects.objects import GherkinProjectConfig, FeatureFile, Feature, ProjectChanges
+from gherkin_objects.watch import ProjectWatcher
 
 
 class TestFormatterMain(unittest.TestCase):
@@ -44,6 +48,9 @@ class TestFormatterMain(unittest.TestCase):
 
     def setUp(self) -> None:
         self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.environ_patch = mock.patch.dict(os.environ, {CACHE_DIR_ENV_VAR: self.cache_dir})
+        self.environ_patch.start()
         self.temp_project_config_path = tempfile.mktemp(suffix='.project.json',
                                                         dir=self.temp_dir)
         self.temp_feature_file_path = tempfile.mktemp(suffix='.feature',
@@ -60,6 +67,7 @@ class TestFormatterMain(unittest.TestCase):
         self.temp_feature_file = FeatureFile(path=self.temp_feature_file_path)
 
     def tearDown(self) -> None:
+        self.environ_patch.stop()
         shutil.rmtree(self.temp_dir)
 
     # Utils
@@ -134,6 +142,63 @@ class TestFormatterMain(unittest.TestCase):
         # --check shouldn't make any changes to the file
         self.assertEqual(contents_after_call, formatted)
 
+    def test_formatter_main_watch_apply(self):
+        def changes(watcher):
+            # Another save of an unformatted file, after the first run has formatted it
+            self.write_temp_feature_file(self.unformatted_text)
+            watcher.project.refresh()
+            yield ProjectChanges(added=[], modified=[self.temp_feature_file_path], removed=[])
+
+        with mock.patch.object(ProjectWatcher, '__iter__', autospec=True, side_effect=changes):
+            main_from_args([
+                self.temp_project_config_path, test_formatter_config_path,
+                '--apply', '--watch'
+            ])
+
+        with open(self.temp_feature_file_path) as f:
+            self.assertEqual(f.read(), self.formatted_text)
+
+    def test_formatter_main_watch_check_does_not_exit(self):
+        with mock.patch.object(ProjectWatcher, '__iter__', autospec=True, return_value=iter([])):
+            main_from_args([
+                self.temp_project_config_path, test_formatter_config_path,
+                '--check', '--watch'
+            ])
+
+    def test_formatter_main_cache(self):
+        main_from_args([
+            self.temp_project_config_path, test_formatter_config_path,
+            '--apply'
+        ])
+        self.assertTrue(os.listdir(os.path.join(self.cache_dir, 'features')))
+        self.assertTrue(os.listdir(os.path.join(self.cache_dir, 'paths')))
+
+        with mock.patch.object(Feature, 'from_text') as from_text:
+            main_from_args([
+                self.temp_project_config_path, test_formatter_config_path,
+                '--check'
+            ])
+            from_text.assert_not_called()
+
+    def test_formatter_main_no_cache(self):
+        main_from_args([
+            self.temp_project_config_path, test_formatter_config_path,
+            '--apply', '--no-cache'
+        ])
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_formatter_main_clear_cache(self):
+        main_from_args([
+            self.temp_project_config_path, test_formatter_config_path,
+            '--apply'
+        ])
+        with mock.patch.object(Feature, 'from_text', wraps=Feature.from_text) as from_text:
+            main_from_args([
+                self.temp_project_config_path, test_formatter_config_path,
+                '--check', '--clear-cache'
+            ])
+            from_text.assert_called()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+from gherkin_objects.objects import DataTable, InvalidGherkinError
+
+
+class DataTableTests(unittest.TestCase):
+
+    def test_data_table_from_text(self):
+        table = DataTable.from_text('| a | b |\n| c | d |')
+        self.assertEqual(table.rows, [['a', 'b'], ['c', 'd']])
+        self.assertEqual(table.column(1), ['b', 'd'])
+        self.assertEqual(table.columns, [['a', 'c'], ['b', 'd']])
+
+    def test_rows_are_views(self):
+        table = DataTable(rows=[['a', 'b'], ['c', 'd']])
+        table.rows[1][0] = 'changed'
+        self.assertEqual(table.column(0), ['a', 'changed'])
+        self.assertEqual(list(table.rows[1]), ['changed', 'd'])
+        self.assertEqual(len(table.rows[0]), 2)
+
+    def test_add_and_remove_rows(self):
+        table = DataTable(rows=[])
+        self.assertEqual(len(table.rows), 0)
+        table.rows.append(['a', 'b'])
+        table.rows.extend([['c', 'd'], ['e', 'f']])
+        del table.rows[0]
+        self.assertEqual(table.rows, [['c', 'd'], ['e', 'f']])
+
+        with self.assertRaises(InvalidGherkinError):
+            table.rows.append(['g'])
+
+    def test_non_square(self):
+        with self.assertRaises(InvalidGherkinError):
+            DataTable(rows=[['a', 'b'], ['c']])
+
+
+if __name__ == '__main__':
+    unittest.main()
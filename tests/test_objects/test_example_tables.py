@@ -65,6 +65,53 @@ class ExampleTableTests(unittest.TestCase):
         self.assertEqual(table.values[1][0], 'C')
         self.assertEqual(table.values[1][1], 'D')
 
+    def test_columns(self):
+        table = ExampleTable.from_2d_array([
+            ['A', 'B'],
+            ['1', '2'],
+            ['3', '4'],
+        ])
+        self.assertEqual(table.column('B'), ['2', '4'])
+        self.assertEqual(table.column(0), ['1', '3'])
+        self.assertEqual(table.column_values, [{'A': ['1', '3']}, {'B': ['2', '4']}])
+        self.assertEqual(table.table_row_params, [[('A', '1'), ('B', '2')], [('A', '3'), ('B', '4')]])
+        with self.assertRaises(KeyError):
+            table.column('C')
+
+    def test_rows_are_views(self):
+        table = ExampleTable.from_2d_array([
+            ['A', 'B'],
+            ['1', '2'],
+        ])
+        row = table.data_rows[0]
+        self.assertIs(row.parent, table)
+        self.assertEqual(row.values, ['1', '2'])
+
+        row.cells[1].value = 'changed'
+        table.header_row.cells[0].value = 'renamed'
+        self.assertEqual(table.values, [['renamed', 'B'], ['1', 'changed']])
+        with self.assertRaises(TypeError):
+            row.add_cell('C')
+
+    def test_add_and_remove_rows(self):
+        table = ExampleTable.from_2d_array([['A', 'B'], ['1', '2']])
+        table.add_row(['3', '4'])
+        table.add_row(ExampleTableRow.from_array(['0', '0']), position=0)
+        table.data_rows.append(['5', '6'])
+        table.extend_rows(ExampleTable.from_2d_array([['A', 'B'], ['7', '8']]).data_rows)
+        del table.data_rows[1]
+        self.assertEqual(table.data_values, [['0', '0'], ['3', '4'], ['5', '6'], ['7', '8']])
+        self.assertEqual(len(table), 5)
+
+        with self.assertRaises(InvalidGherkinError):
+            table.add_row(['too', 'many', 'cells'])
+
+    def test_set_rows(self):
+        table = ExampleTable.from_2d_array([['A', 'B'], ['1', '2']])
+        table.header_row = ExampleTableRow.from_array(['B', 'A'])
+        table.data_rows = [['2', '1'], ['4', '3']]
+        self.assertEqual(table.values, [['B', 'A'], ['2', '1'], ['4', '3']])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,11 +14,41 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import os
+import tempfile
 import unittest
 
+from gherkin_objects.objects import FeatureFile
+
 
 class MyTestCase(unittest.TestCase):
-    pass
+
+    def setUp(self) -> None:
+        file_descriptor, self.path = tempfile.mkstemp(suffix='.feature')
+        with os.fdopen(file_descriptor, 'w') as file:
+            file.write('Feature: feature\nScenario: scenario\nGiven step')
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_feature_file_eager(self):
+        feature_file = FeatureFile(self.path)
+        self.assertTrue(feature_file.is_loaded)
+        self.assertEqual(feature_file.feature.name, 'feature')
+        self.assertIs(feature_file.feature.parent, feature_file)
+
+    def test_feature_file_lazy(self):
+        feature_file = FeatureFile(self.path, lazy=True)
+        self.assertFalse(feature_file.is_loaded)
+        self.assertEqual(feature_file.feature.name, 'feature')
+        self.assertTrue(feature_file.is_loaded)
+        self.assertIs(feature_file.feature.parent, feature_file)
+
+    def test_feature_file_overwrite_keeps_parent(self):
+        feature_file = FeatureFile(self.path)
+        feature_file.overwrite('Feature: other')
+        self.assertEqual(feature_file.text, 'Feature: other')
+        self.assertIs(feature_file.feature.parent, feature_file)
 
 
 if __name__ == '__main__':
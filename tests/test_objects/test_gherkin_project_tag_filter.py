@@ -0,0 +1,218 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects.objects import Feature, GherkinProject, Scenario
+
+FIRST_TEXT = '''@smoke
+Feature: first
+Background:
+Given first background
+
+Scenario: one
+Given step one
+'''
+
+SECOND_TEXT = '''Feature: second
+Background:
+Given second background
+
+@smoke
+Scenario: two
+Given step two
+
+@wip
+Scenario: three
+Given step three
+
+Scenario Outline: four
+Given <a>
+@smoke
+Examples:
+| a |
+| 1 |
+| 2 |
+@slow
+Examples:
+| a |
+| 3 |
+'''
+
+THIRD_TEXT = '''@wip
+Feature: third
+Background:
+Given third background
+
+@smoke
+Scenario: five
+Given step five
+'''
+
+
+class TagFilterTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = [
+            self.write('first.feature', FIRST_TEXT),
+            self.write('second.feature', SECOND_TEXT),
+            self.write('third.feature', THIRD_TEXT),
+        ]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def names(self, scenarios):
+        return [scenario.name for scenario in scenarios]
+
+
+class GherkinProjectTagFilterTests(TagFilterTestCase):
+
+    def test_without_tag_expression(self):
+        project = GherkinProject(self.paths)
+        self.assertIsNone(project.tag_filter)
+        self.assertEqual(len(project.scenarios), 8)
+        self.assertEqual(len(project.decomposed_scenarios), 10)
+
+    def test_scenarios(self):
+        project = GherkinProject(self.paths, tag_expresssion='@smoke and not @wip')
+        expected = ['', 'one', '', 'two', 'four']
+        self.assertEqual(self.names(project.scenarios), expected)
+        self.assertEqual(self.names(project.iter_scenarios()), expected)
+
+    def test_decomposed_scenarios(self):
+        project = GherkinProject(self.paths, tag_expresssion='@smoke and not @wip')
+        expected = ['', 'one', '', 'two', 'four_1_1', 'four_2_2']
+        self.assertEqual(self.names(project.decomposed_scenarios), expected)
+        self.assertEqual(self.names(project.iter_decomposed_scenarios()), expected)
+
+    def test_outline_rows_filtered_before_decomposition(self):
+        project = GherkinProject(self.paths, tag_expresssion='@slow')
+        self.assertEqual(self.names(project.scenarios), ['', 'four'])
+        with mock.patch.object(Scenario, 'decompose', side_effect=AssertionError('Decomposed every table')):
+            self.assertEqual(self.names(project.decomposed_scenarios), ['', 'four_3_3'])
+
+    def test_background_only_with_matching_scenarios(self):
+        project = GherkinProject(self.paths, tag_expresssion='@missing')
+        self.assertEqual(list(project.scenarios), [])
+        self.assertEqual(list(project.decomposed_scenarios), [])
+        self.assertEqual(list(project.steps), [])
+
+    def test_feature_tags_short_circuit(self):
+        project = GherkinProject(self.paths, tag_expresssion='@smoke or @wip')
+        with mock.patch.object(project.tag_filter, 'evaluate', wraps=project.tag_filter.evaluate) as evaluate:
+            self.assertEqual(self.names(project.scenarios), ['', 'one', '', 'two', 'three', 'four', '', 'five'])
+        # Only the scenarios of the second feature, and each example table of its outline, are evaluated
+        self.assertEqual(evaluate.call_count, 4)
+
+    def test_steps(self):
+        project = GherkinProject(self.paths, tag_expresssion='@wip')
+        expected = ['Given second background', 'Given step three', 'Given third background', 'Given step five']
+        self.assertEqual([step.raw_text for step in project.steps], expected)
+        self.assertEqual([step.raw_text for step in project.iter_steps()], expected)
+        self.assertEqual([step.raw_text for step in project.decomposed_steps], expected)
+
+    def test_indexes_cover_whole_project(self):
+        project = GherkinProject(self.paths, tag_expresssion='@wip')
+        self.assertEqual(self.names(project.scenarios_with_tag('@slow')), ['four'])
+        self.assertIn('Given step one', project.unique_step_texts)
+
+    def test_lazy_project(self):
+        project = GherkinProject(self.paths, tag_expresssion='@smoke and not @wip', lazy=True)
+        self.assertEqual(project.scenarios[1].name, 'one')
+        self.assertFalse(project.feature_files[1].is_loaded)
+
+
+class GherkinProjectTagScanTests(TagFilterTestCase):
+    """Files which cannot match, judged from the tags in their text, are not parsed"""
+
+    def test_files_excluded(self):
+        with mock.patch.object(Feature, 'from_text', wraps=Feature.from_text) as from_text:
+            project = GherkinProject(self.paths, tag_expresssion='@slow')
+            self.assertEqual(from_text.call_count, 1)
+        self.assertEqual([feature_file.excluded for feature_file in project.feature_files], [True, False, True])
+        self.assertFalse(project.feature_files[0].is_loaded)
+        self.assertEqual(self.names(project.decomposed_scenarios), ['', 'four_3_3'])
+        self.assertEqual(self.names(project.iter_scenarios()), ['', 'four'])
+
+    def test_feature_tags_exclude_files(self):
+        project = GherkinProject(self.paths, tag_expresssion='@smoke and not @wip')
+        self.assertEqual([feature_file.excluded for feature_file in project.feature_files], [False, False, True])
+        self.assertEqual(self.names(project.scenarios), ['', 'one', '', 'two', 'four'])
+
+    def test_excluded_feature_still_accessible(self):
+        project = GherkinProject(self.paths, tag_expresssion='@slow')
+        self.assertEqual(project.feature_files[0].feature.name, 'first')
+        self.assertFalse(project.feature_files[0].excluded)
+        self.assertEqual(self.names(project.scenarios_with_tag('@wip')), ['three', 'five'])
+        self.assertEqual(self.names(project.scenarios), ['', 'four'])
+
+    def test_refresh_rescans_excluded_files(self):
+        project = GherkinProject(self.paths, tag_expresssion='@slow')
+        self.assertFalse(project.refresh().modified)
+
+        self.write('first.feature', FIRST_TEXT.replace('Scenario: one', '@slow\nScenario: one') + '\n')
+        self.write('new.feature', 'Feature: new\n@fast\nScenario: six\nGiven step\n')
+        project.paths = project.paths + [os.path.join(self.temp_dir, 'new.feature')]
+        changes = project.refresh()
+        self.assertEqual(changes.modified, [self.paths[0]])
+        self.assertFalse(project.feature_files[0].excluded)
+        self.assertTrue(project.feature_files[-1].excluded)
+        self.assertEqual(self.names(project.scenarios), ['', 'one', '', 'four'])
+
+    def test_lazy_project(self):
+        project = GherkinProject(self.paths, tag_expresssion='@slow', lazy=True)
+        self.assertEqual(self.names(project.iter_scenarios()), ['', 'four'])
+        self.assertFalse(any(feature_file.excluded for feature_file in project.feature_files))
+        self.assertEqual(self.names(project.scenarios), ['', 'four'])
+        self.assertEqual([feature_file.excluded for feature_file in project.feature_files], [True, False, True])
+
+    def test_parallel_load(self):
+        project = GherkinProject(self.paths, tag_expresssion='@slow', workers=2)
+        self.assertEqual([feature_file.excluded for feature_file in project.feature_files], [True, False, True])
+        self.assertEqual(self.names(project.decomposed_scenarios), ['', 'four_3_3'])
+        self.assertEqual(project.errors, [])
+
+    def test_same_views_as_without_scan(self):
+        for expression in ['@smoke', 'not @smoke', '@wip or @slow', 'not @wip and not @slow', '@missing', '']:
+            project = GherkinProject(self.paths, tag_expresssion=expression)
+            features = GherkinProject(self.paths).features
+            tag_filter = project.tag_filter
+            with self.subTest(expression=expression):
+                if tag_filter is None:
+                    self.assertFalse(any(feature_file.excluded for feature_file in project.feature_files))
+                    continue
+                expected = [scenario for feature in features for scenario in tag_filter.iter_scenarios(feature)]
+                self.assertEqual(self.names(project.scenarios), self.names(expected))
+                expected = [
+                    scenario for feature in features for scenario in tag_filter.iter_decomposed_scenarios(feature)
+                ]
+                self.assertEqual(self.names(project.decomposed_scenarios), self.names(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,7 @@ import os
 import shutil
 import unittest
 
-from gherkin_objects.objects import GherkinProject
+from gherkin_objects.objects import GherkinProject, GherkinProjectConfig, InvalidGherkinError
 
 
 class MyTestCase(unittest.TestCase):
@@ -54,6 +54,162 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(len(project.feature_files), 1)
         self.assertIsNotNone(project.feature_files[0].feature)
 
+    def test_gherkin_project_load_parallel(self):
+        paths = [self.make_path(f'dir{i}/temp{i}.feature') for i in range(4)]
+        for path in paths:
+            self.make_temp_feature(path)
+        project = GherkinProject.load_parallel(paths=paths, workers=2)
+
+        self.assertEqual(len(project.feature_files), 4)
+        self.assertEqual(project.errors, [])
+        for path, feature_file in zip(paths, project.feature_files):
+            self.assertEqual(feature_file.path, path)
+            self.assertIs(feature_file.parent, project)
+            self.assertIs(feature_file.feature.parent, feature_file)
+            self.assertEqual(feature_file.feature.name, path)
+
+    def test_gherkin_project_load_parallel_collects_errors(self):
+        valid_path = self.make_path('valid.feature')
+        invalid_path = self.make_path('invalid.feature')
+        self.make_temp_feature(valid_path)
+        self.make_temp_feature(invalid_path, text='Scenario: no feature')
+        project = GherkinProject(paths=[valid_path, invalid_path], workers=2)
+
+        self.assertEqual([f.path for f in project.feature_files], [valid_path])
+        self.assertEqual(len(project.errors), 1)
+        path, error = project.errors[0]
+        self.assertEqual(path, invalid_path)
+        self.assertIsInstance(error, InvalidGherkinError)
+        self.assertEqual(project.paths, [valid_path])
+        self.assertEqual(project.common_root_path, self.root + os.path.sep)
+
+        # The file is tried again, and only reported once while it stays invalid
+        self.assertFalse(project.refresh().has_changes)
+        self.assertEqual([path for path, _ in project.errors], [invalid_path])
+
+        self.make_temp_feature(invalid_path, text='Feature: fixed')
+        changes = project.refresh()
+        self.assertEqual(changes.added, [invalid_path])
+        self.assertEqual(project.paths, [valid_path, invalid_path])
+        self.assertEqual(project.features[1].name, 'fixed')
+        self.assertEqual(project.errors, [])
+
+    def test_gherkin_project_lazy(self):
+        paths = [self.make_path(f'temp{i}.feature') for i in range(3)]
+        for path in paths:
+            self.make_temp_feature(path)
+        project = GherkinProject(paths=paths, lazy=True)
+
+        self.assertFalse(any(f.is_loaded for f in project.feature_files))
+        self.assertEqual(project.feature_files[2].relative_path_to_common_root, 'temp2.feature')
+        self.assertFalse(any(f.is_loaded for f in project.feature_files))
+
+        self.assertEqual(project.features[1].name, paths[1])
+        self.assertEqual([f.is_loaded for f in project.feature_files], [True, True, False])
+
+        self.assertEqual(len(project.features), 3)
+        self.assertTrue(all(f.is_loaded for f in project.feature_files))
+
+    def test_gherkin_project_generators(self):
+        text = '\n'.join([
+            'Feature: feature',
+            'Scenario: scenario',
+            'Given step',
+            'Scenario Outline: outline',
+            'Given <A>',
+            'Then <B>',
+            'Examples:',
+            '| A | B |',
+            '| 1 | 2 |',
+            '| 3 | 4 |',
+        ])
+        paths = [self.make_path(f'temp{i}.feature') for i in range(2)]
+        for path in paths:
+            self.make_temp_feature(path, text=text)
+        eager = GherkinProject(paths=paths)
+        lazy = GherkinProject(paths=paths, lazy=True)
+
+        self.assertEqual(len(list(lazy.iter_features())), 2)
+        self.assertEqual(len(list(lazy.iter_scenarios())), 4)
+        self.assertEqual(len(list(lazy.iter_steps())), 6)
+        self.assertEqual([s.name for s in lazy.iter_decomposed_scenarios()],
+                         [s.name for s in eager.decomposed_scenarios])
+        self.assertEqual([s.raw_text for s in lazy.iter_decomposed_steps()],
+                         [s.raw_text for s in eager.decomposed_steps])
+
+        # Iterating a lazy project does not keep the features it parsed
+        self.assertFalse(any(f.is_loaded for f in lazy.feature_files))
+        feature = next(lazy.iter_features())
+        self.assertIs(feature.parent, lazy.feature_files[0])
+
+        # Features which are already loaded are reused
+        self.assertIs(next(eager.iter_features()), eager.feature_files[0].feature)
+
+    def test_gherkin_project_refresh_incremental(self):
+        path1 = self.make_path('temp1.feature')
+        path2 = self.make_path('temp2.feature')
+        path3 = self.make_path('temp3.feature')
+        self.make_temp_feature(path1)
+        self.make_temp_feature(path2)
+        config = GherkinProjectConfig(path=self.make_path('project.json'), include=[self.root])
+        project = GherkinProject.from_config(config)
+        features = project.features
+
+        changes = project.refresh()
+        self.assertFalse(changes.has_changes)
+        self.assertEqual(project.features, features)
+
+        self.make_temp_feature(path1, text='Feature: modified')
+        os.remove(path2)
+        self.make_temp_feature(path3)
+        changes = project.refresh()
+
+        self.assertEqual(changes.added, [path3])
+        self.assertEqual(changes.modified, [path1])
+        self.assertEqual(changes.removed, [path2])
+        self.assertEqual(project.paths, [path1, path3])
+        self.assertEqual([feature.name for feature in project.features], ['modified', path3])
+        self.assertIs(project.features[1].parent.parent, project)
+
+    def test_gherkin_project_refresh_force(self):
+        path = self.make_path('temp.feature')
+        self.make_temp_feature(path)
+        project = GherkinProject(paths=[path])
+        feature = project.features[0]
+
+        changes = project.refresh(force=True)
+        self.assertEqual(changes.modified, [path])
+        self.assertIsNot(project.features[0], feature)
+
+    def test_gherkin_project_refresh_invalid_gherkin(self):
+        path = self.make_path('temp.feature')
+        added_path = self.make_path('temp_added.feature')
+        self.make_temp_feature(path, text='Feature: valid')
+        config = GherkinProjectConfig(path=self.make_path('project.json'), include=[self.root])
+        project = GherkinProject.from_config(config)
+
+        self.make_temp_feature(path, text='Scenario: no feature')
+        self.make_temp_feature(added_path, text='Feature: added')
+        changes = project.refresh()
+        self.assertEqual(changes.added, [added_path])
+        self.assertEqual(changes.modified, [])
+        self.assertEqual([error_path for error_path, _ in project.errors], [path])
+        self.assertIsInstance(project.errors[0][1], InvalidGherkinError)
+        # The file keeps its last valid contents, and is still modified until it is valid again
+        feature_file = project.feature_files[0]
+        self.assertEqual(feature_file.text, 'Feature: valid')
+        self.assertEqual(feature_file.feature.name, 'valid')
+        self.assertTrue(feature_file.is_modified)
+        self.assertEqual([feature.name for feature in project.features], ['valid', 'added'])
+
+        self.assertFalse(project.refresh().has_changes)
+        self.assertEqual([error_path for error_path, _ in project.errors], [path])
+
+        self.make_temp_feature(path, text='Feature: fixed')
+        self.assertEqual(project.refresh().modified, [path])
+        self.assertEqual(project.features[0].name, 'fixed')
+        self.assertEqual(feature_file.text, 'Feature: fixed')
+        self.assertEqual(project.errors, [])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from gherkin_objects.objects import GherkinProject, GherkinProjectConfig, Scenario, Tag
+
+
+class ProjectIndexTests(unittest.TestCase):
+
+    first_text = '''@feature_uuid:f1 @smoke
+Feature: first
+Background:
+Given background
+@uuid:s1
+Scenario: one
+Given step
+@uuid:s2 @slow
+Scenario Outline: two
+Given <a>
+@tabled
+Examples:
+| a |
+| 1 |
+'''
+
+    second_text = '''Feature: second
+@uuid:s3 @slow
+Scenario: three
+Given step
+'''
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.first_path = self.write('first.feature', self.first_text)
+        self.second_path = self.write('second.feature', self.second_text)
+        config = GherkinProjectConfig(path=os.path.join(self.temp_dir, 'config.json'), include=[self.temp_dir])
+        self.project = GherkinProject.from_config(config)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def names(self, scenarios):
+        return sorted(scenario.name for scenario in scenarios)
+
+    def test_lookups(self):
+        self.assertEqual(self.names(self.project.scenarios_with_tag('@smoke')), ['one', 'two'])
+        self.assertEqual(self.names(self.project.scenarios_with_tag('slow')), ['three', 'two'])
+        self.assertEqual(self.names(self.project.scenarios_with_tag('@tabled')), ['two'])
+        self.assertEqual(self.project.scenarios_with_tag('@missing'), [])
+        self.assertEqual(self.project.scenario_by_uuid('s3').name, 'three')
+        self.assertIsNone(self.project.scenario_by_uuid('missing'))
+        self.assertEqual(self.project.feature_by_uuid('f1').name, 'first')
+
+    def test_add_tag_and_scenario(self):
+        self.assertEqual(self.project.scenarios_with_tag('@new'), [])
+        feature = self.project.feature_by_uuid('f1')
+        second = self.project.scenario_by_uuid('s3')
+
+        second.add_tag(Tag('@new'))
+        self.assertEqual(self.names(self.project.scenarios_with_tag('@new')), ['three'])
+        feature.add_tag(Tag('@new'))
+        self.assertEqual(self.names(self.project.scenarios_with_tag('@new')), ['one', 'three', 'two'])
+
+        scenario = Scenario.from_text('@uuid:s4\nScenario: four\nGiven step')
+        feature.add_scenario(scenario)
+        self.assertIs(self.project.scenario_by_uuid('s4'), scenario)
+        self.assertIn(scenario, self.project.scenarios_with_tag('@smoke'))
+
+    def test_refresh(self):
+        self.assertEqual(self.project.scenario_by_uuid('s1').name, 'one')
+
+        self.write('first.feature', self.first_text.replace('@uuid:s1', '@uuid:s1-changed'))
+        os.remove(self.second_path)
+        self.write('third.feature', 'Feature: third\n@uuid:s5 @slow\nScenario: five\nGiven step')
+        self.project.refresh()
+
+        self.assertIsNone(self.project.scenario_by_uuid('s1'))
+        self.assertEqual(self.project.scenario_by_uuid('s1-changed').name, 'one')
+        self.assertIsNone(self.project.scenario_by_uuid('s3'))
+        self.assertEqual(self.names(self.project.scenarios_with_tag('@slow')), ['five', 'two'])
+
+
+if __name__ == '__main__':
+    unittest.main()
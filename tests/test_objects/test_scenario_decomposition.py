@@ -103,6 +103,51 @@ class MyTestCase(unittest.TestCase):
                 Tag(text='@tag2', parent=scenario2),
             ]))
 
+    def test_iter_decompose_is_lazy(self):
+        text = """
+        Feature: feature
+        Scenario: scenario
+        Given step
+        Scenario Outline: outline
+        Given <A>
+        Examples:
+        | A |
+        | 1 |
+        | 2 |
+        """
+        feature = Feature.from_text(text)
+        outline = feature.scenarios[1]
+
+        scenarios = outline.iter_decompose()
+        first = next(scenarios)
+        self.assertEqual(first.steps[0].raw_text, 'Given 1')
+        self.assertEqual([scenario.steps[0].raw_text for scenario in scenarios], ['Given 2'])
+
+        self.assertEqual(
+            [scenario.name for scenario in feature.iter_decomposed_scenarios()],
+            ['scenario', 'outline_1_1', 'outline_2_2'])
+        self.assertEqual(
+            [scenario.name for scenario in feature.iter_decomposed_scenarios()],
+            [scenario.name for scenario in feature.decomposed_scenarios])
+
+    def test_decompose_substitutes_data_tables(self):
+        text = """
+        Scenario Outline: outline
+        Given a   <A>   with <B>
+        | name | <A> |
+        | <B>  | <C> |
+        Examples:
+        | A | B     |
+        | 1 | x <A> |
+        """
+        outline = Scenario.from_text(text)
+        step = outline.decompose()[0].steps[0]
+        self.assertEqual(step.raw_text, 'Given a 1 with x <A>')
+        self.assertEqual(step.data_table.rows, [['name', '1'], ['x <A>', '<C>']])
+        self.assertIs(step.data_table.parent, step)
+        # The outline itself is unchanged
+        self.assertEqual(outline.steps[0].data_table.rows, [['name', '<A>'], ['<B>', '<C>']])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 import unittest
-from gherkin_objects.objects import Scenario, ScenarioType, StepType, StepKeyword, Feature
+from gherkin_objects.objects import Scenario, ScenarioType, Step, StepType, StepKeyword, Feature
 
 
 class TestScenarios(unittest.TestCase):
@@ -148,6 +148,57 @@ class TestScenarios(unittest.TestCase):
         actual_tags = [tag.text for tag in feature.scenarios[0].all_tags]
         self.assertSequenceEqual(expected_tags, actual_tags)
 
+    def test_scenario_all_steps_with_background(self):
+        text = '\n'.join([
+            'Feature: feature',
+            'Background:',
+            'Given background',
+            'Scenario: scenario',
+            'Given step',
+            'Scenario Outline: outline',
+            'Given <A>',
+            'Examples:',
+            '| A |',
+            '| 1 |',
+        ])
+        feature = Feature.from_text(text)
+        background, scenario, outline = feature.scenarios
+        expected_texts = ['Given background', 'Given step']
+        self.assertEqual([step.raw_text for step in scenario.all_steps], expected_texts)
+        self.assertIs(scenario.all_steps, scenario.all_steps)
+        self.assertEqual(background.all_steps, background.steps)
+
+        # A decomposed scenario already holds the background steps
+        decomposed = outline.decompose()[0]
+        self.assertEqual([step.raw_text for step in decomposed.all_steps], ['Given background', 'Given 1'])
+
+    def test_scenario_all_steps_after_adding_steps(self):
+        text = '\n'.join([
+            'Feature: feature',
+            'Background:',
+            'Given background',
+            'Scenario: scenario',
+            'Given step',
+        ])
+        feature = Feature.from_text(text)
+        background, scenario = feature.scenarios
+        self.assertEqual(len(scenario.all_steps), 2)
+
+        background.add_step(Step(StepKeyword.AND, 'more background', step_type=StepType.GIVEN))
+        scenario.add_step(Step(StepKeyword.WHEN, 'another step'))
+        expected_texts = ['Given background', 'And more background', 'Given step', 'When another step']
+        self.assertEqual([step.raw_text for step in scenario.all_steps], expected_texts)
+
+        # Steps appended directly are seen too
+        scenario.steps.append(Step(StepKeyword.THEN, 'last step'))
+        self.assertEqual(scenario.all_steps[-1].raw_text, 'Then last step')
+
+    def test_scenario_all_steps_without_duplicate_background_steps(self):
+        feature = Feature.from_text('Feature: feature\nBackground:\nGiven background\nScenario: scenario')
+        background, scenario = feature.scenarios
+        scenario.steps.insert(0, background.steps[0])
+        self.assertEqual([step.raw_text for step in scenario.all_steps], ['Given background'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,273 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from random import Random
+
+from gherkin_objects.catalog import StepCompletion, StepCompletionIndex
+from gherkin_objects.objects import GherkinProject, GherkinProjectConfig, Step, StepKeyword, StepType
+
+
+class StepCatalogTests(unittest.TestCase):
+
+    first_text = '''Feature: first
+Background:
+Given I am logged in
+Scenario: one
+Given a cart
+And I am logged in
+When I check out
+Scenario Outline: two
+Given a cart
+When I buy <n> items
+Examples:
+| n |
+| 1 |
+| 2 |
+'''
+
+    second_text = '''Feature: second
+Scenario: three
+Given a cart
+Then I see <n>
+'''
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.first_path = self.write('first.feature', self.first_text)
+        self.second_path = self.write('second.feature', self.second_text)
+        config = GherkinProjectConfig(path=os.path.join(self.temp_dir, 'config.json'), include=[self.temp_dir])
+        self.project = GherkinProject.from_config(config)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def test_unique_step_texts(self):
+        self.assertEqual(self.project.unique_step_texts, [
+            'Given I am logged in',
+            'Given a cart',
+            'When I check out',
+            'When I buy <n> items',
+            'Then I see <n>',
+        ])
+        self.assertEqual(self.project.unique_decomposed_step_texts, [
+            'Given I am logged in',
+            'Given a cart',
+            'When I check out',
+            'When I buy 1 items',
+            'When I buy 2 items',
+            'Then I see <n>',
+        ])
+
+    def test_occurrences(self):
+        catalog = self.project.step_catalog
+        self.assertEqual(len(catalog), 5)
+        self.assertIn('Given a cart', catalog)
+
+        entry = catalog['Given a cart']
+        self.assertEqual(entry.count, 3)
+        self.assertEqual(entry.step_type, StepType.GIVEN)
+        self.assertEqual([feature.name for feature in entry.features], ['first', 'second'])
+        self.assertEqual([occurrence.scenario.name for occurrence in entry.occurrences], ['one', 'two', 'three'])
+        self.assertEqual(entry.occurrences[2].path, self.second_path)
+
+        # A step after And is cataloged under its real keyword
+        self.assertEqual(catalog.count('Given I am logged in'), 2)
+        self.assertEqual(catalog.count('And I am logged in'), 0)
+        self.assertEqual(catalog.occurrences('missing'), [])
+
+        self.assertEqual(catalog.most_common(1)[0].text, 'Given a cart')
+        self.assertEqual([entry.text for entry in catalog.with_step_type(StepType.THEN)], ['Then I see <n>'])
+
+    def test_decomposed_occurrences(self):
+        catalog = self.project.decomposed_step_catalog
+        # The background, scenario one, and each row of the outline, which repeats the background step
+        self.assertEqual(catalog.count('Given I am logged in'), 4)
+        self.assertEqual(catalog.count('Given a cart'), 4)
+
+    def test_add_step(self):
+        catalog = self.project.step_catalog
+        scenario = self.project.features[1].scenarios[0]
+        scenario.add_step(Step(StepKeyword.THEN, 'I am done'))
+        self.assertEqual(catalog.count('Then I am done'), 1)
+
+    def test_refresh(self):
+        catalog = self.project.step_catalog
+        self.assertEqual(catalog.count('Given a cart'), 3)
+
+        self.write('first.feature', self.first_text.replace('When I check out', 'When I pay'))
+        os.remove(self.second_path)
+        self.write('third.feature', 'Feature: third\nScenario: four\nGiven a cart')
+        self.project.refresh()
+
+        self.assertNotIn('When I check out', catalog)
+        self.assertNotIn('Then I see <n>', catalog)
+        self.assertEqual(catalog.count('When I pay'), 1)
+        self.assertEqual(catalog.count('Given a cart'), 3)
+        self.assertEqual({occurrence.path for occurrence in catalog.occurrences('Given a cart')},
+                         {self.first_path, os.path.join(self.temp_dir, 'third.feature')})
+
+    def test_step_completions(self):
+        completions = self.project.step_completions
+        self.assertEqual(completions.complete('a', StepType.GIVEN), [StepCompletion('a cart', StepType.GIVEN, 3)])
+        self.assertEqual([completion.real_text for completion in completions.complete('I ')], [
+            'Given I am logged in',
+            'When I buy <n> items',
+            'When I check out',
+            'Then I see <n>',
+        ])
+        self.assertEqual(completions.count(StepType.GIVEN, 'I am logged in'), 2)
+
+        self.write('first.feature', self.first_text.replace('When I check out', 'When I pay'))
+        os.remove(self.second_path)
+        self.project.refresh()
+        self.assertEqual(completions.complete('I', StepType.WHEN, limit=5), [
+            StepCompletion('I buy <n> items', StepType.WHEN, 1),
+            StepCompletion('I pay', StepType.WHEN, 1),
+        ])
+        self.assertEqual(completions.complete('a', StepType.GIVEN), [StepCompletion('a cart', StepType.GIVEN, 2)])
+
+    def test_step_completions_insert_before_query(self):
+        completions = self.project.step_completions
+        completions.insert(StepType.GIVEN, 'zzz unique step', 5)
+        completions.delete(StepType.GIVEN, 'a cart', 1)
+        self.assertEqual(completions.count(StepType.GIVEN, 'zzz unique step'), 5)
+        self.assertEqual(completions.complete('', StepType.GIVEN, limit=2), [
+            StepCompletion('zzz unique step', StepType.GIVEN, 5),
+            StepCompletion('I am logged in', StepType.GIVEN, 2),
+        ])
+
+
+class StepCompletionIndexTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.completions = StepCompletionIndex()
+        for text, count in [('I log in', 3), ('I log out', 1), ('I look around', 5), ('a user', 2)]:
+            self.completions.insert(StepType.GIVEN, text, count)
+        self.completions.insert(StepType.THEN, 'I log in', 4)
+
+    def texts(self, completions):
+        return [completion.real_text for completion in completions]
+
+    def test_prefix(self):
+        self.assertEqual(self.texts(self.completions.complete('I lo', StepType.GIVEN)),
+                         ['Given I look around', 'Given I log in', 'Given I log out'])
+        self.assertEqual(self.texts(self.completions.complete('I log', StepType.GIVEN)),
+                         ['Given I log in', 'Given I log out'])
+        self.assertEqual(self.completions.complete('missing'), [])
+        self.assertEqual(self.completions.complete('', limit=0), [])
+
+    def test_every_step_type(self):
+        self.assertEqual(self.texts(self.completions.complete('I', limit=3)),
+                         ['Given I look around', 'Then I log in', 'Given I log in'])
+        self.assertEqual(len(self.completions), 5)
+
+    def test_insert_and_delete(self):
+        self.completions.insert(StepType.GIVEN, 'I log out', 9)
+        self.assertEqual(self.texts(self.completions.complete('I', StepType.GIVEN, limit=1)), ['Given I log out'])
+        self.completions.delete(StepType.GIVEN, 'I log out', 10)
+        self.assertEqual(self.completions.count(StepType.GIVEN, 'I log out'), 0)
+        self.assertEqual(self.texts(self.completions.complete('I log', StepType.GIVEN)), ['Given I log in'])
+
+    def test_many_matches(self):
+        completions = StepCompletionIndex()
+        for i in range(StepCompletionIndex.BLOCK_SIZE * 8):
+            completions.insert(StepType.WHEN, f'step {i:05}', i % 7)
+        completions.insert(StepType.WHEN, 'other step', 100)
+        expected = sorted((f'step {i:05}' for i in range(StepCompletionIndex.BLOCK_SIZE * 8) if i % 7 == 6))[:3]
+        self.assertEqual([completion.text for completion in completions.complete('step', limit=3)], expected)
+        self.assertEqual([completion.text for completion in completions.complete('', limit=1)], ['other step'])
+
+    def expected_completions(self, counts, prefix, limit):
+        matches = sorted((-count, text) for text, count in counts.items() if count > 0 and text.startswith(prefix))
+        return [text for _, text in matches[:limit]]
+
+    def test_many_matches_with_equal_counts(self):
+        completions = StepCompletionIndex()
+        counts = {f'step {i}': 1 for i in range(StepCompletionIndex.BLOCK_SIZE * 20)}
+        for text, count in counts.items():
+            completions.insert(StepType.WHEN, text, count)
+        counts['step 4321'] = 2
+        completions.insert(StepType.WHEN, 'step 4321')
+        for prefix in ['', 'step', 'step 1', 'step 19', 'step 199', 'step 43', 'step 4321', 'step 9', 'z']:
+            with self.subTest(prefix=prefix):
+                self.assertEqual([completion.text for completion in completions.complete(prefix, limit=10)],
+                                 self.expected_completions(counts, prefix, 10))
+
+    def test_insert_and_delete_many(self):
+        completions = StepCompletionIndex()
+        random = Random(0)
+        counts = {}
+        for _ in range(StepCompletionIndex.BLOCK_SIZE * 30):
+            text = f'step {random.randrange(StepCompletionIndex.BLOCK_SIZE * 10)}'
+            if counts.get(text) and random.random() < 0.4:
+                count = random.randint(1, counts[text])
+                counts[text] -= count
+                completions.delete(StepType.THEN, text, count)
+            else:
+                count = random.randint(1, 3)
+                counts[text] = counts.get(text, 0) + count
+                completions.insert(StepType.THEN, text, count)
+        self.assertEqual(len(completions), sum(1 for count in counts.values() if count > 0))
+        for prefix in ['', 'step', 'step 1', 'step 25', 'step 999']:
+            with self.subTest(prefix=prefix):
+                self.assertEqual([completion.text for completion in completions.complete(prefix, limit=10)],
+                                 self.expected_completions(counts, prefix, 10))
+
+        # Removing everything leaves nothing to suggest
+        for text, count in counts.items():
+            if count > 0:
+                completions.delete(StepType.THEN, text, count)
+        self.assertEqual(len(completions), 0)
+        self.assertEqual(completions.complete('step'), [])
+
+    def test_block_size(self):
+        class SmallBlocks(StepCompletionIndex):
+            BLOCK_SIZE = 3
+
+        with self.assertRaises(ValueError):
+            SmallBlocks()
+
+        # The smallest block size still splits and merges blocks correctly
+        SmallBlocks.BLOCK_SIZE = 4
+        completions = SmallBlocks()
+        random = Random(0)
+        counts = {}
+        for _ in range(2000):
+            text = f'step {random.randrange(100)}'
+            if counts.get(text) and random.random() < 0.5:
+                counts[text] -= 1
+                completions.delete(StepType.THEN, text)
+            else:
+                counts[text] = counts.get(text, 0) + 1
+                completions.insert(StepType.THEN, text)
+        for prefix in ['', 'step 1', 'step 42']:
+            with self.subTest(prefix=prefix):
+                self.assertEqual([completion.text for completion in completions.complete(prefix, limit=10)],
+                                 self.expected_completions(counts, prefix, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
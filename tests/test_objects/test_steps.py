@@ -215,6 +215,12 @@ class MyTestCase(unittest.TestCase):
         self.assertSequenceEqual(actual_data_table_rows,
                                  expected_data_table_rows)
 
+    def test_parameters(self):
+        step = Step.from_text('Given <a> and <b>')
+        self.assertEqual(step.parameters, ['a', 'b'])
+        step._text = 'only <c>'
+        self.assertEqual(step.parameters, ['c'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from gherkin_objects.objects import GherkinProject, SymbolTable, Tag
+
+
+class MyTestCase(unittest.TestCase):
+
+    text = '''
+    @common @feature_tag
+    Feature: feature
+
+    @common
+    Scenario Outline: outline
+    Given a shared step
+    Then <value>
+
+    @row_tag
+    Examples:
+    | value |
+    | 1     |
+    | 2     |
+    '''
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(2):
+            path = os.path.join(self.temp_dir, f'{i}.feature')
+            with open(path, 'w') as file:
+                file.write(self.text)
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_tag_ids(self):
+        symbols = SymbolTable()
+        self.assertEqual(symbols.tag_id('@a'), 0)
+        self.assertEqual(symbols.tag_id('@b'), 1)
+        self.assertEqual(symbols.tag_id('@a'), 0)
+        self.assertEqual(symbols.tag_texts, ['@a', '@b'])
+
+        tag = symbols.intern_tag(Tag('@b'))
+        self.assertEqual(tag.tag_id, 1)
+
+    def test_project_shares_strings(self):
+        project = GherkinProject(paths=self.paths)
+        feature1, feature2 = project.features
+
+        self.assertIs(feature1.tags[0].text, feature2.tags[0].text)
+        self.assertIs(feature1.tags[0].text, feature1.scenarios[0].tags[0].text)
+        self.assertEqual(feature1.tags[0].tag_id, feature1.scenarios[0].tags[0].tag_id)
+        self.assertEqual(project.symbols.tag_texts, ['@common', '@feature_tag', '@row_tag'])
+
+        step1 = feature1.scenarios[0].steps[0]
+        step2 = feature2.scenarios[0].steps[0]
+        self.assertIs(step1.text_without_keyword, step2.text_without_keyword)
+
+    def test_decomposed_scenarios_share_strings(self):
+        project = GherkinProject(paths=self.paths)
+        scenario1, scenario2, _, _ = project.decomposed_scenarios
+
+        self.assertIs(scenario1.tags[0].text, scenario2.tags[0].text)
+        self.assertEqual([tag.tag_id for tag in scenario1.tags], [0, 2])
+        self.assertIs(scenario1.tags[0].parent, scenario1)
+        self.assertIs(scenario1.steps[0].text_without_keyword,
+                      scenario2.steps[0].text_without_keyword)
+
+    def test_decomposing_does_not_grow_table(self):
+        project = GherkinProject(paths=self.paths)
+        symbol_count = len(project.symbols)
+        outline = project.features[0].scenarios[0]
+        for i in range(100):
+            outline.tables[0].add_row([str(i)])
+        self.assertEqual(len(list(project.decomposed_scenarios)), 4 + 100)
+        self.assertEqual(len(project.symbols), symbol_count)
+
+    def test_transient_features_not_interned(self):
+        project = GherkinProject(paths=self.paths, lazy=True)
+        scenarios = list(project.iter_decomposed_scenarios())
+        self.assertEqual(len(scenarios), 4)
+        self.assertEqual(len(project.symbols), 0)
+        self.assertEqual(project.symbols.tag_texts, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from glob import glob
+
+from gherkin_objects.paths import PathResolver
+
+
+class PathResolverTests(unittest.TestCase):
+
+    files = [
+        'a/one.feature',
+        'a/two.feature',
+        'a/notes.txt',
+        'a/.hidden.feature',
+        'a/b/three.feature',
+        'a/.hidden/four.feature',
+        'node_modules/pkg/five.feature',
+        'c/node_modules/six.feature',
+        'c/seven.feature',
+    ]
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        for file in self.files:
+            path = self.path(file)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'w').close()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root)
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def resolve(self, include, exclude=()):
+        return PathResolver([self.path(p) for p in include], [self.path(p) for p in exclude]).resolve()
+
+    def test_directory(self):
+        self.assertEqual(self.resolve(['a']), [
+            self.path('a/b/three.feature'),
+            self.path('a/one.feature'),
+            self.path('a/two.feature'),
+        ])
+
+    def test_matches_glob(self):
+        for pattern in ['**/*.feature', '*/*.feature', 'a/**', 'a/.hidden/*', '**/node_modules/**/*.feature']:
+            expected = sorted(p for p in glob(self.path(pattern), recursive=True) if os.path.isfile(p))
+            self.assertEqual(self.resolve([pattern]), expected, pattern)
+
+    def test_specific_files(self):
+        self.assertEqual(self.resolve(['a/notes.txt', 'a/one.feature'], exclude=['a/one.feature']),
+                         [self.path('a/notes.txt')])
+
+    def test_excluded_directories_are_pruned(self):
+        resolver = PathResolver([self.root], [self.path('node_modules'), self.path('**/node_modules/**')])
+        self.assertEqual(resolver.resolve(), [
+            self.path('a/b/three.feature'),
+            self.path('a/one.feature'),
+            self.path('a/two.feature'),
+            self.path('c/seven.feature'),
+        ])
+        self.assertNotIn(self.path('node_modules'), resolver.visited_directories)
+        self.assertNotIn(self.path('c/node_modules'), resolver.visited_directories)
+
+    def test_nested_roots_are_walked_once(self):
+        resolver = PathResolver([self.path('a/**/*.feature'), self.path('a/b')], [])
+        self.assertEqual(len(resolver.resolve()), 3)
+        self.assertEqual(len(resolver.visited_directories), len(set(resolver.visited_directories)))
+
+    def test_missing_pattern(self):
+        with self.assertLogs('gherkin_objects', level='WARNING'):
+            self.assertEqual(self.resolve(['missing/**/*.feature']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects.objects import Feature, GherkinProject
+from gherkin_objects.snapshot import InvalidSnapshotError
+
+
+class SnapshotTests(unittest.TestCase):
+
+    text = '''@feature-tag
+Feature: {name}
+Scenario Outline: scenario
+Given step <a>
+| x | y |
+Examples:
+| a |
+| 1 |
+'''
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = [self.write(name) for name in ('first', 'second', 'third')]
+        self.project = GherkinProject(paths=self.paths)
+        self.snapshot_path = os.path.join(self.temp_dir, 'project.snapshot')
+        self.project.save_snapshot(self.snapshot_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name: str, text: str = None) -> str:
+        path = os.path.join(self.temp_dir, f'{name}.feature')
+        with open(path, 'w') as file:
+            file.write(self.text.format(name=name) if text is None else text)
+        return path
+
+    def test_round_trip_without_parsing(self):
+        with mock.patch.object(Feature, 'from_text') as from_text:
+            project = GherkinProject.load_snapshot(self.snapshot_path)
+            self.assertEqual(project.paths, self.paths)
+            self.assertFalse(any(feature_file.is_loaded for feature_file in project.feature_files))
+
+            feature = project.feature_files[1].feature
+            from_text.assert_not_called()
+
+        self.assertEqual(feature.name, 'second')
+        self.assertIs(feature.parent, project.feature_files[1])
+        self.assertIs(feature.parent_project, project)
+        scenario = feature.scenarios[0]
+        self.assertIs(scenario.parent, feature)
+        self.assertIs(scenario.steps[0].parent, scenario)
+        self.assertEqual(scenario.steps[0].data_table.rows, [['x', 'y']])
+        self.assertEqual(scenario.tables[0].data_rows[0].cells[0].value, '1')
+        self.assertEqual(project.feature_files[1].text, self.text.format(name='second'))
+        self.assertEqual([tag.text for tag in feature.tags], ['@feature-tag'])
+
+    def test_stale_files_are_parsed_again(self):
+        self.write('second', self.text.format(name='changed'))
+        os.remove(self.paths[2])
+        # Same contents, different stat
+        os.utime(self.paths[0], ns=(0, 0))
+
+        project = GherkinProject.load_snapshot(self.snapshot_path)
+        self.assertEqual(project.paths, self.paths[:2])
+        self.assertEqual([feature.name for feature in project.features], ['first', 'changed'])
+        self.assertFalse(project.feature_files[0].is_modified)
+
+    def test_lazy_project(self):
+        self.write('second', self.text.format(name='changed'))
+        project = GherkinProject.load_snapshot(self.snapshot_path, lazy=True)
+        self.assertFalse(project.feature_files[1].is_loaded)
+        self.assertEqual([feature.name for feature in project.iter_features()], ['first', 'changed', 'third'])
+
+    def test_invalid_gherkin_is_collected(self):
+        self.write('second', 'Scenario: no feature')
+        project = GherkinProject.load_snapshot(self.snapshot_path)
+        self.assertEqual(project.paths, [self.paths[0], self.paths[2]])
+        self.assertEqual([path for path, _ in project.errors], [self.paths[1]])
+
+    def test_not_a_snapshot(self):
+        with self.assertRaises(InvalidSnapshotError):
+            GherkinProject.load_snapshot(self.paths[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
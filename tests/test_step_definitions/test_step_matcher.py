@@ -0,0 +1,177 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from gherkin_objects.objects import GherkinProject, StepType
+from gherkin_objects.step_definitions import (
+    InvalidStepDefinitionError,
+    StepDefinition,
+    StepMatcher,
+    regex_literal_prefix,
+    translate_cucumber_expression,
+)
+
+
+class CucumberExpressionTests(unittest.TestCase):
+
+    def matches(self, expression: str, text: str) -> bool:
+        return StepDefinition(expression).matches(text)
+
+    def test_parameters(self):
+        self.assertTrue(self.matches('I have {int} cukes', 'I have 42 cukes'))
+        self.assertTrue(self.matches('I have {int} cukes', 'I have -1 cukes'))
+        self.assertFalse(self.matches('I have {int} cukes', 'I have many cukes'))
+        self.assertTrue(self.matches('it weighs {float} kg', 'it weighs 1.5 kg'))
+        self.assertTrue(self.matches('I am {word}', 'I am here'))
+        self.assertFalse(self.matches('I am {word}', 'I am over there'))
+        self.assertTrue(self.matches('I say {string}', 'I say "hello there"'))
+        self.assertTrue(self.matches('I say {string}', "I say 'hi'"))
+        self.assertTrue(self.matches('anything {} goes', 'anything at all goes'))
+
+    def test_optional_and_alternative_text(self):
+        self.assertTrue(self.matches('I have {int} cuke(s)', 'I have 1 cuke'))
+        self.assertTrue(self.matches('I have {int} cuke(s)', 'I have 2 cukes'))
+        self.assertTrue(self.matches('I eat a cucumber/banana', 'I eat a banana'))
+        self.assertFalse(self.matches('I eat a cucumber/banana', 'I eat a apple'))
+
+    def test_optional_text_with_spaces(self):
+        self.assertTrue(self.matches('I have (a lot of) cukes', 'I have a lot of cukes'))
+        self.assertTrue(self.matches('I have (a lot of) cukes', 'I have  cukes'))
+        self.assertFalse(self.matches('I have (a lot of) cukes', 'I have a lot cukes'))
+        self.assertTrue(self.matches('I have {int} (big green) cuke(s)', 'I have 2 big green cukes'))
+        self.assertTrue(self.matches('I eat (a few) cucumbers/bananas', 'I eat a few bananas'))
+        self.assertTrue(self.matches('I eat (a few) cucumbers/bananas', 'I eat  cucumbers'))
+
+    def test_escapes(self):
+        self.assertTrue(self.matches(r'I see \(parentheses\) and \{braces\}', 'I see (parentheses) and {braces}'))
+        self.assertTrue(self.matches(r'a\/b', 'a/b'))
+        # Regular expression characters are literal in a Cucumber expression
+        self.assertTrue(self.matches('the price is $5.00?', 'the price is $5.00?'))
+        self.assertFalse(self.matches('the price is $5.00?', 'the price is $5000'))
+
+    def test_whole_text(self):
+        self.assertFalse(self.matches('I log in', 'I log in twice'))
+        self.assertFalse(self.matches('I log in', 'then I log in'))
+
+    def test_literal_prefix(self):
+        self.assertEqual(translate_cucumber_expression('I have {int} cukes')[1], 'I have ')
+        self.assertEqual(translate_cucumber_expression('I have cuke(s)')[1], 'I have cuke')
+        self.assertEqual(translate_cucumber_expression('I eat a/an apple')[1], 'I eat ')
+        self.assertEqual(translate_cucumber_expression('I have (a lot of) cukes')[1], 'I have ')
+
+    def test_custom_parameter_types(self):
+        definition = StepDefinition('I pick {color}', parameter_types={'color': 'red|green'})
+        self.assertTrue(definition.matches('I pick green'))
+        self.assertFalse(definition.matches('I pick blue'))
+        with self.assertRaises(InvalidStepDefinitionError):
+            StepDefinition('I pick {color}')
+
+
+class RegexTests(unittest.TestCase):
+
+    def test_regex_definitions(self):
+        definition = StepDefinition(r'^I have (\d+) cukes$')
+        self.assertTrue(definition.matches('I have 3 cukes'))
+        self.assertFalse(definition.matches('I have three cukes'))
+        self.assertEqual(definition.literal_prefix, 'I have ')
+        self.assertTrue(StepDefinition('/cukes/').matches('I have 3 cukes'))
+        self.assertTrue(StepDefinition(re.compile(r'^I (?:am|was) here$')).matches('I was here'))
+
+    def test_regex_literal_prefix(self):
+        self.assertEqual(regex_literal_prefix(r'^I log in$'), 'I log in')
+        self.assertEqual(regex_literal_prefix(r'^I logs? in$'), 'I log')
+        self.assertEqual(regex_literal_prefix(r'^I lo+g in$'), 'I lo')
+        self.assertEqual(regex_literal_prefix(r'^I\.e\. (\w+)$'), 'I.e. ')
+        self.assertEqual(regex_literal_prefix(r'^I\s+log$'), 'I')
+        self.assertEqual(regex_literal_prefix(r'^I log in|out$'), '')
+        self.assertEqual(regex_literal_prefix(r'I log in$'), '')
+        self.assertEqual(StepDefinition(re.compile('^I log in', re.IGNORECASE)).literal_prefix, '')
+
+    def test_invalid_regex(self):
+        with self.assertRaises(InvalidStepDefinitionError):
+            StepDefinition('^I (log in$')
+
+
+class StepMatcherTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.log_in = StepDefinition('I log in', location='steps.py:1')
+        self.log_in_as = StepDefinition('I log in as {word}', location='steps.py:2')
+        self.anything = StepDefinition(r'^(.*) as admin$', location='steps.py:3')
+        self.cart = StepDefinition('a cart with {int} item(s)', step_type=StepType.GIVEN)
+        self.matcher = StepMatcher([self.log_in, self.log_in_as, self.anything, self.cart])
+
+    def test_match_text(self):
+        self.assertEqual(self.matcher.match_text('I log in'), (self.log_in, ))
+        self.assertEqual(self.matcher.match_text('I log in as admin'), (self.log_in_as, self.anything))
+        self.assertEqual(self.matcher.match_text('I log out'), ())
+        self.assertEqual(self.matcher.match_text('a cart with 2 items', StepType.GIVEN), (self.cart, ))
+        self.assertEqual(self.matcher.match_text('a cart with 2 items', StepType.THEN), ())
+
+    def test_add_updates_cached_results(self):
+        self.assertEqual(self.matcher.match_text('I log out'), ())
+        log_out = StepDefinition('I log out')
+        self.matcher.add(log_out)
+        self.assertEqual(self.matcher.match_text('I log out'), (log_out, ))
+
+    def test_match_project(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'project.feature')
+            with open(path, 'w') as file:
+                file.write('\n'.join([
+                    'Feature: feature',
+                    'Scenario Outline: outline',
+                    'Given a cart with <n> items',
+                    'When I log in as <user>',
+                    'Then I log in',
+                    'And I am done',
+                    'Examples:',
+                    '| n | user  |',
+                    '| 1 | admin |',
+                    '| 2 | guest |',
+                ]))
+            project = GherkinProject([path])
+
+            report = self.matcher.match_project(project)
+            self.assertEqual(len(report), 4)
+            self.assertEqual(report['Then I log in'].definition, self.log_in)
+            self.assertEqual([result.text for result in report.matched], ['When I log in as <user>', 'Then I log in'])
+            self.assertEqual([result.text for result in report.unmatched],
+                             ['Given a cart with <n> items', 'Then I am done'])
+            self.assertEqual(report.ambiguous, [])
+
+            report = self.matcher.match_project(project, decomposed=True)
+            self.assertEqual([result.text for result in report.matched], [
+                'Given a cart with 1 items',
+                'Then I log in',
+                'Given a cart with 2 items',
+                'When I log in as guest',
+            ])
+            self.assertEqual([result.text for result in report.ambiguous], ['When I log in as admin'])
+            self.assertEqual(report['When I log in as admin'].definitions, (self.log_in_as, self.anything))
+            self.assertEqual([result.text for result in report.unmatched], ['Then I am done'])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,15 @@ limitations under the License.
 import unittest
 from typing import List
 
-from gherkin_objects.tag_filter import GherkinTagFilter
+from gherkin_objects.tag_filter import (
+    AndNode,
+    GherkinTagFilter,
+    NotNode,
+    OrNode,
+    TagExpressionNode,
+    TagNode,
+    parse_tag_expression,
+)
 
 
 class GherkinTagFilterExpressionConversionTests(unittest.TestCase):
@@ -104,6 +112,92 @@ class GherkinTagFilterEvaluationTests(unittest.TestCase):
         self.assertFalse(filter.evaluate(['@tag2', '@tag3']))  # 1 1 0
         self.assertFalse(filter.evaluate(['@tag1', '@tag2', '@tag3']))  # 1 1 1
 
+    def test_evaluate_precedence(self):
+        # not binds tightest, then and, then or
+        filter = GherkinTagFilter('@tag1 || @tag2 && !@tag3')
+        self.assertTrue(filter.evaluate(['@tag1', '@tag3']))
+        self.assertTrue(filter.evaluate(['@tag2']))
+        self.assertFalse(filter.evaluate(['@tag2', '@tag3']))
+
+    def test_evaluate_tags_with_regex_characters(self):
+        filter = GherkinTagFilter('@a.b')
+        self.assertTrue(filter.evaluate(['@a.b']))
+        self.assertFalse(filter.evaluate(['@axb']))
+
+    def test_evaluate_empty_expression(self):
+        self.assertTrue(GherkinTagFilter('').evaluate([]))
+
+    def test_evaluate_remembers_results(self):
+        filter = GherkinTagFilter('@tag1 && !@tag2')
+        filter.MAX_CACHED_RESULTS = 2
+        # The same tags in any order or collection, before and after the remembered results are discarded
+        for _ in range(2):
+            self.assertTrue(filter.evaluate(['@tag1']))
+            self.assertTrue(filter.evaluate(frozenset(['@tag1'])))
+            self.assertFalse(filter.evaluate(('@tag2', '@tag1')))
+            self.assertFalse(filter.evaluate(iter(['@tag1', '@tag2'])))
+            self.assertFalse(filter.evaluate([]))
+
+
+class GherkinTagFilterParsingTests(unittest.TestCase):
+    """These tests check that expressions are parsed into the expected tree"""
+
+    def test_parse(self):
+        self.assertEqual(parse_tag_expression('@a and not (@b or @c)'),
+                         AndNode(TagNode('@a'), NotNode(OrNode(TagNode('@b'), TagNode('@c')))))
+        self.assertEqual(GherkinTagFilter('@a || @b && @c').tree,
+                         OrNode(TagNode('@a'), AndNode(TagNode('@b'), TagNode('@c'))))
+
+    def test_nodes_compare_by_structure(self):
+        self.assertEqual(hash(parse_tag_expression('!@wip')), hash(NotNode(TagNode('@wip'))))
+        self.assertNotEqual(parse_tag_expression('@a and @b'), parse_tag_expression('@a or @b'))
+
+    def test_tag_names(self):
+        self.assertEqual(GherkinTagFilter('@a and not (@b or @a)').tag_names, {'@a', '@b'})
+
+    def test_node_must_implement_evaluation(self):
+        class IncompleteNode(TagExpressionNode):
+            def evaluate(self, tags):
+                return True
+
+        with self.assertRaises(TypeError):
+            IncompleteNode()
+
+    def test_invalid_syntax(self):
+        for expression in ['@a and', '@a not @b', 'not', '@a and or @b']:
+            with self.subTest(expression=expression), self.assertRaises(ValueError):
+                GherkinTagFilter(expression)
+
+
+class GherkinTagFilterPartialEvaluationTests(unittest.TestCase):
+
+    def test_decided_by_known_tags(self):
+        self.assertTrue(GherkinTagFilter('@a or @b').partial_evaluate(['@a']))
+        self.assertFalse(GherkinTagFilter('@a and not @b').partial_evaluate(['@b']))
+        self.assertTrue(GherkinTagFilter('').partial_evaluate([]))
+
+    def test_undecided(self):
+        self.assertIsNone(GherkinTagFilter('@a and @b').partial_evaluate(['@a']))
+        self.assertIsNone(GherkinTagFilter('not @a').partial_evaluate([]))
+        self.assertIsNone(GherkinTagFilter('@a or @b').partial_evaluate(['@c']))
+
+    def test_possible_tags(self):
+        filter = GherkinTagFilter('@a and (@b or not @c)')
+        self.assertFalse(filter.partial_evaluate([], possible_tags=['@b', '@c']))
+        self.assertTrue(filter.partial_evaluate(['@a'], possible_tags=['@b']))
+        self.assertIsNone(filter.partial_evaluate(['@a'], possible_tags=['@c']))
+
+    def test_agrees_with_evaluate(self):
+        tags = ['@a', '@b', '@c']
+        tag_sets = [{tag for bit, tag in enumerate(tags) if mask & (1 << bit)} for mask in range(8)]
+        for expression in ['@a and not @b', '@a or (@b and not @c)', 'not (@a or @c)', '@a and @b or @c']:
+            filter = GherkinTagFilter(expression)
+            for known in tag_sets:
+                with self.subTest(expression=expression, known=known):
+                    results = {filter.evaluate(tag_set) for tag_set in tag_sets if known <= tag_set}
+                    expected = results.pop() if len(results) == 1 else None
+                    self.assertEqual(filter.partial_evaluate(known, possible_tags=tags), expected)
+
 
 class GherkinTagFilterSubstitutionTests(unittest.TestCase):
     """These tests check that tags are correctly substituted into the tag expression"""
@@ -0,0 +1,105 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects import tag_matrix
+from gherkin_objects.objects import GherkinProject
+from gherkin_objects.tag_filter import GherkinTagFilter, TagFilterSet
+
+from .test_tag_matrix import FEATURE_TEXT
+
+
+class TagFilterSetTests(unittest.TestCase):
+
+    def test_shared_subexpressions(self):
+        filters = TagFilterSet(['@smoke and @api', '@api and @smoke and not @wip', '(@smoke && @api) || !@wip'])
+        # @smoke, @api, @smoke and @api, @wip, not @wip, and the two outer operators
+        self.assertEqual(filters.subexpression_count, 7)
+        self.assertEqual(len(filters), 3)
+
+    def test_evaluate(self):
+        expressions = ['@smoke and @api', '@api and not @wip', '@smoke or @wip', '']
+        filters = TagFilterSet(expressions)
+        for tags in [[], ['@smoke'], ['@smoke', '@api'], ['@api', '@wip'], ['@smoke', '@api', '@wip']]:
+            with self.subTest(tags=tags):
+                expected = {expression: GherkinTagFilter(expression).evaluate(tags) for expression in expressions}
+                self.assertEqual(filters.evaluate(tags), expected)
+
+    def test_named_expressions(self):
+        filters = TagFilterSet({'smoke-job': '@smoke', 'nightly-job': 'not @wip'})
+        self.assertEqual(filters.evaluate(['@smoke']), {'smoke-job': True, 'nightly-job': True})
+        self.assertEqual(filters.evaluate(('@wip', )), {'smoke-job': False, 'nightly-job': False})
+
+    def test_evaluate_remembers_results(self):
+        filters = TagFilterSet(['@smoke and not @wip', 'not @smoke'])
+        filters.MAX_CACHED_RESULTS = 2
+        for _ in range(2):
+            self.assertEqual(filters.evaluate(['@smoke']), {'@smoke and not @wip': True, 'not @smoke': False})
+            self.assertEqual(filters.evaluate(('@wip', '@smoke')), {'@smoke and not @wip': False, 'not @smoke': False})
+            self.assertEqual(filters.evaluate(iter(['@wip'])), {'@smoke and not @wip': False, 'not @smoke': True})
+
+
+class TagFilterSetProjectTests(unittest.TestCase):
+
+    expected = {
+        'smoke': ['one', 'three_1_1', 'three_2_2', 'three_3_3'],
+        'not wip': ['one', 'three_1_1', 'three_2_2', 'three_3_3'],
+        'slow or wip': ['two', 'three_3_3'],
+        'none': [],
+    }
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.temp_dir, 'feature.feature')
+        with open(path, 'w') as file:
+            file.write(FEATURE_TEXT)
+        self.project = GherkinProject([path])
+        self.filters = TagFilterSet({
+            'smoke': '@smoke',
+            'not wip': '!@wip',
+            'slow or wip': '@slow or @wip',
+            'none': '@missing',
+        })
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def check_matches(self, matches):
+        self.assertEqual({name: [scenario.name for scenario in scenarios] for name, scenarios in matches.items()},
+                         self.expected)
+        # Each matching example table is decomposed once, and its scenarios shared between the expressions
+        self.assertIs(matches['smoke'][-1], matches['slow or wip'][-1])
+
+    @unittest.skipUnless(tag_matrix.numpy is not None, 'NumPy is not installed')
+    def test_filter_project(self):
+        self.check_matches(self.filters.filter_project(self.project))
+
+    def test_filter_project_without_numpy(self):
+        with mock.patch.object(tag_matrix, 'numpy', None):
+            self.check_matches(self.filters.filter_project(self.project))
+
+    def test_filter_project_outlines(self):
+        matches = self.filters.filter_project(self.project, decomposed=False)
+        self.assertEqual([scenario.name for scenario in matches['slow or wip']], ['two', 'three'])
+
+
+if __name__ == '__main__':
+    unittest.main()
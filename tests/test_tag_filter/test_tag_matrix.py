@@ -0,0 +1,150 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects import tag_matrix
+from gherkin_objects.objects import GherkinProject
+from gherkin_objects.tag_filter import GherkinTagFilter
+from gherkin_objects.tag_matrix import TagMatrix, scenario_groups
+
+FEATURE_TEXT = '''@api
+Feature: feature
+Background:
+Given background
+
+@smoke
+Scenario: one
+Given step
+
+@wip
+Scenario: two
+Given step
+
+@smoke
+Scenario Outline: three
+Given <a>
+@fast
+Examples:
+| a |
+| 1 |
+| 2 |
+@slow
+Examples:
+| a |
+| 3 |
+'''
+
+
+class TagMatrixTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.temp_dir, 'feature.feature')
+        with open(path, 'w') as file:
+            file.write(FEATURE_TEXT)
+        self.project = GherkinProject([path])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def names(self, scenarios):
+        return [scenario.name for scenario in scenarios]
+
+
+class ScenarioGroupTests(TagMatrixTestCase):
+
+    def test_decomposed_groups(self):
+        groups = scenario_groups(self.project.features)
+        self.assertEqual([(group.scenario.name, group.count) for group in groups],
+                         [('one', 1), ('two', 1), ('three', 2), ('three', 1)])
+        self.assertEqual(groups[2].tags, {'@api', '@smoke', '@fast'})
+        self.assertEqual(self.names(groups[3].scenarios()), ['three_3_3'])
+
+    def test_outline_groups(self):
+        groups = scenario_groups(self.project.features, decomposed=False)
+        self.assertEqual([(group.scenario.name, group.count) for group in groups],
+                         [('one', 1), ('two', 1), ('three', 1), ('three', 1)])
+        self.assertEqual(groups[3].tags, {'@api', '@smoke', '@slow'})
+        self.assertEqual(self.names(groups[3].scenarios()), ['three'])
+
+
+class FilterProjectTests(TagMatrixTestCase):
+
+    def test_filter_project(self):
+        filter = GherkinTagFilter('@smoke and not @slow')
+        self.assertEqual(self.names(filter.filter_project(self.project)), ['one', 'three_1_1', 'three_2_2'])
+        # An outline matches if any of its example tables does
+        self.assertEqual(self.names(filter.filter_project(self.project, decomposed=False)), ['one', 'three'])
+        self.assertEqual(self.names(GherkinTagFilter('@slow').filter_project(self.project, decomposed=False)),
+                         ['three'])
+        self.assertEqual(self.names(GherkinTagFilter('@fast or @slow').filter_project(self.project, decomposed=False)),
+                         ['three'])
+
+    def test_filter_project_without_numpy(self):
+        filter = GherkinTagFilter('@smoke and not @slow')
+        with mock.patch.object(tag_matrix, 'numpy', None):
+            self.assertEqual(self.names(filter.filter_project(self.project)), ['one', 'three_1_1', 'three_2_2'])
+            self.assertEqual(self.names(filter.filter_project(self.project, decomposed=False)), ['one', 'three'])
+            with self.assertRaises(ImportError):
+                TagMatrix.from_project(self.project)
+
+
+@unittest.skipUnless(tag_matrix.numpy is not None, 'NumPy is not installed')
+class TagMatrixTests(TagMatrixTestCase):
+
+    def test_matrix(self):
+        matrix = TagMatrix.from_project(self.project)
+        self.assertEqual(len(matrix), 5)
+        self.assertEqual(matrix.tags, ['@api', '@fast', '@slow', '@smoke', '@wip'])
+        self.assertEqual(matrix.matrix.shape, (4, 5))
+
+    def test_evaluate(self):
+        matrix = TagMatrix.from_project(self.project)
+        self.assertEqual(matrix.evaluate('@smoke').tolist(), [True, False, True, True, True])
+        self.assertEqual(matrix.evaluate('@api and not (@wip or @fast)').tolist(), [True, False, False, False, True])
+        self.assertEqual(matrix.evaluate('@missing').tolist(), [False] * 5)
+        self.assertEqual(matrix.evaluate('').tolist(), [True] * 5)
+
+    def test_evaluate_outlines(self):
+        matrix = TagMatrix.from_project(self.project, decomposed=False)
+        self.assertEqual(len(matrix), 3)
+        self.assertEqual(matrix.evaluate('@fast').tolist(), [False, False, True])
+        self.assertEqual(matrix.evaluate('@smoke and not @slow').tolist(), [True, False, True])
+        self.assertEqual(matrix.evaluate('@fast and @slow').tolist(), [False, False, False])
+        self.assertEqual(self.names(matrix.select('@fast or @slow')), ['three'])
+
+    def test_select(self):
+        matrix = TagMatrix.from_project(self.project)
+        self.assertEqual(self.names(matrix.select('@slow or @wip')), ['two', 'three_3_3'])
+        self.assertEqual(self.names(matrix.select(GherkinTagFilter('@fast'))), ['three_1_1', 'three_2_2'])
+
+    def test_matches_python_evaluation(self):
+        matrix = TagMatrix.from_project(self.project)
+        groups = scenario_groups(self.project.features)
+        tag_sets = [group.tags for group in groups for _ in range(group.count)]
+        for expression in ['@api', '!@smoke', '@smoke && @fast || @wip', '!(@slow || @fast) && @api']:
+            filter = GherkinTagFilter(expression)
+            with self.subTest(expression=expression):
+                self.assertEqual(matrix.evaluate(filter).tolist(), [filter.evaluate(tags) for tags in tag_sets])
+
+
+if __name__ == '__main__':
+    unittest.main()
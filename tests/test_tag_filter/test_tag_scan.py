@@ -0,0 +1,106 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pickle
+import unittest
+
+from gherkin_objects.objects import Feature
+from gherkin_objects.tag_filter import GherkinTagFilter, scan_tags
+
+FEATURE_TEXT = '''# language: en
+@api @users
+  @owner:team-a
+Feature: feature
+
+  @smoke
+  Scenario: one
+    Given a step
+    """
+    @docstring
+    """
+
+  Scenario Outline: two
+    Given <a>
+    @fast
+    Examples:
+      | a |
+      | 1 |
+'''
+
+
+class ScanTagsTests(unittest.TestCase):
+
+    def test_scan_tags(self):
+        feature_tags, tags = scan_tags(FEATURE_TEXT)
+        self.assertEqual(feature_tags, {'@api', '@users', '@owner:team-a'})
+        self.assertTrue({'@api', '@users', '@owner:team-a', '@smoke', '@fast', '@docstring'} <= tags)
+
+    def test_finds_every_parsed_tag(self):
+        feature = Feature.from_text(FEATURE_TEXT)
+        parsed = {tag.text for tag in feature.tags}
+        for scenario in feature.scenarios:
+            parsed.update(tag.text for tag in scenario.tags)
+            parsed.update(tag.text for table in scenario.tables for tag in table.tags)
+        self.assertTrue(parsed <= scan_tags(FEATURE_TEXT)[1])
+
+    def test_ambiguous_tag_lines(self):
+        # Tags with spaces, or followed by comments, are split differently by different versions of the parser
+        feature_tags, tags = scan_tags('@a b @c #comment\nFeature: feature\n')
+        self.assertEqual(feature_tags, set())
+        self.assertTrue({'@a b', '@a', '@c #comment', '@c'} <= tags)
+
+    def test_without_tags(self):
+        self.assertEqual(scan_tags('Feature: feature\nScenario: one\nGiven step\n'), (frozenset(), frozenset()))
+
+    def test_scenario_tags_are_not_feature_tags(self):
+        feature_tags, tags = scan_tags('Feature: feature\n@wip\nScenario: one\n')
+        self.assertEqual(feature_tags, set())
+        self.assertEqual(tags, {'@wip'})
+
+
+class CouldMatchTextTests(unittest.TestCase):
+
+    def test_could_match_text(self):
+        self.assertTrue(GherkinTagFilter('@smoke').could_match_text(FEATURE_TEXT))
+        self.assertTrue(GherkinTagFilter('@fast and @api').could_match_text(FEATURE_TEXT))
+        self.assertFalse(GherkinTagFilter('@slow').could_match_text(FEATURE_TEXT))
+        self.assertFalse(GherkinTagFilter('not @api').could_match_text(FEATURE_TEXT))
+        self.assertTrue(GherkinTagFilter('').could_match_text(FEATURE_TEXT))
+
+    def test_conservative(self):
+        feature = Feature.from_text(FEATURE_TEXT)
+        scenario_tag_sets = []
+        for scenario in feature.scenarios:
+            tags = [tag.text for tag in scenario.all_tags]
+            if scenario.is_scenario_outline:
+                scenario_tag_sets.extend(tags + [tag.text for tag in table.tags] for table in scenario.tables)
+            else:
+                scenario_tag_sets.append(tags)
+        for expression in ['@smoke and not @fast', 'not @smoke', '@docstring', '@owner:team-a and not @users',
+                           '(@fast or @slow) and @api', 'not (@api and @users)']:
+            tag_filter = GherkinTagFilter(expression)
+            with self.subTest(expression=expression):
+                if any(tag_filter.evaluate(tags) for tags in scenario_tag_sets):
+                    self.assertTrue(tag_filter.could_match_text(FEATURE_TEXT))
+
+    def test_pickle(self):
+        tag_filter = pickle.loads(pickle.dumps(GherkinTagFilter('@a and not (@b or @c)')))
+        self.assertTrue(tag_filter.evaluate(['@a']))
+        self.assertFalse(tag_filter.evaluate(['@a', '@c']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Copyright 2022 SiriusXM-Pandora
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from gherkin_objects.objects import Feature, GherkinProject, GherkinProjectConfig
+from gherkin_objects.watch import _load_libc
+
+
+class PollingProjectWatcherTests(unittest.TestCase):
+
+    use_inotify = False
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.first_path = self.write('first.feature', 'Feature: first\nScenario: scenario\nGiven step')
+        self.second_path = self.write('second.feature', 'Feature: second\nScenario: scenario\nGiven step')
+        config = GherkinProjectConfig(path=os.path.join(self.temp_dir, 'config.json'), include=[self.temp_dir])
+        self.project = GherkinProject.from_config(config)
+        self.watcher = self.project.watch(debounce=0.05, poll_interval=0.01, use_inotify=self.use_inotify)
+
+    def tearDown(self) -> None:
+        self.watcher.close()
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def test_backend(self):
+        self.assertEqual(self.watcher.uses_inotify, self.use_inotify)
+
+    def test_nothing_changed(self):
+        self.assertIsNone(self.watcher.poll(timeout=0.1))
+
+    def test_modified_file_is_parsed_again(self):
+        first_feature = self.project.feature_files[0].feature
+        second_feature = self.project.feature_files[1].feature
+        self.write('second.feature', 'Feature: second, renamed\nScenario: scenario\nGiven step')
+
+        changes = self.watcher.poll(timeout=5)
+        self.assertEqual(changes.modified, [self.second_path])
+        self.assertEqual(changes.added, [])
+        self.assertIs(self.project.feature_files[0].feature, first_feature)
+        self.assertIsNot(self.project.feature_files[1].feature, second_feature)
+        self.assertEqual(self.project.feature_files[1].feature.name, 'second, renamed')
+
+    def test_burst_of_saves_is_one_change(self):
+        with mock.patch.object(Feature, 'from_text', wraps=Feature.from_text) as from_text:
+            for i in range(5):
+                self.write('first.feature', f'Feature: first {i}\nScenario: scenario\nGiven step')
+            changes = self.watcher.poll(timeout=5)
+            self.assertEqual(changes.modified, [self.first_path])
+            self.assertEqual(from_text.call_count, 1)
+        self.assertEqual(self.project.feature_files[0].feature.name, 'first 4')
+
+    def test_added_and_removed_files(self):
+        third_path = self.write('third.feature', 'Feature: third\nScenario: scenario\nGiven step')
+        changes = self.watcher.poll(timeout=5)
+        self.assertEqual(changes.added, [third_path])
+        self.assertIn(third_path, self.project.paths)
+
+        os.remove(self.first_path)
+        changes = self.watcher.poll(timeout=5)
+        self.assertEqual(changes.removed, [self.first_path])
+        self.assertEqual(self.project.paths, [self.second_path, third_path])
+
+    def test_invalid_gherkin_is_collected(self):
+        self.write('first.feature', 'Scenario: no feature')
+        changes = self.watcher.poll(timeout=5)
+        self.assertEqual(changes.modified, [])
+        self.assertEqual([path for path, _ in self.project.errors], [self.first_path])
+
+    def test_fixed_gherkin_clears_error(self):
+        for text in ('Scenario: no feature', 'Scenario: still no feature'):
+            self.write('first.feature', text)
+            self.assertEqual(self.watcher.poll(timeout=5).modified, [])
+            self.assertEqual([path for path, _ in self.project.errors], [self.first_path])
+
+        self.write('first.feature', 'Feature: first, fixed\nScenario: scenario\nGiven step')
+        changes = self.watcher.poll(timeout=5)
+        self.assertEqual(changes.modified, [self.first_path])
+        self.assertEqual(self.project.errors, [])
+        self.assertEqual(self.project.feature_files[0].feature.name, 'first, fixed')
+
+
+@unittest.skipUnless(_load_libc() is not None, 'inotify is not available')
+class InotifyProjectWatcherTests(PollingProjectWatcherTests):
+
+    use_inotify = True
+
+
+if __name__ == '__main__':
+    unittest.main()